@@ -0,0 +1,203 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: CPU Opponent
+# NEW ADDITION - Predictive paddle controller for single-player mode
+# =============================================================================
+#
+# A "follow the ball" bot chases ball.ycor() every tick, so it is always
+# late and wobbles behind a ball bouncing off the walls. PredictiveAI
+# instead works out where the ball will be when it reaches the paddle,
+# folding the wall bounces in closed form, and then just walks the paddle
+# to that spot.
+#
+# The ball moves on a lattice: every tick adds exactly (x_move, y_move),
+# and bounce_y() only flips y_move once the ball is already past
+# WALL_BOUNDARY. So between walls the ball runs a triangle wave between the
+# first lattice point beyond +WALL_BOUNDARY and the first one beyond
+# -WALL_BOUNDARY, and its y at any future tick is that wave evaluated in
+# O(1) - no simulation loop.
+#
+# Wall bounces don't change the folded prediction, only bounce_x() and
+# reset_position() do, and both flip the sign of x_move. The controller
+# therefore recomputes when that sign changes and otherwise costs one
+# comparison per tick. Difficulty comes from reaction delay and aiming
+# noise, never from extra computation.
+# =============================================================================
+
+import random
+
+import game_state as gs
+
+# =============================================================================
+# AI CONSTANTS
+# =============================================================================
+LEFT = "left"
+RIGHT = "right"
+CENTER_Y = 0  # Where the paddle waits while the ball moves away
+DEAD_ZONE = gs.PADDLE_SPEED / 2  # Close enough - stops the paddle jittering
+
+# Difficulty: (reaction delay in ticks, aiming noise std-dev in pixels)
+DIFFICULTIES = {
+    "easy": (14, 42),
+    "medium": (8, 32),
+    "hard": (3, 22),
+    "perfect": (0, 0),
+}
+DEFAULT_DIFFICULTY = "medium"
+
+
+def fold_y(y, y_move, ticks, wall=gs.WALL_BOUNDARY):
+    """
+    Ball y after `ticks` more ticks, including every wall bounce
+
+    Args:
+        y (float): Current ball y
+        y_move (float): Current y_move
+        ticks (int): Ticks to look ahead
+        wall (float): WALL_BOUNDARY used by check_wall_collision()
+    Returns: Predicted ball y
+    """
+    step = abs(y_move)
+    if not step:
+        return y
+    # First lattice points strictly beyond each wall: the turning points
+    top = y + ((wall - y) // step + 1) * step
+    bottom = y - ((wall + y) // step + 1) * step
+    span = top - bottom
+    offset = (y + y_move * ticks - bottom) % (2 * span)
+    return bottom + (offset if offset <= span else 2 * span - offset)
+
+
+def ticks_to_plane(x, x_move, side):
+    """
+    Ticks until the ball enters a paddle's collision band
+    Args:
+        x (float): Current ball x
+        x_move (float): Current x_move
+        side (str): LEFT or RIGHT
+    Returns: Tick count (0 if already inside), or None if moving away
+    """
+    if side == RIGHT:
+        if x_move <= 0:
+            return None
+        if x > gs.RIGHT_PADDLE_X_BOUNDARY:
+            return 0
+        return int((gs.RIGHT_PADDLE_X_BOUNDARY - x) // x_move) + 1
+    if x_move >= 0:
+        return None
+    if x < gs.LEFT_PADDLE_X_BOUNDARY:
+        return 0
+    return int((x - gs.LEFT_PADDLE_X_BOUNDARY) // -x_move) + 1
+
+
+class PredictiveAI:
+    """
+    Paddle controller that aims at the ball's predicted crossing point
+
+    Call one of the move_for_* methods once per tick; each returns a paddle
+    direction (MOVE_UP, MOVE_DOWN or MOVE_NONE) in the same format as
+    HeldKeys.sample() and game_state.step().
+    """
+
+    def __init__(self, side, difficulty=DEFAULT_DIFFICULTY, seed=None):
+        """
+        Args:
+            side (str): LEFT or RIGHT paddle
+            difficulty (str): Key of DIFFICULTIES
+            seed (int | None): Seed for the aiming noise
+        """
+        self.side = side
+        self.reaction_ticks, self.noise = DIFFICULTIES[difficulty]
+        self.random = random.Random(seed)
+
+        # Cached plan - only replaced when x_move changes sign
+        self.direction = 0
+        self.target = CENTER_Y
+        self.next_target = CENTER_Y
+        self.delay = 0
+        self.predictions = 0
+
+    def _plan(self, x, y, x_move, y_move):
+        """
+        Recompute the target after bounce_x() / reset_position()
+        """
+        self.direction = 1 if x_move > 0 else -1
+        self.predictions += 1
+        ticks = ticks_to_plane(x, x_move, self.side)
+        if ticks is None:
+            self.next_target = CENTER_Y
+        else:
+            target = fold_y(y, y_move, ticks)
+            if self.noise:
+                target += self.random.gauss(0, self.noise)
+            self.next_target = target
+        self.delay = self.reaction_ticks
+
+    def reset(self):
+        """
+        Forget the cached plan so the next move_for_* call replans
+        (needed when the ball jumps, e.g. after a rewind)
+        """
+        self.direction = 0
+
+    def _move_towards(self, paddle_y):
+        """
+        Per-tick decision from the cached plan
+        """
+        if self.delay:
+            self.delay -= 1
+            if not self.delay:
+                self.target = self.next_target
+        else:
+            self.target = self.next_target
+        gap = self.target - paddle_y
+        if gap > DEAD_ZONE:
+            return gs.MOVE_UP
+        if gap < -DEAD_ZONE:
+            return gs.MOVE_DOWN
+        return gs.MOVE_NONE
+
+    def move_for_state(self, state):
+        """
+        Decide this tick's move for a headless GameState
+        Args:
+            state (GameState): Match state before step() is called
+        Returns: Paddle direction
+        """
+        if (state.x_move > 0) != (self.direction > 0) or not self.direction:
+            self._plan(state.x, state.y, state.x_move, state.y_move)
+        return self._move_towards(state.l_y if self.side == LEFT else state.r_y)
+
+    def move_for_ball(self, ball, paddle):
+        """
+        Decide this tick's move for the Turtle objects in main()
+        Ball position is only read when the trajectory changed
+        Args:
+            ball: Ball object
+            paddle: Paddle this AI controls
+        Returns: Paddle direction
+        """
+        if (ball.x_move > 0) != (self.direction > 0) or not self.direction:
+            self._plan(ball.xcor(), ball.ycor(), ball.x_move, ball.y_move)
+        return self._move_towards(paddle.ycor())
+
+
+def bot_match_states(count, difficulty="medium", seed=0):
+    """
+    Match states of two PredictiveAI paddles playing each other, for
+    renderers and benchmarks that need realistic frames to draw
+    Args:
+        count (int): States to return (new matches start as needed)
+        difficulty (str): Key of DIFFICULTIES for both paddles
+        seed (int): Seed for the paddles' noise
+    Returns: List of GameState copies, one per tick
+    """
+    states = []
+    rng = random.Random(seed)
+    while len(states) < count:
+        state = gs.GameState()
+        left = PredictiveAI(LEFT, difficulty, rng.randrange(2 ** 32))
+        right = PredictiveAI(RIGHT, difficulty, rng.randrange(2 ** 32))
+        while not state.game_over and len(states) < count:
+            gs.step(state, (left.move_for_state(state), right.move_for_state(state)))
+            states.append(state.copy())
+    return states
@@ -81,6 +81,20 @@ class Ball(Turtle):
         self.move_speed = INITIAL_MOVE_SPEED
         self.bounce_x()  # Change direction for next serve
 
+    def draw_state(self, state):
+        """
+        ADDED: Show a headless GameState (see game_state.py)
+        Copies the ball attributes and only moves the turtle if needed
+
+        Args:
+            state (GameState): Simulation state to display
+        """
+        self.x_move = state.x_move
+        self.y_move = state.y_move
+        self.move_speed = state.move_speed
+        if self.xcor() != state.x or self.ycor() != state.y:
+            self.goto(state.x, state.y)
+
 # =============================================================================
 # CHANGES MADE TO ORIGINAL ANGELA YU CODE:
 #
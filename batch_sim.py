@@ -0,0 +1,351 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Batch Match Simulator
+# NEW ADDITION - Simulates thousands of matches at once with NumPy arrays
+# =============================================================================
+#
+# Every match in the batch is one slot in a set of struct-of-arrays NumPy
+# buffers (ball x/y, velocity, speed, paddle y's, scores, hit counters).
+# Each tick applies the same rules as game_state.step() to all running
+# matches with masked array operations. Finished matches are retired by
+# swapping the last running slot into their place, so the buffers are
+# allocated once and only the running prefix is ever touched.
+#
+# Usage:
+#     python batch_sim.py --matches 100000 --speed-factor 0.85
+# =============================================================================
+
+import argparse
+import time
+
+import numpy as np
+
+import game_state as gs
+
+# =============================================================================
+# BATCH CONSTANTS
+# =============================================================================
+DEFAULT_MATCHES = 10_000
+DEFAULT_MAX_TICKS = 20_000  # Matches still running after this are unfinished
+DEFAULT_SKILL = 0.5  # Chance per tick that a bot paddle tracks the ball
+
+# Winner codes stored in BatchResult.winner
+NO_WINNER = 0
+LEFT_WINNER = 1
+RIGHT_WINNER = 2
+
+
+class BatchResult:
+    """
+    Per-match results of a batch run, one array entry per match
+
+    Attributes:
+        winner:   NO_WINNER, LEFT_WINNER or RIGHT_WINNER
+        ticks:    Loop iterations until the match ended
+        seconds:  Game time main() would have spent sleeping (sum of move_speed)
+        l_score, r_score: Final scores
+        l_hits, r_hits:   Paddle hits by each player
+    """
+
+    __slots__ = ("winner", "ticks", "seconds", "l_score", "r_score", "l_hits", "r_hits")
+
+    def __init__(self, matches):
+        self.winner = np.zeros(matches, dtype=np.int8)
+        self.ticks = np.zeros(matches, dtype=np.int64)
+        self.seconds = np.zeros(matches, dtype=np.float64)
+        self.l_score = np.zeros(matches, dtype=np.int16)
+        self.r_score = np.zeros(matches, dtype=np.int16)
+        self.l_hits = np.zeros(matches, dtype=np.int32)
+        self.r_hits = np.zeros(matches, dtype=np.int32)
+
+    def summary(self):
+        """
+        Aggregate the per-match arrays into a few headline numbers
+        Returns: Dictionary of summary statistics
+        """
+        finished = self.winner != NO_WINNER
+        points = (self.l_score + self.r_score).astype(np.float64)
+        hits = (self.l_hits + self.r_hits).astype(np.float64)
+        return {
+            "matches": int(self.winner.size),
+            "finished": int(finished.sum()),
+            "left_win_rate": float((self.winner == LEFT_WINNER).mean()),
+            "right_win_rate": float((self.winner == RIGHT_WINNER).mean()),
+            "mean_ticks": float(self.ticks.mean()),
+            "mean_seconds": float(self.seconds.mean()),
+            "mean_hits_per_point": float((hits / np.maximum(points, 1)).mean()),
+        }
+
+
+class BatchSimulator:
+    """
+    Runs N independent matches side by side as struct-of-arrays buffers
+
+    Paddles are driven by a simple vectorized bot: each tick a paddle moves
+    toward the ball with probability `skill`, otherwise it makes a random
+    move. A skill of None keeps that paddle still (like nobody pressing keys).
+    """
+
+    def __init__(self, matches=DEFAULT_MATCHES,
+                 speed_increase_factor=gs.SPEED_INCREASE_FACTOR,
+                 initial_move_distance=gs.INITIAL_MOVE_DISTANCE,
+                 paddle_speed=gs.PADDLE_SPEED,
+                 winning_score=gs.WINNING_SCORE,
+                 left_skill=DEFAULT_SKILL, right_skill=DEFAULT_SKILL,
+                 seed=None):
+        """
+        Allocate every buffer once for the whole batch
+
+        Args:
+            matches (int): Number of matches to simulate
+            speed_increase_factor (float): Ball.bounce_x() speed multiplier
+            initial_move_distance (float): Ball.x_move / y_move at the serve
+            paddle_speed (float): Pixels a paddle moves per input
+            winning_score (int): Points needed to win a match
+            left_skill, right_skill (float | None): Bot tracking probability
+            seed (int | None): Seed for the bots' random moves
+        """
+        self.matches = matches
+        self.speed_increase_factor = speed_increase_factor
+        self.initial_move_distance = initial_move_distance
+        self.paddle_speed = paddle_speed
+        self.winning_score = winning_score
+        self.left_skill = left_skill
+        self.right_skill = right_skill
+        self.rng = np.random.default_rng(seed)
+
+        # Struct-of-arrays match state (slot i holds match match_id[i]).
+        # Positions are float32 for cache density when every move is a whole
+        # number of pixels - sums of those stay exact in float32. Fractional
+        # moves (e.g. a param_sweep config) would round differently from
+        # game_state's float64, so they get float64 positions instead.
+        # move_speed is always float64.
+        whole = all(float(move).is_integer() for move in (initial_move_distance, paddle_speed))
+        position = np.float32 if whole else np.float64
+        self.x = np.zeros(matches, dtype=position)
+        self.y = np.zeros(matches, dtype=position)
+        self.x_move = np.full(matches, initial_move_distance, dtype=position)
+        self.y_move = np.full(matches, initial_move_distance, dtype=position)
+        self.move_speed = np.full(matches, gs.INITIAL_MOVE_SPEED, dtype=np.float64)
+        self.l_y = np.zeros(matches, dtype=position)
+        self.r_y = np.zeros(matches, dtype=position)
+        self.l_score = np.zeros(matches, dtype=np.int16)
+        self.r_score = np.zeros(matches, dtype=np.int16)
+        self.l_hits = np.zeros(matches, dtype=np.int32)
+        self.r_hits = np.zeros(matches, dtype=np.int32)
+        self.seconds = np.zeros(matches, dtype=np.float64)
+        self.match_id = np.arange(matches, dtype=np.int64)
+
+        # Scratch masks reused every tick
+        self._mask_a = np.zeros(matches, dtype=bool)
+        self._mask_b = np.zeros(matches, dtype=bool)
+        self._mask_c = np.zeros(matches, dtype=bool)
+        self._track = np.zeros(matches, dtype=bool)
+        self._draw = np.zeros(matches, dtype=position)
+        self._moves = np.zeros(matches, dtype=position)
+
+        self.active = matches
+        self.tick = 0
+        self.result = BatchResult(matches)
+
+    def _bot_moves(self, paddle_y, skill, n):
+        """
+        Vectorized paddle bot
+        Args:
+            paddle_y: View of the paddle positions for running matches
+            skill (float | None): Probability of tracking the ball this tick
+            n (int): Number of running matches
+        Returns: Array of directions (-1, 0 or 1) or None for idle paddles
+        """
+        if skill is None:
+            return None
+        # One uniform draw per match decides both "track?" and the random move
+        draw, moves, track = self._draw[:n], self._moves[:n], self._track[:n]
+        self.rng.random(dtype=draw.dtype, out=draw)
+        np.less(draw, skill, out=track)
+        if skill < 1:
+            np.subtract(draw, skill, out=draw)
+            np.multiply(draw, 3 / (1 - skill), out=draw)
+            np.floor(draw, out=moves)
+            moves -= 1
+        np.subtract(self.y[:n], paddle_y, out=draw)
+        np.sign(draw, out=moves, where=track)
+        return moves
+
+    def _move_paddle(self, paddle_y, moves):
+        """
+        Paddle.go_up() / go_down() with boundary checking, for every match
+        Args:
+            paddle_y: View of the paddle positions for running matches
+            moves: Array of directions from _bot_moves()
+        """
+        if moves is None:
+            return
+        n = paddle_y.size
+        new_y, inside = self._draw[:n], self._track[:n]
+        np.multiply(moves, self.paddle_speed, out=new_y)
+        new_y += paddle_y
+        np.less_equal(np.abs(new_y), gs.SCREEN_TOP_BOUNDARY, out=inside)
+        np.copyto(paddle_y, new_y, where=inside)
+
+    def _reset_ball(self, mask, n):
+        """
+        Ball.reset_position() for every match selected by mask
+        Args:
+            mask: Boolean array over the running matches
+            n (int): Number of running matches
+        """
+        if not mask.any():
+            return
+        np.copyto(self.x[:n], 0, where=mask)
+        np.copyto(self.y[:n], 0, where=mask)
+        np.negative(self.x_move[:n], out=self.x_move[:n], where=mask)
+        np.copyto(self.move_speed[:n], gs.INITIAL_MOVE_SPEED * self.speed_increase_factor,
+                  where=mask)
+
+    def step(self):
+        """
+        Advance every running match by one tick (same order as game_state.step)
+        Returns: Number of matches still running afterwards
+        """
+        n = self.active
+        if n == 0:
+            return 0
+        x, y = self.x[:n], self.y[:n]
+        x_move, y_move = self.x_move[:n], self.y_move[:n]
+        l_y, r_y = self.l_y[:n], self.r_y[:n]
+        wall, hit, miss = self._mask_a[:n], self._mask_b[:n], self._mask_c[:n]
+
+        # main() sleeps move_speed before every tick
+        self.seconds[:n] += self.move_speed[:n]
+
+        # Paddle input, then ball.move()
+        self._move_paddle(l_y, self._bot_moves(l_y, self.left_skill, n))
+        self._move_paddle(r_y, self._bot_moves(r_y, self.right_skill, n))
+        x += x_move
+        y += y_move
+        self.tick += 1
+
+        # check_wall_collision() -> bounce_y()
+        np.greater(np.abs(y), gs.WALL_BOUNDARY, out=wall)
+        np.negative(y_move, out=y_move, where=wall)
+
+        # check_paddle_collision() -> bounce_x() (right paddle first)
+        band = gs.PADDLE_BAND_DEPTH
+        half = gs.PADDLE_HALF_HEIGHT
+        np.logical_and(x > gs.RIGHT_PADDLE_X_BOUNDARY, x < gs.RIGHT_PADDLE_X_BOUNDARY + band, out=hit)
+        hit &= (y < r_y + half) & (y > r_y - half)
+        self.r_hits[:n] += hit
+        # Left paddle hits go in `miss` for now - that mask is free until scoring
+        np.logical_and(x < gs.LEFT_PADDLE_X_BOUNDARY, x > gs.LEFT_PADDLE_X_BOUNDARY - band, out=miss)
+        miss &= (y < l_y + half) & (y > l_y - half)
+        self.l_hits[:n] += miss
+        hit |= miss
+        np.negative(x_move, out=x_move, where=hit)
+        np.multiply(self.move_speed[:n], self.speed_increase_factor,
+                    out=self.move_speed[:n], where=hit)
+
+        # Right paddle misses - left player scores
+        np.greater(x, gs.RIGHT_BOUNDARY, out=miss)
+        self._reset_ball(miss, n)
+        self.l_score[:n] += miss
+
+        # Left paddle misses - right player scores
+        np.less(x, gs.LEFT_BOUNDARY, out=miss)
+        self._reset_ball(miss, n)
+        self.r_score[:n] += miss
+
+        # Win detection
+        np.logical_or(self.l_score[:n] >= self.winning_score,
+                      self.r_score[:n] >= self.winning_score, out=wall)
+        if wall.any():
+            self._retire(np.flatnonzero(wall))
+        return self.active
+
+    def _retire(self, slots):
+        """
+        Record results for finished slots and swap the last running matches in
+        Args:
+            slots: Sorted array of slot indices whose matches just finished
+        """
+        self._record(slots)
+        fields = (self.x, self.y, self.x_move, self.y_move, self.move_speed,
+                  self.l_y, self.r_y, self.l_score, self.r_score,
+                  self.l_hits, self.r_hits, self.seconds, self.match_id)
+        # Walk from the highest slot down so a moved match is never a retired one
+        for slot in slots[::-1]:
+            last = self.active - 1
+            if slot != last:
+                for field in fields:
+                    field[slot] = field[last]
+            self.active = last
+
+    def _record(self, slots, finished=True):
+        """
+        Copy final state of the given slots into the result arrays
+        Args:
+            slots: Slot indices to record
+            finished (bool): False when the match hit max_ticks unfinished
+        """
+        ids = self.match_id[slots]
+        result = self.result
+        l_score, r_score = self.l_score[slots], self.r_score[slots]
+        if finished:
+            result.winner[ids] = np.where(l_score >= self.winning_score, LEFT_WINNER, RIGHT_WINNER)
+        result.ticks[ids] = self.tick
+        result.seconds[ids] = self.seconds[slots]
+        result.l_score[ids] = l_score
+        result.r_score[ids] = r_score
+        result.l_hits[ids] = self.l_hits[slots]
+        result.r_hits[ids] = self.r_hits[slots]
+
+    def run(self, max_ticks=DEFAULT_MAX_TICKS):
+        """
+        Step until every match has finished or max_ticks is reached
+        Args:
+            max_ticks (int): Matches still running afterwards are recorded unfinished
+        Returns: BatchResult with one entry per match
+        """
+        while self.active and self.tick < max_ticks:
+            self.step()
+        if self.active:
+            self._record(np.arange(self.active), finished=False)
+        return self.result
+
+
+def parse_skill(text):
+    """
+    argparse helper: "none" disables a bot, anything else is a probability
+    """
+    return None if text.lower() == "none" else float(text)
+
+
+def main():
+    """
+    Command line entry point: run one batch and print the summary
+    """
+    parser = argparse.ArgumentParser(description="Monte Carlo batch of headless Pong matches")
+    parser.add_argument("--matches", type=int, default=DEFAULT_MATCHES)
+    parser.add_argument("--max-ticks", type=int, default=DEFAULT_MAX_TICKS)
+    parser.add_argument("--speed-factor", type=float, default=gs.SPEED_INCREASE_FACTOR)
+    parser.add_argument("--move-distance", type=float, default=gs.INITIAL_MOVE_DISTANCE)
+    parser.add_argument("--paddle-speed", type=float, default=gs.PADDLE_SPEED)
+    parser.add_argument("--left-skill", type=parse_skill, default=DEFAULT_SKILL)
+    parser.add_argument("--right-skill", type=parse_skill, default=DEFAULT_SKILL)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    simulator = BatchSimulator(args.matches, args.speed_factor, args.move_distance,
+                               args.paddle_speed, left_skill=args.left_skill,
+                               right_skill=args.right_skill, seed=args.seed)
+    start = time.perf_counter()
+    result = simulator.run(args.max_ticks)
+    elapsed = time.perf_counter() - start
+
+    for key, value in result.summary().items():
+        print(f"{key:>22}: {value:.4f}" if isinstance(value, float) else f"{key:>22}: {value}")
+    print(f"{'elapsed_seconds':>22}: {elapsed:.2f}")
+    print(f"{'match_ticks_per_second':>22}: {result.ticks.sum() / elapsed:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,362 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Benchmark Suite
+# NEW ADDITION - Measures the game loop, collision checks and headless engines
+# =============================================================================
+#
+# Runs without a display: the Turtle classes and main() are driven through
+# fake_turtle.HeadlessScreen, which keeps turtle's own drawing code but
+# replaces the Tk canvas. Results are written as JSON so a later run can be
+# compared against a saved baseline to catch regressions.
+#
+# Usage:
+#     python benchmark.py                          # print results as JSON
+#     python benchmark.py --save baseline.json     # keep a baseline
+#     python benchmark.py --compare baseline.json  # exit 1 on regressions
+#     python benchmark.py --quick                  # fewer iterations
+# =============================================================================
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+# =============================================================================
+# BENCHMARK CONSTANTS
+# =============================================================================
+REPEATS = 5  # Best-of repeats for microbenchmarks
+MICRO_LOOPS = 20_000
+LOOP_MATCHES = 3  # Full main() matches per frame-time run
+BACKEND_FRAMES = 5000  # Frames drawn per rendering backend
+BOT_SKILL = 0.6  # Chance per frame that the benchmark bot chases the ball
+BOT_SEED = 22
+HEADLESS_SECONDS = 1.0  # Minimum run time for each ticks/sec measurement
+REGRESSION_THRESHOLD = 0.10  # 10% worse than the baseline counts as a regression
+
+
+def _metric(value, unit, better):
+    """
+    Package one measurement for the JSON report
+    Args:
+        value (float): Measured value
+        unit (str): Unit label
+        better (str): "lower" or "higher" - which direction is an improvement
+    """
+    return {"value": value, "unit": unit, "better": better}
+
+
+def _percentile(ordered, fraction):
+    """
+    Nearest-rank percentile of an already sorted list
+    """
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def time_per_call(func, loops, repeats=REPEATS):
+    """
+    Best-of-N time for one call of func
+    Args:
+        func: Zero-argument callable to time
+        loops (int): Calls per repeat
+        repeats (int): Number of repeats
+    Returns: Seconds per call (fastest repeat)
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        best = min(best, (time.perf_counter() - start) / loops)
+    return best
+
+
+def bench_micro(screen, loops):
+    """
+    Microbenchmarks of the per-tick calls in main()'s loop
+    Args:
+        screen: HeadlessScreen already installed
+        loops (int): Calls per repeat
+    Returns: Dictionary of metrics
+    """
+    import main
+
+    r_paddle, l_paddle, ball, scoreboard, center_line = main.setup_game_objects()
+    results = {
+        "check_wall_collision_us": time_per_call(lambda: main.check_wall_collision(ball), loops),
+        "check_paddle_collision_us": time_per_call(
+            lambda: main.check_paddle_collision(ball, r_paddle, l_paddle), loops),
+    }
+
+    def move_and_bounce():
+        # Keep the ball on the court so turtle works with realistic coordinates
+        ball.move()
+        if abs(ball.xcor()) > 300:
+            ball.goto(0, 0)
+
+    results["ball_move_us"] = time_per_call(move_and_bounce, loops)
+    results["paddle_go_up_us"] = time_per_call(
+        lambda: (r_paddle.go_up(), r_paddle.go_down()), loops // 2) / 2
+    results["scoreboard_update_us"] = time_per_call(scoreboard.update_scoreboard, loops // 20)
+    results["screen_update_us"] = time_per_call(screen.update, loops // 10)
+    return {name: _metric(seconds * 1e6, "us", "lower") for name, seconds in results.items()}
+
+
+def bench_main_loop(matches):
+    """
+    Frame-time distribution of the real main() loop
+
+    time.sleep is replaced so the run measures the work per frame; the
+    paced frame time adds back the move_speed main() would have slept.
+    Both paddles are driven by a seeded bot pressing the bound keys so
+    rallies (and the shrinking move_speed) look like real play.
+
+    Args:
+        matches (int): Matches to play
+    Returns: Dictionary of metrics
+    """
+    import fake_turtle
+    import main
+
+    work, paced = [], []
+    bot = random.Random(BOT_SEED)
+    for _ in range(matches):
+        screen = fake_turtle.install()
+        objects = {}
+        original_setup = main.setup_game_objects
+
+        def setup_game_objects():
+            objects["all"] = original_setup()
+            return objects["all"]
+
+        last = [None]
+        sleeps = [0.0]
+
+        def on_update():
+            now = time.perf_counter()
+            if last[0] is not None:
+                work.append(now - last[0])
+                paced.append(now - last[0] + sleeps[0])
+            last[0] = now
+            r_paddle, l_paddle, ball, _, _ = objects["all"]
+            for paddle, up, down in ((r_paddle, main.RIGHT_PADDLE_UP, main.RIGHT_PADDLE_DOWN),
+                                     (l_paddle, main.LEFT_PADDLE_UP, main.LEFT_PADDLE_DOWN)):
+                if bot.random() > BOT_SKILL:
+                    continue
+                if ball.ycor() > paddle.ycor() + 10:
+                    screen.release(up)
+                elif ball.ycor() < paddle.ycor() - 10:
+                    screen.release(down)
+
+        screen.on_update = on_update
+        main.setup_game_objects = setup_game_objects
+        real_sleep = main.time.sleep
+        main.time.sleep = lambda seconds: sleeps.__setitem__(0, seconds)
+        try:
+            _run_with_tick_limit(main.main, screen, limit=20_000)
+        finally:
+            main.time.sleep = real_sleep
+            main.setup_game_objects = original_setup
+
+    work.sort()
+    paced.sort()
+    mean_paced = sum(paced) / len(paced)
+    return {
+        "main_loop_frames": _metric(len(work), "frames", "higher"),
+        "main_loop_work_p50_ms": _metric(_percentile(work, 0.50) * 1e3, "ms", "lower"),
+        "main_loop_work_p95_ms": _metric(_percentile(work, 0.95) * 1e3, "ms", "lower"),
+        "main_loop_work_p99_ms": _metric(_percentile(work, 0.99) * 1e3, "ms", "lower"),
+        "main_loop_paced_p50_ms": _metric(_percentile(paced, 0.50) * 1e3, "ms", "lower"),
+        "main_loop_paced_fps": _metric(1 / mean_paced, "fps", "higher"),
+    }
+
+
+def bench_backends(frames):
+    """
+    Per-frame drawing cost of the turtle classes and the canvas backend
+    (both on fake_turtle's FakeCanvas, so this is the Python-side cost)
+
+    Args:
+        frames (int): Frames drawn on each backend
+    Returns: Dictionary of metrics
+    """
+    from canvas_backend import compare_backends, BACKENDS
+
+    times = compare_backends(frames, headless=True)
+    metrics = {}
+    for backend in BACKENDS:
+        ordered = times[backend]
+        metrics[f"render_{backend}_p50_us"] = _metric(_percentile(ordered, 0.50) * 1e6, "us", "lower")
+        metrics[f"render_{backend}_p99_us"] = _metric(_percentile(ordered, 0.99) * 1e6, "us", "lower")
+    return metrics
+
+
+class _TickLimit(Exception):
+    """Stops a main() run that would otherwise rally forever"""
+
+
+def _run_with_tick_limit(func, screen, limit):
+    """
+    Run func() but abort it after `limit` screen updates
+    """
+    hook = screen.on_update
+    count = [0]
+
+    def limited():
+        count[0] += 1
+        if count[0] > limit:
+            raise _TickLimit
+        if hook is not None:
+            hook()
+
+    screen.on_update = limited
+    try:
+        func()
+    except _TickLimit:
+        pass
+
+
+def _ticks_per_second(run_once):
+    """
+    Repeat run_once() (which returns ticks simulated) for HEADLESS_SECONDS
+    Returns: Ticks simulated per second
+    """
+    ticks = 0
+    start = time.perf_counter()
+    while True:
+        ticks += run_once()
+        elapsed = time.perf_counter() - start
+        if elapsed >= HEADLESS_SECONDS:
+            return ticks / elapsed
+
+
+def bench_headless():
+    """
+    Ticks/sec for every headless engine in the repo
+    Returns: Dictionary of metrics
+    """
+    import event_engine
+    import game_loop
+    import game_state as gs
+
+    def step_match():
+        return gs.run(gs.GameState())
+
+    def event_match():
+        return event_engine.run(gs.GameState())
+
+    def fixed_timestep_match():
+        loop = game_loop.FixedTimestepLoop()
+        while not loop.state.game_over:
+            loop.advance(game_loop.FRAME_INTERVAL)
+        return loop.state.tick
+
+    results = {
+        "step_ticks_per_sec": _ticks_per_second(step_match),
+        "event_engine_ticks_per_sec": _ticks_per_second(event_match),
+        "fixed_timestep_ticks_per_sec": _ticks_per_second(fixed_timestep_match),
+    }
+    try:
+        import batch_sim
+    except ImportError:  # NumPy is optional
+        pass
+    else:
+        def batch_run():
+            result = batch_sim.BatchSimulator(2_000, seed=1).run()
+            return int(result.ticks.sum())
+        results["batch_sim_match_ticks_per_sec"] = _ticks_per_second(batch_run)
+    metrics = {name: _metric(value, "ticks/s", "higher") for name, value in results.items()}
+    if "batch_sim" in sys.modules:
+        import rasterizer
+        from ai_player import bot_match_states
+
+        frames = rasterizer.Rasterizer()
+        states = bot_match_states(1000)
+
+        def raster_run():
+            for state in states:
+                frames.render(state)
+            return len(states)
+        metrics["rasterizer_frames_per_sec"] = _metric(_ticks_per_second(raster_run), "frames/s", "higher")
+    return metrics
+
+
+def run_all(quick=False, headless=False):
+    """
+    Run every benchmark group
+    Args:
+        quick (bool): Use fewer iterations
+        headless (bool): Only the headless engines - turtle is never imported
+    Returns: JSON-ready report dictionary
+    """
+    metrics = {}
+    if not headless:
+        import fake_turtle
+
+        loops = MICRO_LOOPS // 10 if quick else MICRO_LOOPS
+        screen = fake_turtle.install()
+        metrics.update(bench_micro(screen, loops))
+        metrics.update(bench_main_loop(1 if quick else LOOP_MATCHES))
+        metrics.update(bench_backends(BACKEND_FRAMES // 5 if quick else BACKEND_FRAMES))
+    metrics.update(bench_headless())
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "metrics": metrics,
+    }
+
+
+def compare(report, baseline, threshold=REGRESSION_THRESHOLD):
+    """
+    Compare a report with a saved baseline
+    Args:
+        report (dict): Fresh run_all() output
+        baseline (dict): Previously saved run_all() output
+        threshold (float): Relative change that counts as a regression
+    Returns: List of (name, baseline value, new value, relative change, regressed)
+    """
+    rows = []
+    for name, new in report["metrics"].items():
+        old = baseline["metrics"].get(name)
+        if old is None or not old["value"]:
+            continue
+        change = (new["value"] - old["value"]) / old["value"]
+        worse = change if new["better"] == "lower" else -change
+        rows.append((name, old["value"], new["value"], change, worse > threshold))
+    return rows
+
+
+def main(argv=None):
+    """
+    Command line entry point
+    """
+    parser = argparse.ArgumentParser(description="Pong benchmark suite")
+    parser.add_argument("--save", metavar="FILE", help="write the JSON report to FILE")
+    parser.add_argument("--compare", metavar="FILE", help="compare against a saved report")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    parser.add_argument("--quick", action="store_true", help="fewer iterations")
+    parser.add_argument("--headless", action="store_true",
+                        help="only the headless engines (no turtle import)")
+    args = parser.parse_args(argv)
+
+    report = run_all(quick=args.quick, headless=args.headless)
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(report, file, indent=2)
+    if not args.compare:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+        return 0
+
+    with open(args.compare) as file:
+        baseline = json.load(file)
+    rows = compare(report, baseline, args.threshold)
+    for name, old, new, change, regressed in rows:
+        flag = "REGRESSION" if regressed else "ok"
+        print(f"{name:<36} {old:>14.4f} -> {new:>14.4f}  {change:+7.1%}  {flag}")
+    return 1 if any(row[4] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
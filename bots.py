@@ -0,0 +1,73 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Bot Roster
+# NEW ADDITION - Named paddle bots and a headless match between two of them
+# =============================================================================
+#
+# Every headless tool that pits bots against each other (tournament.py,
+# `pong.py simulate`, param_sweep.py, telemetry.py, pong_env.py) picks them
+# by name from BOTS here, so all of them offer the same roster and a new
+# bot only has to be added once.
+#
+# This module only imports game_state and ai_player, so a fast-starting
+# command can use it without pulling in multiprocessing or NumPy.
+# =============================================================================
+
+import random
+
+import game_state as gs
+from ai_player import PredictiveAI, DIFFICULTIES, LEFT, RIGHT
+
+# =============================================================================
+# BOT CONSTANTS
+# =============================================================================
+MAX_MATCH_TICKS = 100_000  # Matches still running after this are draws
+
+
+def _idle_bot(side, seed):
+    return lambda state: gs.MOVE_NONE
+
+
+def _random_bot(side, seed):
+    rng = random.Random(seed)
+    return lambda state: rng.choice((gs.MOVE_DOWN, gs.MOVE_NONE, gs.MOVE_UP))
+
+
+def _follow_bot(side, seed):
+    # The naive bot: chase the ball's current y every tick
+    def decide(state):
+        paddle_y = state.l_y if side == LEFT else state.r_y
+        if state.y > paddle_y + gs.PADDLE_SPEED / 2:
+            return gs.MOVE_UP
+        if state.y < paddle_y - gs.PADDLE_SPEED / 2:
+            return gs.MOVE_DOWN
+        return gs.MOVE_NONE
+    return decide
+
+
+def _predictive_bot(difficulty):
+    def factory(side, seed):
+        return PredictiveAI(side, difficulty, seed).move_for_state
+    return factory
+
+
+# Name -> factory(side, seed) returning a callable(state) -> direction
+BOTS = {"idle": _idle_bot, "random": _random_bot, "follow": _follow_bot}
+BOTS.update({name: _predictive_bot(name) for name in DIFFICULTIES})
+
+
+def play_match(left_name, right_name, seed, max_ticks=MAX_MATCH_TICKS):
+    """
+    Play one headless match between two bots from BOTS
+    Args:
+        left_name, right_name (str): Bot names
+        seed (int): Seed for the left bot (the right one gets seed + 1)
+        max_ticks (int): Stop an endless match after this many ticks
+    Returns: Final GameState (game_over is False if max_ticks ran out)
+    """
+    left = BOTS[left_name](LEFT, seed)
+    right = BOTS[right_name](RIGHT, seed + 1)
+    state = gs.GameState()
+    step = gs.step
+    while not state.game_over and state.tick < max_ticks:
+        step(state, (left(state), right(state)))
+    return state
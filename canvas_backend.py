@@ -0,0 +1,241 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Canvas Backend
+# NEW ADDITION - Play on a bare tkinter Canvas instead of turtle
+# =============================================================================
+#
+# Every Ball.goto() and Paddle.goto() goes through turtle's shape transform,
+# undo buffer and polygon rebuild (shapesize/stretch) before it reaches the
+# canvas, and Scoreboard.write() deletes and recreates text items.
+#
+# This backend draws the same court - ball, paddles, CenterLine dashes and
+# Scoreboard digits - as plain Tk canvas items (RetainedRenderer at the
+# centre of a CanvasWindow) and moves them with coords(). The rules are
+# game_state.step(), paced like main() with time.sleep(move_speed), and the
+# paddles use held keys.
+#
+# Usage:
+#     python main.py --backend canvas [--cpu hard --record match.pong]
+#     python canvas_backend.py compare --frames 3000   # turtle vs canvas frame times
+#     python canvas_backend.py compare --headless      # Python overhead only, no display
+# =============================================================================
+
+import argparse
+import sys
+import time
+import tkinter as tk
+
+import court
+import game_state as gs
+from ai_player import PredictiveAI, DIFFICULTIES, LEFT, bot_match_states
+from input_state import HeldKeys
+from retained_renderer import RetainedRenderer
+
+# =============================================================================
+# BACKEND CONSTANTS
+# =============================================================================
+BACKEND_TURTLE = "turtle"
+BACKEND_CANVAS = "canvas"
+BACKENDS = (BACKEND_TURTLE, BACKEND_CANVAS)
+GAME_TITLE = "Enhanced Pong Game"
+COMPARE_FRAMES = 2000
+COMPARE_BOT = "medium"  # Both paddles in the comparison match
+COMPARE_SEED = 22
+WINDOW_GAP = 20  # Pixels between the two windows in a side-by-side comparison
+
+
+class CanvasWindow:
+    """
+    Bare Tk window and canvas with the keyboard methods of turtle's Screen
+    (so HeldKeys.bind() works on it unchanged)
+    """
+
+    def __init__(self, title=GAME_TITLE, master=None):
+        """
+        Args:
+            title (str): Window title
+            master: Existing Tk root to open a Toplevel on (default: new Tk root)
+        """
+        self.root = tk.Tk() if master is None else tk.Toplevel(master)
+        self.root.title(title)
+        self.root.resizable(False, False)
+        self.canvas = tk.Canvas(self.root, width=court.SCREEN_WIDTH, height=court.SCREEN_HEIGHT,
+                                bg=court.BACKGROUND_COLOR, highlightthickness=0)
+        self.canvas.pack()
+        self.origin = (court.SCREEN_WIDTH // 2, court.SCREEN_HEIGHT // 2)
+
+    def onkeypress(self, fun, key):
+        self.root.bind(f"<KeyPress-{key}>", lambda event: fun())
+
+    def onkeyrelease(self, fun, key):
+        self.root.bind(f"<KeyRelease-{key}>", lambda event: fun())
+
+    def listen(self):
+        self.canvas.focus_set()
+
+    def update(self):
+        """
+        Present the frame and run pending key handlers
+        """
+        self.root.update()
+
+    def exitonclick(self):
+        self.canvas.bind("<Button-1>", lambda event: self.bye())
+        self.root.mainloop()
+
+    def bye(self):
+        self.root.destroy()
+
+
+def main(cpu=None, record_path=None):
+    """
+    Play a match on the canvas backend
+
+    Args:
+        cpu (str): Difficulty of a CPU left paddle (None = two players)
+        record_path (str): Save a replay of the match to this file
+    """
+    window = CanvasWindow()
+    renderer = RetainedRenderer(window.canvas, window.update, window.origin)
+    keys = HeldKeys()
+    keys.bind(window)
+    ai = PredictiveAI(LEFT, cpu) if cpu else None
+    recorder = None
+    if record_path:
+        from replay import ReplayRecorder
+        recorder = ReplayRecorder(record_path)
+
+    state = gs.GameState()
+    while not state.game_over:
+        time.sleep(state.move_speed)
+        if not renderer.render(state):
+            window.update()  # Nothing moved - still run the key handlers
+        keys.frame_presented()
+        inputs = keys.sample()
+        if ai:
+            inputs = (ai.move_for_state(state), inputs[1])
+        if recorder:
+            recorder.record(inputs)
+        gs.step(state, inputs)
+
+    renderer.render(state)
+    renderer.display_winner(gs.winner(state))
+    print(f"Input latency: {keys.latency_percentiles()}")
+    if recorder:
+        recorder.close(state.l_score, state.r_score)
+    window.exitonclick()
+
+
+# =============================================================================
+# FRAME-TIME COMPARISON
+# =============================================================================
+
+def _frame_times(frames, draw):
+    """
+    Returns: Sorted seconds per draw(state) call
+    """
+    times = []
+    for state in frames:
+        start = time.perf_counter()
+        draw(state)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return times
+
+
+def compare_backends(frames=COMPARE_FRAMES, headless=False):
+    """
+    Draw the same match with the Turtle classes and with canvas items
+
+    Args:
+        frames (int): Frames to draw on each backend
+        headless (bool): Use fake_turtle and FakeCanvas (no display needed) -
+                         measures the Python-side cost of each backend only
+    Returns: {backend: sorted seconds per frame}
+    """
+    states = bot_match_states(frames, COMPARE_BOT, COMPARE_SEED)
+    if headless:
+        import fake_turtle
+        screen = fake_turtle.install()
+        canvas = fake_turtle.FakeCanvas()
+        present = canvas.update_idletasks
+        origin = (court.SCREEN_WIDTH // 2, court.SCREEN_HEIGHT // 2)
+    else:
+        from turtle import Screen
+        screen = Screen()
+        screen.setup(width=court.SCREEN_WIDTH, height=court.SCREEN_HEIGHT, startx=0, starty=0)
+        screen.bgcolor(court.BACKGROUND_COLOR)
+        window = CanvasWindow(f"{GAME_TITLE} - canvas backend",
+                              master=screen.getcanvas().winfo_toplevel())
+        window.root.geometry(f"+{court.SCREEN_WIDTH + WINDOW_GAP}+0")  # Side by side
+        canvas, present, origin = window.canvas, window.update, window.origin
+    screen.title(f"{GAME_TITLE} - turtle backend")
+    screen.tracer(0)
+
+    from paddle import Paddle
+    from ball import Ball
+    from scoreboard import Scoreboard
+    from center_line import CenterLine
+    r_paddle = Paddle((court.RIGHT_PADDLE_X, 0))
+    l_paddle = Paddle((court.LEFT_PADDLE_X, 0))
+    ball = Ball()
+    scoreboard = Scoreboard()
+    CenterLine().draw()
+
+    def draw_turtle(state):
+        ball.draw_state(state)
+        l_paddle.draw_y(state.l_y)
+        r_paddle.draw_y(state.r_y)
+        scoreboard.draw_state(state)
+        screen.update()
+
+    renderer = RetainedRenderer(canvas, present, origin)
+    return {BACKEND_TURTLE: _frame_times(states, draw_turtle),
+            BACKEND_CANVAS: _frame_times(states, renderer.render)}
+
+
+def _percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def print_comparison(times):
+    """
+    Side-by-side table of compare_backends() results
+    """
+    turtle_times, canvas_times = times[BACKEND_TURTLE], times[BACKEND_CANVAS]
+    print(f"{'frame time (ms)':<16} {'turtle':>9} {'canvas':>9} {'speedup':>8}")
+    rows = [("mean", sum(turtle_times) / len(turtle_times), sum(canvas_times) / len(canvas_times))]
+    rows += [(f"p{int(fraction * 100)}", _percentile(turtle_times, fraction),
+              _percentile(canvas_times, fraction)) for fraction in (0.50, 0.95, 0.99)]
+    rows.append(("max", turtle_times[-1], canvas_times[-1]))
+    for name, turtle_time, canvas_time in rows:
+        print(f"{name:<16} {turtle_time * 1e3:>9.3f} {canvas_time * 1e3:>9.3f} "
+              f"{turtle_time / max(canvas_time, 1e-9):>7.1f}x")
+    print(f"({len(turtle_times)} frames each)")
+
+
+def cli(argv=None):
+    """
+    Command line entry point
+    """
+    parser = argparse.ArgumentParser(description="Pong on a bare tkinter Canvas")
+    sub = parser.add_subparsers(dest="command")
+    play_parser = sub.add_parser("play", help="play a match (default)")
+    play_parser.add_argument("--cpu", choices=sorted(DIFFICULTIES))
+    play_parser.add_argument("--record", metavar="FILE")
+    compare_parser = sub.add_parser("compare", help="turtle vs canvas frame times")
+    compare_parser.add_argument("--frames", type=int, default=COMPARE_FRAMES)
+    compare_parser.add_argument("--headless", action="store_true",
+                                help="no display: time the Python side of each backend only")
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        print_comparison(compare_backends(args.frames, args.headless))
+    elif args.command == "play":
+        main(cpu=args.cpu, record_path=args.record)
+    else:
+        main()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(cli())
@@ -0,0 +1,509 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Chaos Modes
+# NEW ADDITION - Hundreds of balls and four paddles with a spatial grid
+# =============================================================================
+#
+# check_paddle_collision() knows exactly one ball and two paddles, and
+# every Ball is its own Turtle. Chaos modes need something else:
+#
+# - MULTI: the normal court (top/bottom walls, left/right paddles) with
+#   many balls at once.
+# - FOUR:  no walls - a paddle guards every side of the court.
+#
+# All balls live in one struct-of-arrays store (array("d") per attribute),
+# paddles likewise. Collisions use a uniform grid broad phase: every tick
+# each ball is hashed into a CELL_SIZE cell (four times the ball radius, so
+# touching balls are always in the same or neighbouring cells) and each
+# paddle is registered in the cells it covers. Ball-ball tests only look
+# at half of the 3x3 neighbourhood and ball-paddle tests only at paddles
+# registered in the ball's cell, so the work grows with nearby pairs
+# instead of balls x balls + balls x paddles.
+#
+# Every side has LIVES; conceding a goal costs one and the ball is served
+# again from the centre. The match ends when a side runs out.
+#
+# Usage:
+#     python chaos.py play --balls 40                  # multi-ball
+#     python chaos.py play --mode four --balls 100 --human
+#     python chaos.py bench --counts 1,10,50,100,200,500 --brute
+# =============================================================================
+
+import argparse
+import math
+import random
+import sys
+import time
+from array import array
+
+import court
+import game_state as gs
+
+# =============================================================================
+# CHAOS CONSTANTS
+# =============================================================================
+MODE_MULTI = "multi"
+MODE_FOUR = "four"
+LEFT, RIGHT, TOP, BOTTOM = 0, 1, 2, 3
+SIDE_NAMES = ("LEFT", "RIGHT", "TOP", "BOTTOM")
+
+BALL_RADIUS = court.BALL_RADIUS
+BALL_SPEED = 6.0  # Pixels per tick
+DEFLECTION = 0.6  # How much the hit position on a paddle bends the bounce
+PADDLE_STEP = gs.PADDLE_SPEED / 2  # Paddle pixels per tick (60 ticks/s)
+TOP_PADDLE_Y = 260  # FOUR mode: horizontal paddles in front of the goal lines
+PADDLE_TRAVEL_X = 330  # FOUR mode: how far horizontal paddles can move
+LIVES = 10
+TICK_SECONDS = 1 / 60
+
+# Broad phase grid
+CELL_SIZE = 4 * BALL_RADIUS  # 40 px - two ball diameters
+GRID_OFFSET = 480  # Keeps cell indices positive for anything near the court
+GRID_STRIDE = 64  # Cell key = column * GRID_STRIDE + row
+HALF_NEIGHBOURS = (GRID_STRIDE, GRID_STRIDE + 1, 1, -GRID_STRIDE + 1)  # E, NE, N, NW
+
+
+class ChaosWorld:
+    """
+    Struct-of-arrays simulation of many balls and two or four paddles
+    """
+
+    def __init__(self, balls=50, mode=MODE_MULTI, seed=None, lives=LIVES):
+        """
+        Args:
+            balls (int): Number of balls in play (constant - goals re-serve)
+            mode (str): MODE_MULTI or MODE_FOUR
+            seed (int | None): Seed for serve directions and start positions
+            lives (int): Goals each side may concede
+        """
+        self.mode = mode
+        self.rng = random.Random(seed)
+        self.count = balls
+        zeros = bytes(8 * balls)
+        self.x, self.y = array("d", zeros), array("d", zeros)
+        self.vx, self.vy = array("d", zeros), array("d", zeros)
+        for i in range(balls):
+            self._serve(i, spread=True)
+
+        # Paddles: centre, half extents, which side they guard
+        sides = (LEFT, RIGHT) if mode == MODE_MULTI else (LEFT, RIGHT, TOP, BOTTOM)
+        self.sides = list(sides)
+        self.px, self.py, self.half_w, self.half_h = [], [], [], []
+        for side in sides:
+            if side in (LEFT, RIGHT):
+                self.px.append(court.LEFT_PADDLE_X if side == LEFT else court.RIGHT_PADDLE_X)
+                self.py.append(0.0)
+                self.half_w.append(court.PADDLE_HALF_WIDTH)
+                self.half_h.append(court.PADDLE_HALF_HEIGHT)
+            else:
+                self.px.append(0.0)
+                self.py.append(TOP_PADDLE_Y if side == TOP else -TOP_PADDLE_Y)
+                self.half_w.append(court.PADDLE_HALF_HEIGHT)
+                self.half_h.append(court.PADDLE_HALF_WIDTH)
+        self.lives = [lives] * len(sides)
+        self.tick = 0
+        self.game_over = False
+
+        # Per-tick stats
+        self.tests = 0
+        self.hits = 0
+        self.goals = 0
+
+    def _serve(self, i, spread=False):
+        """
+        Put ball i back in play in a random direction
+        spread=True scatters it over the court (used for the opening serve)
+        """
+        rng = self.rng
+        if spread:
+            self.x[i] = rng.uniform(-250, 250)
+            self.y[i] = rng.uniform(-200, 200)
+        else:
+            self.x[i] = self.y[i] = 0.0
+        angle = rng.uniform(-math.pi / 4, math.pi / 4) + rng.choice((0, math.pi))
+        if self.mode == MODE_FOUR and rng.random() < 0.5:
+            angle += math.pi / 2
+        self.vx[i] = BALL_SPEED * math.cos(angle)
+        self.vy[i] = BALL_SPEED * math.sin(angle)
+
+    # =========================================================================
+    # PADDLES
+    # =========================================================================
+
+    def _ai_target(self, p):
+        """
+        Coordinate (along the paddle's track) of the ball that reaches its goal first
+        """
+        side = self.sides[p]
+        x, y, vx, vy = self.x, self.y, self.vx, self.vy
+        best, target = float("inf"), 0.0
+        for i in range(self.count):
+            if side == LEFT and vx[i] < 0:
+                eta, at = (x[i] - self.px[p]) / -vx[i], y[i]
+            elif side == RIGHT and vx[i] > 0:
+                eta, at = (self.px[p] - x[i]) / vx[i], y[i]
+            elif side == TOP and vy[i] > 0:
+                eta, at = (self.py[p] - y[i]) / vy[i], x[i]
+            elif side == BOTTOM and vy[i] < 0:
+                eta, at = (y[i] - self.py[p]) / -vy[i], x[i]
+            else:
+                continue
+            if 0 <= eta < best:
+                best, target = eta, at
+        return target
+
+    def _move_paddles(self, inputs):
+        for p, side in enumerate(self.sides):
+            direction = inputs.get(side) if inputs else None
+            vertical = side in (LEFT, RIGHT)
+            position = self.py[p] if vertical else self.px[p]
+            if direction is None:
+                gap = self._ai_target(p) - position
+                direction = 1 if gap > PADDLE_STEP else -1 if gap < -PADDLE_STEP else 0
+            limit = gs.SCREEN_TOP_BOUNDARY if vertical else PADDLE_TRAVEL_X
+            position = max(-limit, min(limit, position + direction * PADDLE_STEP))
+            if vertical:
+                self.py[p] = position
+            else:
+                self.px[p] = position
+
+    # =========================================================================
+    # COLLISIONS
+    # =========================================================================
+
+    def _bounce_paddle(self, i, p):
+        """
+        Reflect ball i off paddle p if it is moving towards that paddle's goal
+        Returns: True on a bounce
+        """
+        side = self.sides[p]
+        vx, vy = self.vx, self.vy
+        if side == LEFT and vx[i] < 0 or side == RIGHT and vx[i] > 0:
+            vx[i] = -vx[i]
+            vy[i] += DEFLECTION * BALL_SPEED * (self.y[i] - self.py[p]) / self.half_h[p]
+        elif side == TOP and vy[i] > 0 or side == BOTTOM and vy[i] < 0:
+            vy[i] = -vy[i]
+            vx[i] += DEFLECTION * BALL_SPEED * (self.x[i] - self.px[p]) / self.half_w[p]
+        else:
+            return False
+        scale = BALL_SPEED / math.hypot(vx[i], vy[i])
+        vx[i] *= scale
+        vy[i] *= scale
+        return True
+
+    def _collide_balls(self, i, j):
+        """
+        Elastic collision between equal balls i and j if they overlap and approach
+        """
+        x, y, vx, vy = self.x, self.y, self.vx, self.vy
+        dx, dy = x[j] - x[i], y[j] - y[i]
+        distance_sq = dx * dx + dy * dy
+        if distance_sq >= (2 * BALL_RADIUS) ** 2 or distance_sq == 0:
+            return
+        distance = math.sqrt(distance_sq)
+        nx, ny = dx / distance, dy / distance
+        approach = (vx[i] - vx[j]) * nx + (vy[i] - vy[j]) * ny
+        if approach > 0:
+            vx[i] -= approach * nx
+            vy[i] -= approach * ny
+            vx[j] += approach * nx
+            vy[j] += approach * ny
+        # Push apart so they don't stay stuck together
+        push = (2 * BALL_RADIUS - distance) / 2
+        x[i] -= push * nx
+        y[i] -= push * ny
+        x[j] += push * nx
+        y[j] += push * ny
+
+    def _paddle_cells(self):
+        """
+        Cell key -> paddle indices whose box (grown by the ball radius) touches it
+        """
+        cells = {}
+        for p in range(len(self.sides)):
+            left = int((self.px[p] - self.half_w[p] - BALL_RADIUS + GRID_OFFSET) // CELL_SIZE)
+            right = int((self.px[p] + self.half_w[p] + BALL_RADIUS + GRID_OFFSET) // CELL_SIZE)
+            bottom = int((self.py[p] - self.half_h[p] - BALL_RADIUS + GRID_OFFSET) // CELL_SIZE)
+            top = int((self.py[p] + self.half_h[p] + BALL_RADIUS + GRID_OFFSET) // CELL_SIZE)
+            for column in range(left, right + 1):
+                for row in range(bottom, top + 1):
+                    cells.setdefault(column * GRID_STRIDE + row, []).append(p)
+        return cells
+
+    def _touches_paddle(self, i, p):
+        return (abs(self.x[i] - self.px[p]) < self.half_w[p] + BALL_RADIUS and
+                abs(self.y[i] - self.py[p]) < self.half_h[p] + BALL_RADIUS)
+
+    def _collide_grid(self):
+        """
+        Broad phase: only balls in neighbouring cells and paddles in the same cell
+        """
+        x, y = self.x, self.y
+        grid = {}
+        for i in range(self.count):
+            key = int((x[i] + GRID_OFFSET) // CELL_SIZE) * GRID_STRIDE + \
+                int((y[i] + GRID_OFFSET) // CELL_SIZE)
+            cell = grid.get(key)
+            if cell is None:
+                grid[key] = [i]
+            else:
+                cell.append(i)
+
+        paddle_cells = self._paddle_cells()
+        tests = 0
+        for key, cell in grid.items():
+            size = len(cell)
+            for a in range(size):
+                for b in range(a + 1, size):
+                    self._collide_balls(cell[a], cell[b])
+                tests += size - a - 1
+            for offset in HALF_NEIGHBOURS:
+                other = grid.get(key + offset)
+                if other:
+                    for i in cell:
+                        for j in other:
+                            self._collide_balls(i, j)
+                    tests += size * len(other)
+            paddles = paddle_cells.get(key)
+            if paddles:
+                for i in cell:
+                    for p in paddles:
+                        if self._touches_paddle(i, p) and self._bounce_paddle(i, p):
+                            self.hits += 1
+                tests += size * len(paddles)
+        self.tests = tests
+
+    def _collide_brute(self):
+        """
+        Reference: every ball against every ball and every paddle
+        """
+        count = self.count
+        for i in range(count):
+            for j in range(i + 1, count):
+                self._collide_balls(i, j)
+            for p in range(len(self.sides)):
+                if self._touches_paddle(i, p) and self._bounce_paddle(i, p):
+                    self.hits += 1
+        self.tests = count * (count - 1) // 2 + count * len(self.sides)
+
+    # =========================================================================
+    # SIMULATION
+    # =========================================================================
+
+    def _concede(self, side, i):
+        p = self.sides.index(side)
+        self.lives[p] -= 1
+        self.goals += 1
+        if self.lives[p] <= 0:
+            self.game_over = True
+        self._serve(i)
+
+    def step(self, inputs=None, broad_phase=True):
+        """
+        Advance every ball and paddle by one tick
+        Args:
+            inputs (dict | None): Side -> direction (-1/0/1) for human paddles;
+                                  sides not listed are played by the AI
+            broad_phase (bool): Use the grid (False = brute force, for comparison)
+        """
+        self._move_paddles(inputs)
+        x, y, vx, vy = self.x, self.y, self.vx, self.vy
+        walls = self.mode == MODE_MULTI
+        for i in range(self.count):
+            x[i] += vx[i]
+            y[i] += vy[i]
+            if walls and (y[i] > gs.WALL_BOUNDARY and vy[i] > 0 or
+                          y[i] < -gs.WALL_BOUNDARY and vy[i] < 0):
+                vy[i] = -vy[i]
+
+        if broad_phase:
+            self._collide_grid()
+        else:
+            self._collide_brute()
+
+        for i in range(self.count):
+            if x[i] > gs.RIGHT_BOUNDARY:
+                self._concede(RIGHT, i)
+            elif x[i] < gs.LEFT_BOUNDARY:
+                self._concede(LEFT, i)
+            elif not walls and y[i] > gs.WALL_BOUNDARY:
+                self._concede(TOP, i)
+            elif not walls and y[i] < -gs.WALL_BOUNDARY:
+                self._concede(BOTTOM, i)
+        self.tick += 1
+
+    def winner(self):
+        """
+        Returns: Name of the side with the most lives left
+        """
+        best = max(range(len(self.sides)), key=self.lives.__getitem__)
+        return f"{SIDE_NAMES[self.sides[best]]} PLAYER"
+
+
+# =============================================================================
+# RENDERING
+# =============================================================================
+
+class ChaosRenderer:
+    """
+    One persistent canvas item per ball and paddle, moved with coords()
+    """
+
+    LIVES_POSITIONS = {LEFT: (-200, 200), RIGHT: (200, 200), TOP: (0, 200), BOTTOM: (0, -240)}
+
+    def __init__(self, canvas, world, origin=(0, 0)):
+        """
+        Args:
+            canvas: tkinter Canvas (or the turtle Screen's canvas)
+            world (ChaosWorld): World to draw
+            origin (tuple): Canvas coordinates of the court centre
+        """
+        self.canvas = canvas
+        self.world = world
+        self.origin_x, self.origin_y = origin
+        if world.mode == MODE_MULTI:
+            for x, top, bottom in court.center_line_dashes():
+                canvas.create_line(self.origin_x + x, self.origin_y - top,
+                                   self.origin_x + x, self.origin_y - bottom,
+                                   fill=court.LINE_COLOR)
+        self.balls = [canvas.create_oval(0, 0, 0, 0, fill=court.BALL_COLOR, outline="")
+                      for _ in range(world.count)]
+        self.paddles = [canvas.create_rectangle(0, 0, 0, 0, fill=court.PADDLE_COLOR, outline="")
+                        for _ in world.sides]
+        self.lives = []
+        for side in world.sides:
+            x, y = self.LIVES_POSITIONS[side]
+            self.lives.append(canvas.create_text(self.origin_x + x, self.origin_y - y, text="",
+                                                 fill=court.SCORE_COLOR,
+                                                 font=("Courier", 24, "normal")))
+        self._shown_lives = [None] * len(world.sides)
+
+    def render(self):
+        """
+        Move every item to the world's current positions
+        """
+        canvas, world = self.canvas, self.world
+        ox, oy, r = self.origin_x, self.origin_y, BALL_RADIUS
+        x, y = world.x, world.y
+        for i, item in enumerate(self.balls):
+            canvas.coords(item, ox + x[i] - r, oy - y[i] - r, ox + x[i] + r, oy - y[i] + r)
+        for p, item in enumerate(self.paddles):
+            canvas.coords(item, ox + world.px[p] - world.half_w[p], oy - world.py[p] - world.half_h[p],
+                          ox + world.px[p] + world.half_w[p], oy - world.py[p] + world.half_h[p])
+            if world.lives[p] != self._shown_lives[p]:
+                canvas.itemconfigure(self.lives[p], text=str(world.lives[p]))
+                self._shown_lives[p] = world.lives[p]
+
+
+def play(balls, mode, human, seed=None):
+    """
+    Play a chaos match in the turtle window
+    Args:
+        balls (int): Ball count
+        mode (str): MODE_MULTI or MODE_FOUR
+        human (bool): Left paddle on W/S and right paddle on Up/Down
+        seed (int | None): Serve seed
+    """
+    from main import setup_screen
+    from game_loop import FrameScheduler
+    from input_state import HeldKeys
+
+    screen = setup_screen()
+    screen.title(f"Enhanced Pong Game - chaos ({mode}, {balls} balls)")
+    world = ChaosWorld(balls, mode, seed)
+    renderer = ChaosRenderer(screen.getcanvas(), world)
+    keys = None
+    if human:
+        keys = HeldKeys()
+        keys.bind(screen)
+
+    scheduler = FrameScheduler(TICK_SECONDS)
+    while not world.game_over:
+        inputs = None
+        if keys:
+            left, right = keys.sample()
+            inputs = {LEFT: left, RIGHT: right}
+        world.step(inputs)
+        renderer.render()
+        screen.update()
+        scheduler.wait()
+
+    screen.getcanvas().create_text(0, 0, text=f"🏆 {world.winner()} WINS! 🏆\nClick to exit",
+                                   fill=court.WINNER_COLOR, font=court.WINNER_FONT)
+    screen.update()
+    screen.exitonclick()
+
+
+# =============================================================================
+# STRESS BENCHMARK
+# =============================================================================
+
+def bench(counts, ticks, modes, brute):
+    """
+    Frame time against ball count
+    Args:
+        counts (list): Ball counts to try
+        ticks (int): Ticks per measurement
+        modes (list): Modes to run
+        brute (bool): Also time the brute-force collision pass
+    """
+    from fake_turtle import FakeCanvas
+
+    print(f"{'mode':<6} {'balls':>5} {'physics ms':>10} {'render ms':>9} {'frame ms':>8} "
+          f"{'tests':>7} {'brute tests':>11}" + (f" {'brute ms':>8}" if brute else ""))
+    for mode in modes:
+        for count in counts:
+            world = ChaosWorld(count, mode, seed=count)
+            renderer = ChaosRenderer(FakeCanvas(), world)
+            physics = render = tests = 0.0
+            for _ in range(ticks):
+                start = time.perf_counter()
+                world.step()
+                middle = time.perf_counter()
+                renderer.render()
+                end = time.perf_counter()
+                physics += middle - start
+                render += end - middle
+                tests += world.tests
+            brute_tests = count * (count - 1) // 2 + count * len(world.sides)
+            line = (f"{mode:<6} {count:>5} {physics / ticks * 1e3:>10.3f} "
+                    f"{render / ticks * 1e3:>9.3f} {(physics + render) / ticks * 1e3:>8.3f} "
+                    f"{tests / ticks:>7.0f} {brute_tests:>11}")
+            if brute:
+                world = ChaosWorld(count, mode, seed=count)
+                start = time.perf_counter()
+                for _ in range(ticks):
+                    world.step(broad_phase=False)
+                line += f" {(time.perf_counter() - start) / ticks * 1e3:>8.3f}"
+            print(line)
+
+
+def main(argv=None):
+    """
+    Command line entry point
+    """
+    parser = argparse.ArgumentParser(description="Pong chaos modes")
+    sub = parser.add_subparsers(dest="command", required=True)
+    play_parser = sub.add_parser("play", help="play in a window")
+    play_parser.add_argument("--balls", type=int, default=20)
+    play_parser.add_argument("--mode", choices=(MODE_MULTI, MODE_FOUR), default=MODE_MULTI)
+    play_parser.add_argument("--human", action="store_true",
+                             help="left paddle on W/S, right paddle on Up/Down")
+    play_parser.add_argument("--seed", type=int)
+    bench_parser = sub.add_parser("bench", help="frame time against ball count")
+    bench_parser.add_argument("--counts", default="1,10,50,100,200,500",
+                              type=lambda text: [int(n) for n in text.split(",")])
+    bench_parser.add_argument("--ticks", type=int, default=200)
+    bench_parser.add_argument("--mode", choices=(MODE_MULTI, MODE_FOUR), action="append")
+    bench_parser.add_argument("--brute", action="store_true",
+                              help="also time brute-force collision checks")
+    args = parser.parse_args(argv)
+
+    if args.command == "play":
+        play(args.balls, args.mode, args.human, args.seed)
+    else:
+        bench(args.counts, args.ticks, args.mode or [MODE_MULTI, MODE_FOUR], args.brute)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Court Layout
+# NEW ADDITION - Turtle-free geometry of everything drawn on screen
+# =============================================================================
+#
+# The Turtle classes describe their looks through turtle calls (shapesize,
+# penup/pendown, write). Renderers that don't use turtle need the same
+# layout as plain numbers, so they are collected here in world coordinates
+# (origin at the centre of the court, y pointing up - same as turtle).
+# =============================================================================
+
+# =============================================================================
+# LAYOUT CONSTANTS (mirrored from main.py and the Turtle classes)
+# =============================================================================
+
+# Screen (main.py)
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+BACKGROUND_COLOR = "black"
+
+# Ball (ball.py - turtle "circle" shape has a 10 px radius)
+BALL_COLOR = "white"
+BALL_RADIUS = 10
+
+# Paddles (paddle.py - 20 px "square" shape stretched by PADDLE_WIDTH/LENGTH)
+PADDLE_COLOR = "white"
+PADDLE_HALF_WIDTH = 10  # 20 px * stretch_len 1 / 2
+PADDLE_HALF_HEIGHT = 50  # 20 px * stretch_wid 5 / 2
+RIGHT_PADDLE_X = 350
+LEFT_PADDLE_X = -350
+
+# Scores (scoreboard.py)
+SCORE_COLOR = "white"
+SCORE_FONT = ("Courier", 80, "normal")
+LEFT_SCORE_POSITION = (-100, 200)
+RIGHT_SCORE_POSITION = (100, 200)
+WINNER_COLOR = "yellow"
+WINNER_FONT = ("Courier", 36, "bold")
+WINNER_POSITION = (0, 0)
+
+# Centre line (center_line.py)
+LINE_COLOR = "white"
+DOT_SIZE = 20
+DOT_SPACING = 40
+LINE_POSITION_X = 0
+
+
+def center_line_dashes():
+    """
+    Dash segments drawn by CenterLine.draw(), top to bottom
+    Returns: List of (x, y_top, y_bottom) tuples
+    """
+    dashes = []
+    current_y = SCREEN_HEIGHT // 2
+    end_y = -(SCREEN_HEIGHT // 2)
+    while current_y > end_y:
+        dashes.append((LINE_POSITION_X, current_y, current_y - DOT_SIZE))
+        current_y -= DOT_SIZE + DOT_SPACING
+    return dashes
+
+
+def paddle_rect(x, y):
+    """
+    Bounding box of a paddle centred at (x, y)
+    Returns: Tuple (left, bottom, right, top) in world coordinates
+    """
+    return (x - PADDLE_HALF_WIDTH, y - PADDLE_HALF_HEIGHT,
+            x + PADDLE_HALF_WIDTH, y + PADDLE_HALF_HEIGHT)
+
+
+def ball_rect(x, y):
+    """
+    Bounding box of the ball centred at (x, y)
+    Returns: Tuple (left, bottom, right, top) in world coordinates
+    """
+    return (x - BALL_RADIUS, y - BALL_RADIUS, x + BALL_RADIUS, y + BALL_RADIUS)
@@ -0,0 +1,270 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Event-Driven Engine
+# NEW ADDITION - Jumps straight to the next collision instead of ticking
+# =============================================================================
+#
+# Between events the ball flies in a straight line: nothing can happen
+# while |y| <= WALL_BOUNDARY and x stays between the paddle faces, in the
+# strip behind a paddle short of the goal, or inside a paddle band while
+# that paddle is too far away to reach the ball. So instead of calling step()
+# for every 10 px, this engine works out in closed form how many ticks the
+# ball stays inside such a free zone (checking the few band ticks against
+# where the paddle will really be), moves ball and paddles there in one go,
+# and runs the real step() only for the ticks that raise an event.
+#
+# The number of calls is O(events) instead of O(ticks) - about two per point
+# at the default speeds - but each call costs about as much as ten step()
+# calls and a point only lasts ~40 ticks. Measured on whole matches that is
+# ~2.5x step() with constant inputs or inputs changing every 50+ ticks, and
+# no gain once inputs change every ~10 ticks (each change ends a jump). The
+# win grows with the gap between events: long rallies, slow balls, wide courts.
+#
+# Swept paddle collision: check_paddle_collision() samples the ball once per
+# tick inside a 30 px deep band, so a ball moving 30 px or more per tick can
+# jump clean over it. With swept=True such a tick is intersected with the
+# paddle face and bounced where the path crosses it. At the default 10 px
+# per tick that never happens, so results stay identical to step().
+# =============================================================================
+
+import math
+
+import game_state as gs
+
+# =============================================================================
+# ENGINE CONSTANTS
+# =============================================================================
+FREE_Y = gs.WALL_BOUNDARY  # |y| <= this can't touch a wall
+
+BAND_FACE = gs.RIGHT_PADDLE_X_BOUNDARY  # Mirrored x range of the paddle band
+BAND_BACK = gs.RIGHT_PADDLE_X_BOUNDARY + gs.PADDLE_BAND_DEPTH
+RIGHT_BAND_MIDDLE = gs.RIGHT_PADDLE_X_BOUNDARY + gs.PADDLE_BAND_DEPTH / 2
+LEFT_BAND_MIDDLE = gs.LEFT_PADDLE_X_BOUNDARY - gs.PADDLE_BAND_DEPTH / 2
+NO_INPUTS = (gs.MOVE_NONE, gs.MOVE_NONE)
+
+
+def _paddle_after(y, direction, ticks):
+    """
+    Closed-form paddle position after holding one direction for some ticks
+    Each move is Paddle.go_up()/go_down(): skipped if it would leave the screen
+
+    Args:
+        y (float): Starting paddle centre
+        direction (float): MOVE_UP, MOVE_DOWN, MOVE_NONE or a fraction of one
+        ticks (int): Ticks the direction is held
+    Returns: Paddle centre afterwards
+    """
+    if not direction:
+        return y
+    move = direction * gs.PADDLE_SPEED  # Fractions move that share (step_dt loops)
+    if move > 0:
+        room = math.floor((gs.SCREEN_TOP_BOUNDARY - y) / move)
+    else:
+        room = math.floor((y - gs.SCREEN_BOTTOM_BOUNDARY) / -move)
+    return y + move * max(0, min(ticks, room))
+
+
+def _free_ticks(state, inputs):
+    """
+    Number of upcoming ticks that are guaranteed to raise no event
+
+    Closed form for the wall and the goal line; the (at most three at
+    normal speed) ticks the ball spends in a paddle band are checked
+    exactly against where that paddle will be by then.
+
+    Args:
+        state: GameState to inspect
+        inputs (tuple): (left, right) directions held meanwhile
+    Returns: Whole number of ticks (0 when the next tick raises an event)
+    """
+    x, y, x_move, y_move = state.x, state.y, state.x_move, state.y_move
+    if abs(y + y_move) > FREE_Y:
+        return 0
+    if y_move > 0:
+        free = math.floor((FREE_Y - y) / y_move)
+    elif y_move < 0:
+        free = math.floor((FREE_Y + y) / -y_move)
+    else:
+        free = math.inf
+
+    # Mirror a ball moving left so both sides use the right-hand constants
+    if x_move > 0:
+        u, speed = x, x_move
+        (behind_y, behind), (paddle_y, direction) = (state.l_y, inputs[0]), (state.r_y, inputs[1])
+    elif x_move < 0:
+        u, speed = -x, -x_move
+        (behind_y, behind), (paddle_y, direction) = (state.r_y, inputs[1]), (state.l_y, inputs[0])
+    else:
+        return free
+    free = min(free, math.floor((gs.RIGHT_BOUNDARY - u) / speed))
+    if free <= 0:
+        return 0  # Already past the goal line - the next tick scores
+
+    # A ball that just bounced can still be in the band behind it - and
+    # step() checks both bands, so it can bounce there again
+    j = 1
+    while j <= free and u + j * speed < -BAND_FACE:
+        if u + j * speed > -BAND_BACK and abs(y + j * y_move - _paddle_after(
+                behind_y, behind, j)) < gs.PADDLE_HALF_HEIGHT:
+            free = j - 1
+            break
+        j += 1
+
+    # Band ticks: the paddle only hits if it is really there on that tick
+    j = max(1, math.floor((BAND_FACE - u) / speed))
+    while j <= free:
+        position = u + j * speed
+        if position >= BAND_BACK:
+            if u + (j - 1) * speed <= BAND_FACE:
+                free = j - 1  # Jumps clean over the band - let swept_step() decide
+            break
+        if position > BAND_FACE and abs(y + j * y_move - _paddle_after(
+                paddle_y, direction, j)) < gs.PADDLE_HALF_HEIGHT:
+            free = j - 1
+            break
+        j += 1
+
+    # Guard against float rounding: never jump onto a wall or goal tick
+    while free > 0 and (abs(y + free * y_move) > FREE_Y or
+                        u + free * speed > gs.RIGHT_BOUNDARY):
+        free -= 1
+    return free
+
+
+def _jump(state, inputs, ticks):
+    """
+    Move ball and paddles through event-free ticks in one go
+    Args:
+        state: GameState to update in place
+        inputs (tuple): (left, right) directions held during the jump
+        ticks (int): Number of event-free ticks to skip
+    """
+    state.l_y = _paddle_after(state.l_y, inputs[0], ticks)
+    state.r_y = _paddle_after(state.r_y, inputs[1], ticks)
+    state.x += ticks * state.x_move
+    state.y += ticks * state.y_move
+    state.tick += ticks
+
+
+def swept_step(state, inputs=NO_INPUTS):
+    """
+    step() with a swept paddle test for balls fast enough to skip the band
+
+    If this tick's path crosses a paddle face but neither end lands inside
+    the band, the move is shortened to end in the middle of the band (with
+    y scaled to match). step() then sees the ball inside the band and
+    bounces it exactly as check_paddle_collision() would.
+
+    Args:
+        state: GameState to advance
+        inputs (tuple): (left, right) paddle directions
+    Returns: Integer bit mask of EVENT_* flags for this tick
+    """
+    x, x_move, y_move = state.x, state.x_move, state.y_move
+    new_x = x + x_move
+    if x_move > 0 and x <= gs.RIGHT_PADDLE_X_BOUNDARY and \
+            new_x >= gs.RIGHT_PADDLE_X_BOUNDARY + gs.PADDLE_BAND_DEPTH:
+        target, paddle_y = RIGHT_BAND_MIDDLE, _paddle_after(state.r_y, inputs[1], 1)
+    elif x_move < 0 and x >= gs.LEFT_PADDLE_X_BOUNDARY and \
+            new_x <= gs.LEFT_PADDLE_X_BOUNDARY - gs.PADDLE_BAND_DEPTH:
+        target, paddle_y = LEFT_BAND_MIDDLE, _paddle_after(state.l_y, inputs[0], 1)
+    else:
+        return gs.step(state, inputs)
+
+    # Where does the path cross the middle of the band, and is the paddle there?
+    fraction = (target - x) / x_move
+    if abs(state.y + y_move * fraction - paddle_y) >= gs.PADDLE_HALF_HEIGHT:
+        return gs.step(state, inputs)
+
+    # Shorten the move to end inside the band, run the normal rules (which
+    # now bounce the ball), then restore the full per-tick distances
+    state.x_move = target - x
+    state.y_move = y_move * fraction
+    events = gs.step(state, inputs)
+    state.x_move = x_move if (state.x_move > 0) == (x_move > 0) else -x_move
+    state.y_move = y_move if (state.y_move > 0) == (y_move > 0) else -y_move
+    return events
+
+
+def advance(state, inputs=NO_INPUTS, max_ticks=math.inf, swept=True):
+    """
+    Skip to the next tick that raises an event and run it
+
+    A tick that jumps clean over a paddle band also runs through step()
+    (or swept_step()) even if it raises nothing; the loop then carries on.
+
+    Args:
+        state: GameState to advance
+        inputs (tuple): (left, right) paddle directions held throughout
+        max_ticks (int): Stop after this many ticks (e.g. when input changes)
+        swept (bool): Use swept_step() so fast balls can't tunnel paddles
+    Returns: Tuple (ticks advanced, EVENT_* flags of the final tick - only
+             EVENT_NONE when max_ticks ran out first)
+    """
+    done = 0
+    while done < max_ticks and not state.game_over:
+        free = min(_free_ticks(state, inputs), max_ticks - done)
+        if free == math.inf:
+            raise ValueError("ball never reaches a wall, paddle or goal")
+        if free:
+            _jump(state, inputs, free)
+            done += free
+            if done == max_ticks:
+                break
+        events = swept_step(state, inputs) if swept else gs.step(state, inputs)
+        done += 1
+        if events:
+            return done, events
+    return done, gs.EVENT_NONE
+
+
+def run(state, inputs=NO_INPUTS, max_ticks=1_000_000, swept=True):
+    """
+    Event-driven version of game_state.run(): constant inputs until game over
+    Args:
+        state: GameState to advance
+        inputs (tuple): (left, right) paddle directions held for every tick
+        max_ticks (int): Safety limit for matches that never finish
+        swept (bool): Use swept paddle collision
+    Returns: Number of ticks simulated
+    """
+    done = 0
+    while not state.game_over and done < max_ticks:
+        ticks, _ = advance(state, inputs, max_ticks - done, swept)
+        done += ticks
+    return done
+
+
+def run_schedule(state, changes, max_ticks=1_000_000, swept=True):
+    """
+    Play a match whose paddle inputs change at known ticks
+    The engine only stops early when an input actually changes
+
+    Args:
+        state: GameState to advance
+        changes: Iterable of (tick, (left, right)) sorted by tick; each input
+                 pair is held from that tick until the next change
+        max_ticks (int): Safety limit for matches that never finish
+        swept (bool): Use swept paddle collision
+    Returns: Number of ticks simulated
+    """
+    start = state.tick
+    end = start + max_ticks
+    inputs = NO_INPUTS
+    for tick, new_inputs in changes:
+        until = min(start + tick, end)
+        while not state.game_over and state.tick < until:
+            advance(state, inputs, until - state.tick, swept)
+        if state.game_over or state.tick >= end:
+            return state.tick - start
+        inputs = new_inputs
+    while not state.game_over and state.tick < end:
+        advance(state, inputs, end - state.tick, swept)
+    return state.tick - start
+
+# =============================================================================
+# WHY THIS MODULE WAS ADDED:
+#
+# - ⚡ O(EVENTS): A rally costs a handful of steps per wall/paddle/goal hit
+# - 🎯 EXACT: Event ticks still run game_state.step(), so results match it
+# - 🛡️ NO TUNNELLING: swept_step() catches balls that jump over a paddle
+# =============================================================================
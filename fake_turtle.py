@@ -0,0 +1,157 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Display-Free Turtle Screen
+# NEW ADDITION - Runs the real Turtle classes and main() without a display
+# =============================================================================
+#
+# Benchmarks and trace checks need to run the actual Ball, Paddle,
+# Scoreboard and main() code on machines with no X server. Instead of
+# mocking turtle, this keeps turtle's own drawing logic (shape transforms,
+# undo buffer, item bookkeeping) and only swaps the Tk canvas underneath
+# for FakeCanvas, which stores item coordinates in a dict.
+#
+# install() must run before main/ball/paddle/scoreboard create any turtle:
+#
+#     import fake_turtle
+#     screen = fake_turtle.install()
+#     import main
+#     main.main()   # screen.update() now calls screen.on_update, if set
+# =============================================================================
+
+import itertools
+import turtle
+
+# =============================================================================
+# FAKE SCREEN CONSTANTS
+# =============================================================================
+CANVAS_WIDTH = 800
+CANVAS_HEIGHT = 600
+
+
+class FakeCanvas:
+    """
+    Minimal stand-in for the tkinter Canvas methods turtle calls
+    Items are numbered like Tk's and only their coordinates are kept
+    """
+
+    def __init__(self):
+        self._ids = itertools.count(1)
+        self.items = {}
+
+    def _create(self, *coords, **options):
+        item = next(self._ids)
+        self.items[item] = list(coords)
+        return item
+
+    create_polygon = create_line = create_text = create_image = create_oval = \
+        create_rectangle = _create
+
+    def coords(self, item, *coords):
+        if coords:
+            self.items[item] = list(coords)
+            return None
+        return self.items.get(item, [])
+
+    def delete(self, item):
+        if item == "all":
+            self.items.clear()
+        else:
+            self.items.pop(item, None)
+
+    def find_all(self):
+        return tuple(self.items)
+
+    def cget(self, option):
+        return {"width": CANVAS_WIDTH, "height": CANVAS_HEIGHT}.get(option, "")
+
+    def bbox(self, item):
+        return 0, 0, 0, 0
+
+    def __getattr__(self, name):
+        # Every other canvas method (itemconfigure, tag_raise, bind...) is a no-op
+        return _no_op
+
+
+def _no_op(*args, **kwargs):
+    return None
+
+
+class HeadlessScreen(turtle.TurtleScreen):
+    """
+    Real TurtleScreen on top of FakeCanvas
+
+    Adds what main.py needs from turtle's Screen (setup, title,
+    exitonclick) plus hooks for driving the game from code:
+    - on_update: called with no arguments after every screen.update()
+    - press(key) / release(key): run the handlers bound to a key
+    """
+
+    def __init__(self):
+        self.on_update = None
+        self.press_handlers = {}
+        self.release_handlers = {}
+        super().__init__(FakeCanvas())
+
+    def _blankimage(self):
+        return None
+
+    def _image(self, filename):
+        return None
+
+    def _delay(self, delay=None):
+        return 0
+
+    def _update(self):
+        pass
+
+    def update(self):
+        super().update()
+        if self.on_update is not None:
+            self.on_update()
+
+    def _onkeypress(self, fun, key=None):
+        self.press_handlers[key] = fun
+
+    def _onkeyrelease(self, fun, key):
+        self.release_handlers[key] = fun
+
+    def _listen(self):
+        pass
+
+    def press(self, key):
+        """
+        Simulate a key press: run the onkeypress() handler for key
+        """
+        handler = self.press_handlers.get(key)
+        if handler is not None:
+            handler()
+
+    def release(self, key):
+        """
+        Simulate a key release: run the onkey()/onkeyrelease() handler for key
+        """
+        handler = self.release_handlers.get(key)
+        if handler is not None:
+            handler()
+
+    def setup(self, width=None, height=None, startx=None, starty=None):
+        pass
+
+    def title(self, titlestring):
+        pass
+
+    def exitonclick(self):
+        pass
+
+    def bye(self):
+        pass
+
+
+def install():
+    """
+    Make turtle.Screen() and every new Turtle use a fresh HeadlessScreen
+    Returns: The HeadlessScreen now shared by all turtles
+    """
+    screen = HeadlessScreen()
+    turtle.Turtle._screen = screen
+    turtle.Turtle._pen = None
+    return screen
@@ -0,0 +1,198 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Frame Profiler
+# NEW ADDITION - Per-phase frame timings, frame-time overlay and exit dump
+# =============================================================================
+#
+# main()'s loop marks the end of each phase (sleep, screen update, input,
+# ball move, collision checks, scoring). FrameProfiler stores the time
+# spent in every phase in a preallocated ring buffer, so profiling a long
+# match never grows a list or allocates per frame.
+#
+# Press F1 during a game to toggle an overlay with FPS and p50/p95/p99
+# frame time. The overlay turtle is only created the first time it is
+# shown and is refreshed every OVERLAY_REFRESH_FRAMES frames, so with it
+# turned off the cost per frame is a handful of perf_counter() calls.
+#
+# Usage:
+#     python main.py --profile frames.csv     # or frames.json
+# =============================================================================
+
+import json
+import time
+from array import array
+
+# =============================================================================
+# PROFILER CONSTANTS
+# =============================================================================
+PROFILE_FRAMES = 4096  # Ring buffer size in frames
+
+# Phases of one main() loop iteration, in loop order
+PHASES = ("sleep", "update", "input", "move", "collision", "score")
+PHASE_SLEEP = 0
+PHASE_UPDATE = 1
+PHASE_INPUT = 2
+PHASE_MOVE = 3
+PHASE_COLLISION = 4
+PHASE_SCORE = 5
+
+# Overlay
+OVERLAY_KEY = "F1"
+OVERLAY_REFRESH_FRAMES = 30
+OVERLAY_COLOR = "lime"
+OVERLAY_FONT = ("Courier", 12, "normal")
+OVERLAY_POSITION = (-390, 275)
+
+
+class FrameProfiler:
+    """
+    Fixed-size ring buffer of per-phase frame timings
+
+    Call begin_frame() at the top of the loop, mark(phase) after each phase
+    and end_frame() at the bottom. A phase that is skipped in a frame simply
+    records zero time.
+    """
+
+    def __init__(self, frames=PROFILE_FRAMES, clock=time.perf_counter):
+        """
+        Args:
+            frames (int): Number of most recent frames to keep
+            clock: Time source in seconds
+        """
+        self.frames = frames
+        self.clock = clock
+        self.phases = array("d", bytes(8 * frames * len(PHASES)))  # one row per frame
+        self.totals = array("d", bytes(8 * frames))
+        self.count = 0  # Frames recorded since start (not wrapped)
+        self._row = 0
+        self._empty_row = array("d", bytes(8 * len(PHASES)))
+        self._frame_start = 0.0
+        self._last = 0.0
+
+        # Overlay state - the turtle is created on first show
+        self.overlay = None
+        self.overlay_visible = False
+
+    def begin_frame(self):
+        """
+        Start timing a new frame
+        """
+        row = (self.count % self.frames) * len(PHASES)
+        self.phases[row:row + len(PHASES)] = self._empty_row
+        self._row = row
+        self._frame_start = self._last = self.clock()
+
+    def mark(self, phase):
+        """
+        Record the time since the previous mark as spent in `phase`
+        Args:
+            phase (int): One of the PHASE_* indices
+        """
+        now = self.clock()
+        self.phases[self._row + phase] += now - self._last
+        self._last = now
+
+    def end_frame(self):
+        """
+        Finish the frame: store its total time and refresh the overlay if shown
+        """
+        self.totals[self.count % self.frames] = self.clock() - self._frame_start
+        self.count += 1
+        if self.overlay_visible and self.count % OVERLAY_REFRESH_FRAMES == 0:
+            self._draw_overlay()
+
+    # =========================================================================
+    # STATISTICS
+    # =========================================================================
+
+    def _ordered_indices(self):
+        """
+        Ring slots of the stored frames, oldest first
+        """
+        stored = min(self.count, self.frames)
+        first = self.count - stored
+        return [(first + i) % self.frames for i in range(stored)]
+
+    def summary(self):
+        """
+        Returns: Dictionary with frames, fps, p50/p95/p99 frame time and the
+                 mean time per phase (milliseconds) over the stored frames
+        """
+        slots = self._ordered_indices()
+        if not slots:
+            return {"frames": 0, "fps": None, "p50_ms": None, "p95_ms": None,
+                    "p99_ms": None, "phase_mean_ms": {}}
+        ordered = sorted(self.totals[i] for i in slots)
+        count = len(ordered)
+        width = len(PHASES)
+        return {
+            "frames": self.count,
+            "fps": count / sum(ordered) if sum(ordered) else None,
+            "p50_ms": ordered[(count - 1) // 2] * 1000,
+            "p95_ms": ordered[min(count - 1, int(count * 0.95))] * 1000,
+            "p99_ms": ordered[min(count - 1, int(count * 0.99))] * 1000,
+            "phase_mean_ms": {
+                name: sum(self.phases[i * width + p] for i in slots) / count * 1000
+                for p, name in enumerate(PHASES)
+            },
+        }
+
+    # =========================================================================
+    # OVERLAY
+    # =========================================================================
+
+    def toggle_overlay(self):
+        """
+        Key handler: show or hide the frame-time overlay
+        """
+        self.overlay_visible = not self.overlay_visible
+        if self.overlay_visible:
+            self._draw_overlay()
+        elif self.overlay is not None:
+            self.overlay.clear()
+
+    def _draw_overlay(self):
+        if self.overlay is None:
+            from turtle import Turtle
+            self.overlay = Turtle()
+            self.overlay.hideturtle()
+            self.overlay.penup()
+            self.overlay.color(OVERLAY_COLOR)
+            self.overlay.goto(OVERLAY_POSITION)
+        stats = self.summary()
+        self.overlay.clear()
+        if not stats["frames"]:
+            self.overlay.write("profiling...", font=OVERLAY_FONT)
+            return
+        self.overlay.write(
+            f"{stats['fps']:5.1f} fps  p50 {stats['p50_ms']:.1f}  "
+            f"p95 {stats['p95_ms']:.1f}  p99 {stats['p99_ms']:.1f} ms",
+            font=OVERLAY_FONT)
+
+    # =========================================================================
+    # DUMP
+    # =========================================================================
+
+    def dump(self, path):
+        """
+        Write the stored frames to `path`, oldest first
+        A path ending in .json gets the summary plus per-frame rows,
+        anything else gets a CSV with one row per frame
+        Args:
+            path (str): Output file
+        """
+        width = len(PHASES)
+        first = self.count - min(self.count, self.frames)
+        rows = []
+        for n, slot in enumerate(self._ordered_indices()):
+            row = [first + n, self.totals[slot] * 1000]
+            row.extend(self.phases[slot * width + p] * 1000 for p in range(width))
+            rows.append(row)
+
+        header = ["frame", "total_ms"] + [f"{name}_ms" for name in PHASES]
+        with open(path, "w") as file:
+            if path.endswith(".json"):
+                json.dump({"summary": self.summary(), "columns": header, "rows": rows}, file)
+            else:
+                file.write(",".join(header) + "\n")
+                for row in rows:
+                    file.write(f"{row[0]}," + ",".join(f"{value:.4f}" for value in row[1:]) + "\n")
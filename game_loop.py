@@ -0,0 +1,212 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Fixed-Timestep Game Loop
+# NEW ADDITION - Frame-rate independent game loop with interpolated rendering
+# =============================================================================
+#
+# main() paces the game with time.sleep(ball.move_speed). Every paddle hit
+# shrinks move_speed, so long rallies shrink the sleep toward zero and the
+# loop ends up spinning the CPU as fast as Tk can redraw.
+#
+# This loop instead:
+# - Simulates physics in fixed PHYSICS_DT steps fed by an accumulator
+# - Turns move_speed into ball velocity (game_state.step_dt), with the
+#   swept paddle test from event_engine so a fast ball can't skip the band
+# - Renders at most RENDER_FPS frames per second, interpolating positions
+#   between the last two physics states
+# - Sleeps until the next frame deadline rather than a fixed amount
+#
+# Usage:
+#     python game_loop.py              # Draw with the Turtle classes
+#     python game_loop.py --retained   # Draw with RetainedRenderer
+# =============================================================================
+
+import time
+
+import event_engine
+import game_state as gs
+from input_state import HeldKeys
+
+# =============================================================================
+# LOOP CONSTANTS
+# =============================================================================
+PHYSICS_HZ = 120
+PHYSICS_DT = 1 / PHYSICS_HZ
+RENDER_FPS = 60
+FRAME_INTERVAL = 1 / RENDER_FPS
+PADDLE_VELOCITY = 400  # Pixels per second while a paddle key is held
+MAX_FRAME_TIME = 0.25  # Clamp long stalls (window drags) so physics can't spiral
+
+
+class FixedTimestepLoop:
+    """
+    Accumulator-driven physics clock with render interpolation
+
+    Knows nothing about turtle: feed it elapsed wall time and paddle inputs,
+    read back the interpolated positions to draw.
+    """
+
+    def __init__(self, state=None, dt=PHYSICS_DT):
+        """
+        Args:
+            state (GameState | None): State to drive (a fresh match by default)
+            dt (float): Fixed physics step in seconds
+        """
+        self.state = state if state is not None else gs.GameState()
+        self.dt = dt
+        self.accumulator = 0.0
+        self.steps = 0  # Physics steps run by the last advance() call
+        self.previous = self._positions()
+
+    def _positions(self):
+        """
+        Returns: Tuple of the drawable positions (x, y, l_y, r_y)
+        """
+        state = self.state
+        return state.x, state.y, state.l_y, state.r_y
+
+    def advance(self, elapsed, sample=None):
+        """
+        Add elapsed wall time and run as many fixed physics steps as fit
+
+        Args:
+            elapsed (float): Wall time since the previous call in seconds
+            sample: Callable returning (left, right) paddle inputs, called
+                    once per physics step (None for no paddle movement)
+        Returns: Bit mask of every EVENT_* flag raised during these steps
+        """
+        self.accumulator += min(elapsed, MAX_FRAME_TIME)
+        events = gs.EVENT_NONE
+        self.steps = 0
+        inputs = (gs.MOVE_NONE, gs.MOVE_NONE)
+        while self.accumulator >= self.dt and not self.state.game_over:
+            self.previous = self._positions()
+            if sample is not None:
+                inputs = sample()
+            events |= gs.step_dt(self.state, inputs, self.dt, event_engine.swept_step)
+            self.accumulator -= self.dt
+            self.steps += 1
+
+        # A serve teleports the ball - don't draw it sliding back to the centre
+        if events & (gs.EVENT_LEFT_POINT | gs.EVENT_RIGHT_POINT):
+            self.previous = self._positions()
+        return events
+
+    @property
+    def alpha(self):
+        """
+        Returns: Fraction of a physics step left in the accumulator (0..1)
+        """
+        return self.accumulator / self.dt
+
+    def interpolated(self):
+        """
+        Blend the previous and current physics states for drawing
+        Returns: Tuple (x, y, l_y, r_y) at the current render time
+        """
+        alpha = self.alpha
+        return tuple(old + (new - old) * alpha
+                     for old, new in zip(self.previous, self._positions()))
+
+
+class FrameScheduler:
+    """
+    Deadline-based frame pacing
+
+    Each frame gets an absolute deadline FRAME_INTERVAL after the previous
+    one, so time spent simulating and drawing is subtracted from the wait
+    instead of added to it. If the loop falls more than a frame behind it
+    resynchronises rather than rushing to catch up.
+    """
+
+    def __init__(self, interval=FRAME_INTERVAL, clock=time.perf_counter, sleep=time.sleep):
+        self.interval = interval
+        self.clock = clock
+        self.sleep = sleep
+        self.deadline = clock() + interval
+
+    def wait(self):
+        """
+        Sleep until the next frame deadline
+        Returns: Seconds actually slept (0 when running late)
+        """
+        delay = self.deadline - self.clock()
+        if delay > 0:
+            self.sleep(delay)
+            self.deadline += self.interval
+            return delay
+        if delay < -self.interval:
+            self.deadline = self.clock() + self.interval
+        else:
+            self.deadline += self.interval
+        return 0.0
+
+
+def run(retained=False):
+    """
+    Play a match with the fixed-timestep loop instead of main()'s sleep loop
+    Uses the same screen, controls and winner display as main.py
+
+    Args:
+        retained (bool): Draw with RetainedRenderer canvas items instead of
+                         the Ball/Paddle/Scoreboard turtles
+    """
+    from main import (setup_screen, setup_game_objects, display_winner,
+                      RIGHT_PADDLE_UP, RIGHT_PADDLE_DOWN, LEFT_PADDLE_UP, LEFT_PADDLE_DOWN)
+
+    screen = setup_screen()
+    if retained:
+        from retained_renderer import RetainedRenderer
+        renderer = RetainedRenderer(screen.getcanvas(), screen.update)
+        process_input = screen.getcanvas().winfo_toplevel().update
+        view = gs.GameState()
+    else:
+        r_paddle, l_paddle, ball, scoreboard, center_line = setup_game_objects()
+        center_line.draw()
+
+    # Held keys are sampled every physics step and move the paddles at
+    # PADDLE_VELOCITY, whatever the keyboard's repeat rate is
+    keys = HeldKeys((LEFT_PADDLE_UP, LEFT_PADDLE_DOWN), (RIGHT_PADDLE_UP, RIGHT_PADDLE_DOWN))
+    keys.bind(screen)
+    move_fraction = PADDLE_VELOCITY * PHYSICS_DT / gs.PADDLE_SPEED
+
+    def sample():
+        left, right = keys.sample()
+        return left * move_fraction, right * move_fraction
+
+    loop = FixedTimestepLoop()
+    scheduler = FrameScheduler()
+    last = time.perf_counter()
+    while not loop.state.game_over:
+        now = time.perf_counter()
+        loop.advance(now - last, sample)
+        last = now
+
+        x, y, l_y, r_y = loop.interpolated()
+        if retained:
+            view.x, view.y, view.l_y, view.r_y = x, y, l_y, r_y
+            view.l_score, view.r_score = loop.state.l_score, loop.state.r_score
+            if not renderer.render(view):
+                process_input()  # Nothing to redraw - just run the Tk key handlers
+        else:
+            ball.goto(x, y)
+            l_paddle.draw_y(l_y)
+            r_paddle.draw_y(r_y)
+            scoreboard.draw_state(loop.state)
+            screen.update()  # Also runs the Tk key handlers
+        keys.frame_presented()
+        scheduler.wait()
+
+    if retained:
+        renderer.display_winner(gs.winner(loop.state))
+        print(f"Canvas items: {renderer.item_count()} "
+              f"({renderer.frames_drawn} frames drawn, {renderer.frames_skipped} skipped)")
+    else:
+        display_winner(scoreboard)
+        screen.update()
+    print(f"Input latency: {keys.latency_percentiles()}")
+    screen.exitonclick()
+
+
+if __name__ == "__main__":
+    import sys
+    run(retained="--retained" in sys.argv[1:])
@@ -0,0 +1,421 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Headless Game State
+# NEW ADDITION - Turtle-free simulation core for offline analysis
+# =============================================================================
+#
+# The Turtle classes (Ball, Paddle, Scoreboard) keep their state inside the
+# Tk canvas, so every xcor()/ycor()/goto() is a round-trip through turtle.
+# This module holds the same state as plain Python attributes and advances
+# it with step(), a tick-for-tick copy of one iteration of main()'s loop.
+#
+# Nothing here imports turtle or tkinter, so it runs on machines without
+# a display and can simulate millions of ticks per second.
+# =============================================================================
+
+# =============================================================================
+# SIMULATION CONSTANTS (mirrored from main.py, ball.py and paddle.py)
+# =============================================================================
+
+# Ball (ball.py)
+INITIAL_MOVE_DISTANCE = 10
+INITIAL_MOVE_SPEED = 0.1
+SPEED_INCREASE_FACTOR = 0.9
+
+# Paddles (main.py / paddle.py)
+RIGHT_PADDLE_X = 350
+LEFT_PADDLE_X = -350
+PADDLE_SPEED = 20
+PADDLE_HALF_HEIGHT = 50  # check_paddle_collision() uses paddle.ycor() +/- 50
+PADDLE_WIDTH = 5  # Paddle stretch_wid - the 20 px square shape is stretched to 100 px
+SCREEN_TOP_BOUNDARY = 250
+SCREEN_BOTTOM_BOUNDARY = -250
+
+# Collision and scoring (main.py)
+WALL_BOUNDARY = 280
+RIGHT_PADDLE_X_BOUNDARY = 320
+LEFT_PADDLE_X_BOUNDARY = -320
+PADDLE_BAND_DEPTH = 30  # check_paddle_collision() tests boundary +/- 30
+RIGHT_BOUNDARY = 380
+LEFT_BOUNDARY = -380
+WINNING_SCORE = 5
+
+# Paddle input directions accepted by step()
+MOVE_DOWN = -1
+MOVE_NONE = 0
+MOVE_UP = 1
+
+# Bump whenever step() / make_step() rules change - cached results depend on it
+ENGINE_VERSION = 1
+
+# Event flags returned by step() (combine with bitwise OR)
+EVENT_NONE = 0
+EVENT_WALL = 1
+EVENT_PADDLE = 2
+EVENT_LEFT_POINT = 4  # Right paddle missed - left player scores
+EVENT_RIGHT_POINT = 8  # Left paddle missed - right player scores
+EVENT_GAME_OVER = 16
+
+
+class GameState:
+    """
+    Pure-data snapshot of everything main() tracks during a match
+
+    Attribute names follow the Turtle classes they mirror:
+    - x, y:             Ball position (Ball.xcor() / Ball.ycor())
+    - x_move, y_move:   Ball velocity per tick (Ball.x_move / Ball.y_move)
+    - move_speed:       Seconds main() sleeps per tick (Ball.move_speed)
+    - l_y, r_y:         Paddle centres (l_paddle.ycor() / r_paddle.ycor())
+    - l_score, r_score: Scores (Scoreboard.l_score / Scoreboard.r_score)
+    - tick:             Number of loop iterations simulated so far
+    - game_over:        True once a player reaches WINNING_SCORE
+    """
+
+    __slots__ = ("x", "y", "x_move", "y_move", "move_speed",
+                 "l_y", "r_y", "l_score", "r_score", "tick", "game_over")
+
+    def __init__(self):
+        """
+        Initialize the state exactly as setup_game_objects() leaves the court
+        """
+        self.x = 0
+        self.y = 0
+        self.x_move = INITIAL_MOVE_DISTANCE
+        self.y_move = INITIAL_MOVE_DISTANCE
+        self.move_speed = INITIAL_MOVE_SPEED
+        self.l_y = 0
+        self.r_y = 0
+        self.l_score = 0
+        self.r_score = 0
+        self.tick = 0
+        self.game_over = False
+
+    def copy(self):
+        """
+        Return an independent copy of this state
+        Returns: GameState with identical attribute values
+        """
+        clone = GameState.__new__(GameState)
+        for name in GameState.__slots__:
+            setattr(clone, name, getattr(self, name))
+        return clone
+
+    def as_tuple(self):
+        """
+        Return all attributes as a tuple (handy for comparisons and hashing)
+        Returns: Tuple in __slots__ order
+        """
+        return tuple(getattr(self, name) for name in GameState.__slots__)
+
+    def __eq__(self, other):
+        if not isinstance(other, GameState):
+            return NotImplemented
+        return self.as_tuple() == other.as_tuple()
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in GameState.__slots__)
+        return f"GameState({fields})"
+
+
+def capture_state(ball, l_paddle, r_paddle, scoreboard, tick, game_over=False):
+    """
+    Build a GameState from main()'s Turtle objects (duck-typed, no turtle import)
+    Args:
+        ball, l_paddle, r_paddle, scoreboard: Objects from setup_game_objects()
+        tick (int): Loop iterations so far
+        game_over (bool): True once a winner is decided
+    Returns: GameState
+    """
+    state = GameState()
+    state.x, state.y = ball.xcor(), ball.ycor()
+    state.x_move, state.y_move, state.move_speed = ball.x_move, ball.y_move, ball.move_speed
+    state.l_y, state.r_y = l_paddle.ycor(), r_paddle.ycor()
+    state.l_score, state.r_score = scoreboard.l_score, scoreboard.r_score
+    state.tick = tick
+    state.game_over = game_over
+    return state
+
+
+def winner(state):
+    """
+    Name the winning player the same way main.display_winner() does
+    Args:
+        state: GameState to inspect
+    Returns: "LEFT PLAYER", "RIGHT PLAYER" or None while the match is running
+    """
+    if state.l_score >= WINNING_SCORE:
+        return "LEFT PLAYER"
+    if state.r_score >= WINNING_SCORE:
+        return "RIGHT PLAYER"
+    return None
+
+
+def step(state, inputs=(MOVE_NONE, MOVE_NONE)):
+    """
+    Advance the state by one iteration of main()'s game loop
+
+    Order of operations matches main() exactly:
+    1. Paddle input (key handlers run inside screen.update())
+    2. ball.move()
+    3. check_wall_collision() -> ball.bounce_y()
+    4. check_paddle_collision() -> ball.bounce_x()
+    5. RIGHT_BOUNDARY miss -> ball.reset_position(), scoreboard.l_point()
+    6. LEFT_BOUNDARY miss -> ball.reset_position(), scoreboard.r_point()
+
+    The state is updated in place so a tight loop allocates nothing.
+
+    Args:
+        state: GameState to advance
+        inputs (tuple): (left, right) paddle directions, each MOVE_UP,
+                        MOVE_DOWN or MOVE_NONE (fractions move the paddle
+                        that share of PADDLE_SPEED)
+    Returns: Integer bit mask of EVENT_* flags for this tick
+    """
+    events = EVENT_NONE
+    left, right = inputs
+
+    # Paddle movement with boundary checking (Paddle.go_up / Paddle.go_down)
+    if left:
+        new_y = state.l_y + left * PADDLE_SPEED
+        if SCREEN_BOTTOM_BOUNDARY <= new_y <= SCREEN_TOP_BOUNDARY:
+            state.l_y = new_y
+    if right:
+        new_y = state.r_y + right * PADDLE_SPEED
+        if SCREEN_BOTTOM_BOUNDARY <= new_y <= SCREEN_TOP_BOUNDARY:
+            state.r_y = new_y
+
+    # Ball.move()
+    x = state.x + state.x_move
+    y = state.y + state.y_move
+    state.x = x
+    state.y = y
+    state.tick += 1
+
+    # check_wall_collision() -> Ball.bounce_y()
+    if y > WALL_BOUNDARY or y < -WALL_BOUNDARY:
+        state.y_move = -state.y_move
+        events = EVENT_WALL
+
+    # check_paddle_collision() -> Ball.bounce_x()
+    if ((RIGHT_PADDLE_X_BOUNDARY < x < RIGHT_PADDLE_X_BOUNDARY + PADDLE_BAND_DEPTH and
+         state.r_y - PADDLE_HALF_HEIGHT < y < state.r_y + PADDLE_HALF_HEIGHT) or
+            (LEFT_PADDLE_X_BOUNDARY - PADDLE_BAND_DEPTH < x < LEFT_PADDLE_X_BOUNDARY and
+             state.l_y - PADDLE_HALF_HEIGHT < y < state.l_y + PADDLE_HALF_HEIGHT)):
+        state.x_move = -state.x_move
+        state.move_speed *= SPEED_INCREASE_FACTOR
+        events |= EVENT_PADDLE
+
+    # Right paddle misses - left player scores
+    if x > RIGHT_BOUNDARY:
+        _reset_ball(state)
+        state.l_score += 1
+        events |= EVENT_LEFT_POINT
+        if state.l_score >= WINNING_SCORE or state.r_score >= WINNING_SCORE:
+            state.game_over = True
+            events |= EVENT_GAME_OVER
+
+    # Left paddle misses - right player scores (re-reads x after a reset,
+    # just like main() calls ball.xcor() a second time)
+    if state.x < LEFT_BOUNDARY:
+        _reset_ball(state)
+        state.r_score += 1
+        events |= EVENT_RIGHT_POINT
+        if state.l_score >= WINNING_SCORE or state.r_score >= WINNING_SCORE:
+            state.game_over = True
+            events |= EVENT_GAME_OVER
+
+    return events
+
+
+def _reset_ball(state):
+    """
+    Ball.reset_position(): back to the centre, reset speed, then bounce_x()
+    Args:
+        state: GameState to update in place
+    """
+    state.x = 0
+    state.y = 0
+    state.x_move = -state.x_move
+    state.move_speed = INITIAL_MOVE_SPEED * SPEED_INCREASE_FACTOR
+
+
+def step_dt(state, inputs, dt, rules=step):
+    """
+    Advance the state by dt seconds of game time instead of one loop tick
+
+    main() moves the ball a fixed distance every move_speed seconds, so the
+    ball's real velocity is x_move / move_speed pixels per second. This
+    scales the per-tick move to dt seconds at that velocity and then runs
+    the normal step() rules, so a shrinking move_speed makes the ball faster
+    instead of making the loop sleep less.
+
+    Once a scaled move is longer than the 30 px paddle band, plain step()
+    can carry the ball clean past a paddle; pass event_engine.swept_step as
+    `rules` to bounce it where its path crosses the paddle face instead.
+
+    Args:
+        state: GameState to advance
+        inputs (tuple): (left, right) paddle directions for this tick
+        dt (float): Game time to simulate in seconds
+        rules: One-tick rules to run the scaled move through (default step)
+    Returns: Integer bit mask of EVENT_* flags for this tick
+    """
+    x_move, y_move = state.x_move, state.y_move
+    scale = dt / state.move_speed
+    state.x_move = x_move * scale
+    state.y_move = y_move * scale
+    events = rules(state, inputs)
+
+    # Restore the per-tick distances, keeping any bounce direction change
+    state.x_move = x_move if (state.x_move > 0) == (x_move > 0) else -x_move
+    state.y_move = y_move if (state.y_move > 0) == (y_move > 0) else -y_move
+    return events
+
+
+def run(state, inputs=(MOVE_NONE, MOVE_NONE), max_ticks=1_000_000):
+    """
+    Step the state with constant inputs until the match ends
+    Args:
+        state: GameState to advance
+        inputs (tuple): (left, right) paddle directions held for every tick
+        max_ticks (int): Safety limit for matches that never finish
+    Returns: Number of ticks simulated
+    """
+    start = state.tick
+    while not state.game_over and state.tick - start < max_ticks:
+        step(state, inputs)
+    return state.tick - start
+
+
+# =============================================================================
+# TUNABLE RULES (ADDED: for parameter sweeps)
+# =============================================================================
+
+class GameConfig:
+    """
+    Gameplay parameters that make_step() can vary
+
+    - speed_increase_factor: Ball.move_speed multiplier per paddle hit
+    - initial_move_distance: Ball x_move/y_move at the start of the match
+    - paddle_speed:          Pixels per Paddle.go_up()/go_down()
+    - paddle_width:          Paddle stretch_wid (half height = 10 px per unit)
+    - winning_score:         Points needed to win
+    """
+
+    __slots__ = ("speed_increase_factor", "initial_move_distance", "paddle_speed",
+                 "paddle_width", "winning_score")
+
+    def __init__(self, speed_increase_factor=SPEED_INCREASE_FACTOR,
+                 initial_move_distance=INITIAL_MOVE_DISTANCE, paddle_speed=PADDLE_SPEED,
+                 paddle_width=PADDLE_WIDTH, winning_score=WINNING_SCORE):
+        self.speed_increase_factor = speed_increase_factor
+        self.initial_move_distance = initial_move_distance
+        self.paddle_speed = paddle_speed
+        self.paddle_width = paddle_width
+        self.winning_score = winning_score
+
+    def as_dict(self):
+        """
+        Returns: Dictionary of parameter name -> value
+        """
+        return {name: getattr(self, name) for name in GameConfig.__slots__}
+
+    def new_state(self):
+        """
+        Returns: GameState at kick-off under these rules
+        """
+        state = GameState()
+        state.x_move = state.y_move = self.initial_move_distance
+        return state
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={value!r}" for name, value in self.as_dict().items())
+        return f"GameConfig({fields})"
+
+
+def make_step(config):
+    """
+    Build a step() function for different gameplay parameters
+
+    The returned function has the same signature, rule order and events as
+    step(); the parameters are bound as closure constants so it runs at the
+    same speed. With the default parameters step() itself is returned.
+
+    Args:
+        config (GameConfig): Rules to simulate
+    Returns: Function (state, inputs) -> event flags
+    """
+    if config.as_dict() == GameConfig().as_dict():
+        return step
+
+    speed_factor = config.speed_increase_factor
+    paddle_speed = config.paddle_speed
+    half_height = config.paddle_width * PADDLE_HALF_HEIGHT / PADDLE_WIDTH
+    winning_score = config.winning_score
+    reset_speed = INITIAL_MOVE_SPEED * speed_factor
+    top, bottom = SCREEN_TOP_BOUNDARY, SCREEN_BOTTOM_BOUNDARY
+    right_band = (RIGHT_PADDLE_X_BOUNDARY, RIGHT_PADDLE_X_BOUNDARY + PADDLE_BAND_DEPTH)
+    left_band = (LEFT_PADDLE_X_BOUNDARY - PADDLE_BAND_DEPTH, LEFT_PADDLE_X_BOUNDARY)
+
+    def configured_step(state, inputs=(MOVE_NONE, MOVE_NONE)):
+        events = EVENT_NONE
+        left, right = inputs
+        if left:
+            new_y = state.l_y + left * paddle_speed
+            if bottom <= new_y <= top:
+                state.l_y = new_y
+        if right:
+            new_y = state.r_y + right * paddle_speed
+            if bottom <= new_y <= top:
+                state.r_y = new_y
+
+        x = state.x + state.x_move
+        y = state.y + state.y_move
+        state.x = x
+        state.y = y
+        state.tick += 1
+
+        if y > WALL_BOUNDARY or y < -WALL_BOUNDARY:
+            state.y_move = -state.y_move
+            events = EVENT_WALL
+
+        if ((right_band[0] < x < right_band[1] and
+             state.r_y - half_height < y < state.r_y + half_height) or
+                (left_band[0] < x < left_band[1] and
+                 state.l_y - half_height < y < state.l_y + half_height)):
+            state.x_move = -state.x_move
+            state.move_speed *= speed_factor
+            events |= EVENT_PADDLE
+
+        if x > RIGHT_BOUNDARY:
+            state.x = state.y = 0
+            state.x_move = -state.x_move
+            state.move_speed = reset_speed
+            state.l_score += 1
+            events |= EVENT_LEFT_POINT
+            if state.l_score >= winning_score or state.r_score >= winning_score:
+                state.game_over = True
+                events |= EVENT_GAME_OVER
+
+        if state.x < LEFT_BOUNDARY:
+            state.x = state.y = 0
+            state.x_move = -state.x_move
+            state.move_speed = reset_speed
+            state.r_score += 1
+            events |= EVENT_RIGHT_POINT
+            if state.l_score >= winning_score or state.r_score >= winning_score:
+                state.game_over = True
+                events |= EVENT_GAME_OVER
+
+        return events
+
+    return configured_step
+
+# =============================================================================
+# WHY THIS MODULE WAS ADDED:
+#
+# - 🧪 OFFLINE ANALYSIS: Simulate whole matches without opening a window
+# - ⚡ SPEED: A tick is a few float additions instead of Tk round-trips
+# - 🎯 FAITHFUL: step() follows main()'s loop body line for line
+# - 🎨 SEPARATION: Turtle classes can now simply draw a GameState
+#   (Ball.draw_state, Paddle.draw_y, Scoreboard.draw_state)
+# =============================================================================
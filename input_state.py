@@ -0,0 +1,143 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Held-Key Input
+# NEW ADDITION - Key state polling with input-to-frame latency measurement
+# =============================================================================
+#
+# setup_controls() binds screen.onkey() straight to Paddle.go_up/go_down, so
+# a paddle jumps 20 px per OS key-repeat event. Movement then follows the
+# keyboard's repeat delay and rate instead of the game's tick rate, and two
+# players holding keys at once make each other's repeats stutter.
+#
+# HeldKeys tracks which keys are down through press/release bindings and
+# the game samples it once per tick, so a held key moves its paddle by the
+# same amount every tick. Every key event is timestamped, and once the
+# frame showing its effect has been presented the delay is recorded so
+# p50/p99 input latency can be reported.
+#
+# The timestamp queues are deques, so key handlers on the Tk thread and
+# sample() on a physics thread (threaded_loop.py) can hand them over
+# without a lock.
+# =============================================================================
+
+import time
+from array import array
+from collections import deque
+
+# =============================================================================
+# INPUT CONSTANTS
+# =============================================================================
+LATENCY_SAMPLES = 1024  # Ring buffer size for latency measurements
+
+# Key names per paddle (same defaults as main.py's control constants)
+LEFT_KEYS = ("w", "s")
+RIGHT_KEYS = ("Up", "Down")
+
+
+class HeldKeys:
+    """
+    Tracks held/released state of the four paddle keys
+
+    sample() returns (left, right) directions in the format game_state.step()
+    expects: +1 while only "up" is held, -1 while only "down" is held, else 0.
+    """
+
+    def __init__(self, left_keys=LEFT_KEYS, right_keys=RIGHT_KEYS, clock=time.perf_counter):
+        """
+        Args:
+            left_keys (tuple): (up, down) key names for the left paddle
+            right_keys (tuple): (up, down) key names for the right paddle
+            clock: Time source for latency timestamps
+        """
+        self.keys = (left_keys[0], left_keys[1], right_keys[0], right_keys[1])
+        self.held = [False, False, False, False]
+        self.clock = clock
+
+        # Event timestamps waiting for a tick to sample them, then for a frame
+        self._pending = deque()
+        self._applied = deque()
+        self.latencies = array("d", bytes(8 * LATENCY_SAMPLES))
+        self.latency_count = 0
+
+    def bind(self, screen):
+        """
+        Register press and release handlers for every paddle key
+        Args:
+            screen: turtle Screen (anything with onkeypress/onkeyrelease)
+        """
+        screen.listen()
+        for index, key in enumerate(self.keys):
+            screen.onkeypress(lambda index=index: self.press(index), key)
+            screen.onkeyrelease(lambda index=index: self.release(index), key)
+
+    def press(self, index, stamp=None):
+        """
+        Key handler: mark key number `index` (order of self.keys) as held
+        Args:
+            index (int): Key number in the order of self.keys
+            stamp (float): When the key event happened, if it waited in an
+                           event queue before this ran (default: now)
+        """
+        if not self.held[index]:
+            self._pending.append(self.clock() if stamp is None else stamp)
+        self.held[index] = True
+
+    def release(self, index, stamp=None):
+        """
+        Key handler: mark key number `index` (order of self.keys) as released
+        Args:
+            index (int): Key number in the order of self.keys
+            stamp (float): When the key event happened (default: now)
+        """
+        if self.held[index]:
+            self._pending.append(self.clock() if stamp is None else stamp)
+        self.held[index] = False
+
+    def sample(self, tick=None):
+        """
+        Read the paddle directions for one simulation tick
+        Args:
+            tick (int): Number of the tick these inputs drive, so
+                        frame_presented(tick) knows which frames show them
+                        (None: the next frame presented does)
+        Returns: Tuple (left, right), each -1, 0 or 1
+        """
+        pending = self._pending
+        while pending:  # popleft() so a press on another thread is never lost
+            self._applied.append((tick, pending.popleft()))
+        held = self.held
+        return held[0] - held[1], held[2] - held[3]
+
+    def frame_presented(self, tick=None):
+        """
+        Call right after a frame is shown: records the latency of every key
+        event whose effect that frame is the first to include
+        Args:
+            tick (int): Tick the frame shows - events sampled for a later
+                        tick wait for a later frame (None: record them all)
+        """
+        if not self._applied:
+            return
+        now = self.clock()
+        applied = self._applied
+        while applied:
+            sampled, stamp = applied[0]
+            if tick is not None and sampled is not None and sampled > tick:
+                break
+            applied.popleft()
+            self.latencies[self.latency_count % LATENCY_SAMPLES] = now - stamp
+            self.latency_count += 1
+
+    def latency_percentiles(self):
+        """
+        Returns: Dictionary with p50/p99 input-to-frame latency in milliseconds
+                 (None values until some key event has been presented)
+        """
+        count = min(self.latency_count, LATENCY_SAMPLES)
+        if not count:
+            return {"samples": 0, "p50_ms": None, "p99_ms": None}
+        ordered = sorted(self.latencies[:count])
+        return {
+            "samples": self.latency_count,
+            "p50_ms": ordered[(count - 1) // 2] * 1000,
+            "p99_ms": ordered[min(count - 1, int(count * 0.99))] * 1000,
+        }
@@ -3,12 +3,21 @@
 # Classic Pong with modern enhancements and performance improvements
 # =============================================================================
 
+import atexit
 import time
 from turtle import Screen
 from paddle import Paddle
 from ball import Ball
 from scoreboard import Scoreboard
 from center_line import CenterLine
+from input_state import HeldKeys
+from replay import ReplayRecorder
+from ai_player import PredictiveAI, LEFT, DIFFICULTIES
+from game_state import capture_state
+from telemetry import Telemetry, format_summary, LEFT as TELEMETRY_LEFT, RIGHT as TELEMETRY_RIGHT
+from rewind import RewindBuffer, RewindControl, capacity_for
+from frame_profiler import (FrameProfiler, OVERLAY_KEY, PHASE_SLEEP, PHASE_UPDATE,
+                            PHASE_INPUT, PHASE_MOVE, PHASE_COLLISION, PHASE_SCORE)
 
 # =============================================================================
 # GAME CONSTANTS (ADDED: Organized constants for better maintainability)
@@ -44,6 +53,13 @@ RIGHT_PADDLE_UP = "Up"
 RIGHT_PADDLE_DOWN = "Down"
 LEFT_PADDLE_UP = "w"
 LEFT_PADDLE_DOWN = "s"
+NO_INPUT = (0, 0)  # ADDED: (left, right) paddle directions when nothing moves
+
+# Rendering Backends (ADDED: same names as canvas_backend.BACKENDS, which
+# is only imported when it is used)
+BACKEND_TURTLE = "turtle"
+BACKEND_CANVAS = "canvas"
+BACKENDS = (BACKEND_TURTLE, BACKEND_CANVAS)
 
 
 # =============================================================================
@@ -82,13 +98,47 @@ def setup_controls(screen, r_paddle, l_paddle):
     Args:
         screen: Game screen object
         r_paddle: Right paddle object
-        l_paddle: Left paddle object
+        l_paddle: Left paddle object (ADDED: None when the CPU plays it)
     """
     screen.listen()
     screen.onkey(r_paddle.go_up, RIGHT_PADDLE_UP)
     screen.onkey(r_paddle.go_down, RIGHT_PADDLE_DOWN)
-    screen.onkey(l_paddle.go_up, LEFT_PADDLE_UP)
-    screen.onkey(l_paddle.go_down, LEFT_PADDLE_DOWN)
+    if l_paddle is not None:
+        screen.onkey(l_paddle.go_up, LEFT_PADDLE_UP)
+        screen.onkey(l_paddle.go_down, LEFT_PADDLE_DOWN)
+
+
+def setup_held_controls(screen):
+    """
+    ADDED: Alternative to setup_controls() that tracks held keys
+    Paddles then move once per game tick while a key is held, instead of
+    once per OS key-repeat event
+    Args:
+        screen: Game screen object
+    Returns: HeldKeys object to sample once per tick
+    """
+    keys = HeldKeys((LEFT_PADDLE_UP, LEFT_PADDLE_DOWN), (RIGHT_PADDLE_UP, RIGHT_PADDLE_DOWN))
+    keys.bind(screen)
+    return keys
+
+
+def move_paddles(inputs, l_paddle, r_paddle):
+    """
+    ADDED: Apply one tick of held-key input to the paddles
+    Args:
+        inputs (tuple): (left, right) directions from HeldKeys.sample()
+        l_paddle: Left paddle object
+        r_paddle: Right paddle object
+    """
+    left, right = inputs
+    if left > 0:
+        l_paddle.go_up()
+    elif left < 0:
+        l_paddle.go_down()
+    if right > 0:
+        r_paddle.go_up()
+    elif right < 0:
+        r_paddle.go_down()
 
 
 # =============================================================================
@@ -162,38 +212,133 @@ def display_winner(scoreboard):
 # MAIN GAME FUNCTION (ENHANCED: Better structure and win conditions)
 # =============================================================================
 
-def main():
+def main(held_keys=False, record_path=None, profile_path=None, cpu=None, broadcast_port=None,
+         telemetry_path=None, store_path=None, player_names=None, rewind_seconds=None):
     """
     Main game function - handles complete game flow from start to finish
     ENHANCED VERSION of original while loop with modular functions
+
+    Args:
+        held_keys (bool): ADDED - poll held keys once per tick instead of
+                          moving paddles on every key-repeat event
+        record_path (str): ADDED - save a replay of the match to this file
+                           (recording always uses held keys)
+        profile_path (str): ADDED - write per-frame phase timings to this
+                            .csv or .json file when the program exits
+        cpu (str): ADDED - single-player mode, the computer plays the left
+                   paddle at this difficulty (key of ai_player.DIFFICULTIES)
+        broadcast_port (int): ADDED - stream the match to spectators on this
+                              TCP port (see spectator.py)
+        telemetry_path (str): ADDED - log rally events to this JSON-lines file
+                              and print rally statistics at the end
+        store_path (str): ADDED - save the result to this SQLite match history
+        player_names (tuple): ADDED - (left, right) names for the match history
+        rewind_seconds (float): ADDED - keep this much recent play so Space
+                                pauses and Left / Right scrub through it
+                                (not rolled back in telemetry, the match
+                                history or the spectator stream)
     """
     # Initialize game components
     screen = setup_screen()
     r_paddle, l_paddle, ball, scoreboard, center_line = setup_game_objects()
-    setup_controls(screen, r_paddle, l_paddle)
+    recorder = ReplayRecorder(record_path) if record_path else None
+    if held_keys or recorder:
+        keys = setup_held_controls(screen)
+    else:
+        keys = None
+        setup_controls(screen, r_paddle, None if cpu else l_paddle)
+
+    # ADDED: Single-player mode - the CPU takes over the left paddle
+    ai = PredictiveAI(LEFT, cpu) if cpu else None
+
+    # ADDED: Live spectator stream, served from a background thread
+    broadcaster = None
+    if broadcast_port:
+        from spectator import Broadcaster  # Loads asyncio - only when streaming
+        broadcaster = Broadcaster(port=broadcast_port).start()
+
+    # ADDED: Rally telemetry - event log plus running statistics
+    telemetry = Telemetry(telemetry_path) if telemetry_path else None
+
+    # ADDED: Match history - results go to a background writer thread
+    store = None
+    if store_path:
+        from match_store import MatchStore  # Loads sqlite3 - only when storing
+        store = MatchStore(store_path)
+    if store and not telemetry:
+        telemetry = Telemetry()  # No log - just the rally statistics to store
+    if telemetry:
+        telemetry.start_match()
+    started = time.perf_counter()
+
+    # ADDED: Per-phase frame timings, F1 toggles the frame-time overlay
+    profiler = FrameProfiler()
+    screen.onkey(profiler.toggle_overlay, OVERLAY_KEY)
+    if profile_path:
+        atexit.register(profiler.dump, profile_path)
+
+    # ADDED: Instant rewind - fixed-size history of recent ticks
+    rewind = None
+    if rewind_seconds:
+        rewind = RewindControl(RewindBuffer(capacity_for(rewind_seconds)),
+                               ball, l_paddle, r_paddle, scoreboard)
+        rewind.bind(screen)
 
     # ADDED: Draw center line for professional court appearance
     center_line.draw()
 
     # Main game loop (ENHANCED: Original while loop with additional features)
     game_is_on = True
+    tick = 0
     while game_is_on:
+        # ADDED: While paused the views only change when the player scrubs
+        if rewind and rewind.paused:
+            tick = rewind.hold(screen)
+            if ai:
+                ai.reset()  # The ball jumped - the CPU must replan
+
+        profiler.begin_frame()
         time.sleep(ball.move_speed)
+        profiler.mark(PHASE_SLEEP)
         screen.update()
+        profiler.mark(PHASE_UPDATE)
+
+        # ADDED: Held-key mode samples the keys once per tick
+        inputs = NO_INPUT
+        if keys:
+            keys.frame_presented()
+            inputs = keys.sample()
+        if ai:
+            inputs = (ai.move_for_ball(ball, l_paddle), inputs[1])
+        if recorder:
+            recorder.record(inputs)
+        move_paddles(inputs, l_paddle, r_paddle)
+        profiler.mark(PHASE_INPUT)
+
         ball.move()
+        if telemetry:
+            telemetry.tick()
+        profiler.mark(PHASE_MOVE)
 
         # Wall collision (ORIGINAL LOGIC: Unchanged from Angela Yu's version)
         if check_wall_collision(ball):
             ball.bounce_y()
+            if telemetry:
+                telemetry.wall()
 
         # Paddle collision (PERFORMANCE IMPROVEMENT: Better collision detection)
         if check_paddle_collision(ball, r_paddle, l_paddle):
             ball.bounce_x()
+            if telemetry:
+                telemetry.hit(ball.move_speed)
+        profiler.mark(PHASE_COLLISION)
 
         # Right paddle misses - left player scores (ENHANCED: Added win checking)
         if ball.xcor() > RIGHT_BOUNDARY:
             ball.reset_position()
             scoreboard.l_point()
+            if telemetry:
+                telemetry.point(TELEMETRY_LEFT, scoreboard.l_score, scoreboard.r_score)
 
             # ADDED: Check for winner after each point
             if check_game_winner(scoreboard):
@@ -204,23 +349,120 @@ def main():
         if ball.xcor() < LEFT_BOUNDARY:
             ball.reset_position()
             scoreboard.r_point()
+            if telemetry:
+                telemetry.point(TELEMETRY_RIGHT, scoreboard.l_score, scoreboard.r_score)
 
             # ADDED: Check for winner after each point
             if check_game_winner(scoreboard):
                 display_winner(scoreboard)
                 game_is_on = False
 
+        # ADDED: Publish this tick's state to spectators and the rewind history
+        tick += 1
+        if broadcaster or rewind:
+            state = capture_state(ball, l_paddle, r_paddle, scoreboard, tick, not game_is_on)
+            if broadcaster:
+                broadcaster.publish(state)
+            if rewind:
+                rewind.buffer.push(state)
+        profiler.mark(PHASE_SCORE)
+        profiler.end_frame()
+
+    if keys:
+        print(f"Input latency: {keys.latency_percentiles()}")
+    if recorder:
+        recorder.close(scoreboard.l_score, scoreboard.r_score)
+    if telemetry:
+        telemetry.end_match(TELEMETRY_LEFT if scoreboard.l_score > scoreboard.r_score
+                            else TELEMETRY_RIGHT)
+        telemetry.close()
+    if telemetry_path:
+        print(format_summary(telemetry.summary()))
+    if store:
+        rallies = telemetry.aggregates.metrics["rally_ticks"].stats
+        left_name, right_name = player_names or (f"cpu-{cpu}" if cpu else "left", "right")
+        store.record(left_name, right_name, scoreboard.l_score, scoreboard.r_score,
+                     ticks=tick, seconds=time.perf_counter() - started, points=rallies.count,
+                     hits=telemetry.aggregates.counters["hits"],
+                     longest_rally=rallies.max if rallies.count else None,
+                     mean_rally_ticks=rallies.mean if rallies.count else None,
+                     replay=record_path, source="game")
+
     # Keep window open until clicked (ORIGINAL: Unchanged)
     screen.exitonclick()
+    if store:
+        store.close()  # ADDED: Wait for the match to be written
 
 
 # =============================================================================
 # PROGRAM EXECUTION
 # =============================================================================
 
+def cli(argv=None):
+    """
+    ADDED: Command line options for main() (also used by `pong.py play`)
+    Args:
+        argv (list): Arguments to parse (default: sys.argv[1:])
+    """
+    import argparse
+    parser = argparse.ArgumentParser(description=GAME_TITLE)
+    parser.add_argument("--held-keys", action="store_true",
+                        help="move paddles once per tick while a key is held")
+    parser.add_argument("--record", metavar="FILE", help="save a replay of the match")
+    parser.add_argument("--cpu", choices=sorted(DIFFICULTIES),
+                        help="play the right paddle against the computer")
+    parser.add_argument("--broadcast", type=int, metavar="PORT",
+                        help="stream the match to spectators on this TCP port")
+    parser.add_argument("--profile", metavar="FILE",
+                        help="write per-frame phase timings (.csv or .json) at exit")
+    parser.add_argument("--telemetry", metavar="FILE",
+                        help="log rally events (JSON lines) and print rally statistics")
+    parser.add_argument("--store", metavar="DB", help="save the result to a SQLite match history")
+    parser.add_argument("--players", nargs=2, metavar=("LEFT", "RIGHT"),
+                        help="player names for the match history")
+    parser.add_argument("--rewind", type=float, metavar="SECONDS",
+                        help="keep recent play to pause (Space) and scrub (Left/Right)")
+    parser.add_argument("--backend", choices=BACKENDS, default=BACKEND_TURTLE,
+                        help="draw with turtle or with raw tkinter Canvas items")
+    parser.add_argument("--threaded", action="store_true",
+                        help="run physics on its own thread, Tk draws from a frame timer")
+    args = parser.parse_args(argv)
+    if args.players and args.players[0] == args.players[1]:
+        parser.error("--players needs two different names")
+    if args.rewind and args.record:
+        parser.error("--rewind cannot be used with --record (a replay is one unbroken input stream)")
+    # ADDED: Telemetry, the match history and spectators would keep rewound events
+    if args.rewind and (args.telemetry or args.store or args.broadcast):
+        parser.error("--rewind cannot be used with --telemetry, --store or --broadcast "
+                     "(they would keep the events that were rewound away)")
+    # ADDED: Threaded physics always uses held keys and has no match history
+    if args.threaded and (args.backend == BACKEND_CANVAS or args.held_keys or args.players):
+        parser.error("--threaded cannot be used with --backend canvas, --held-keys "
+                     "(it always uses held keys) or --players")
+    # ADDED: The canvas backend skips turtle entirely (see canvas_backend.py)
+    if args.backend == BACKEND_CANVAS:
+        if args.broadcast or args.profile or args.telemetry or args.store or args.rewind:
+            parser.error("--broadcast, --profile, --telemetry, --store and --rewind "
+                         "need the turtle backend")
+        import canvas_backend
+        canvas_backend.main(cpu=args.cpu, record_path=args.record)
+        return
+    # ADDED: Threaded physics with ontimer rendering (see threaded_loop.py)
+    if args.threaded:
+        if args.broadcast or args.profile or args.telemetry or args.store or args.rewind:
+            parser.error("--broadcast, --profile, --telemetry, --store and --rewind "
+                         "need the single-threaded loop")
+        import threaded_loop
+        threaded_loop.run(cpu=args.cpu, record_path=args.record)
+        return
+    main(held_keys=args.held_keys, record_path=args.record, profile_path=args.profile,
+         cpu=args.cpu, broadcast_port=args.broadcast, telemetry_path=args.telemetry,
+         store_path=args.store, player_names=args.players, rewind_seconds=args.rewind)
+
+
 # Run the game
 if __name__ == "__main__":
-    main()
+    cli()
 
 # =============================================================================
 # KEY ENHANCEMENTS ADDED TO ORIGINAL ANGELA YU CODE:
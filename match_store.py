@@ -0,0 +1,515 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Match History
+# NEW ADDITION - SQLite match store with a background writer and leaderboards
+# =============================================================================
+#
+# main() shows the winner and then forgets the match. MatchStore keeps
+# every result in a local SQLite database (WAL mode, so readers never wait
+# for the writer):
+#
+# - matches:       players, final l_score/r_score, duration, rally stats,
+#                  optional replay file, where the result came from
+# - appearances:   one row per player per match, clustered by
+#                  (player, played_at) - per-player history is one index range
+# - head_to_head:  running win/loss/draw counts per ordered player pair
+# - player_stats:  running totals per player, indexed by wins (leaderboard)
+#
+# head_to_head and player_stats are updated inside the same transaction as
+# the matches they summarise, so leaderboard and head-to-head queries read
+# a handful of rows however many millions of matches are stored.
+#
+# record() only puts the result on a queue. A writer thread with its own
+# connection collects up to BATCH_SIZE results (or whatever arrived within
+# BATCH_SECONDS) and commits them as one transaction, so the game loop
+# never waits for the disk. If a batch fails, its matches are retried one
+# at a time so a single bad record can't lose the rest. import_tournament()
+# bulk-loads tournament.py checkpoint files through the same batch path;
+# re-importing a file skips the matches already stored.
+#
+# Usage:
+#     python main.py --store pong.db --players alice bob
+#     python match_store.py import swiss.json --db pong.db
+#     python match_store.py leaderboard --db pong.db
+#     python match_store.py history alice --db pong.db
+#     python match_store.py h2h alice bob --db pong.db
+#     python match_store.py bench --rows 1000000
+# =============================================================================
+
+import argparse
+import json
+import os
+import queue
+import random
+import sqlite3
+import sys
+import threading
+import time
+
+# =============================================================================
+# STORE CONSTANTS
+# =============================================================================
+DEFAULT_DB = "pong_matches.db"
+BATCH_SIZE = 500  # Results committed per writer transaction at most
+BATCH_SECONDS = 0.5  # How long the writer waits to fill a batch
+IMPORT_CHUNK = 20_000  # Results per bulk-import transaction
+HISTORY_LIMIT = 20
+LEADERBOARD_LIMIT = 10
+
+# Columns a match record may carry (everything except left/right is optional)
+MATCH_FIELDS = ("played_at", "l_score", "r_score", "ticks", "seconds", "points", "hits",
+                "longest_rally", "mean_rally_ticks", "replay", "source", "external_id")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY,
+    played_at REAL NOT NULL,
+    left_id INTEGER NOT NULL REFERENCES players(id),
+    right_id INTEGER NOT NULL REFERENCES players(id),
+    l_score INTEGER NOT NULL,
+    r_score INTEGER NOT NULL,
+    ticks INTEGER,
+    seconds REAL,
+    points INTEGER,
+    hits INTEGER,
+    longest_rally INTEGER,
+    mean_rally_ticks REAL,
+    replay TEXT,
+    source TEXT,
+    external_id TEXT UNIQUE
+);
+CREATE TABLE IF NOT EXISTS appearances (
+    player_id INTEGER NOT NULL,
+    played_at REAL NOT NULL,
+    match_id INTEGER NOT NULL,
+    opponent_id INTEGER NOT NULL,
+    side TEXT NOT NULL,
+    result INTEGER NOT NULL,  -- 1 win, 0 loss, -1 draw
+    points_for INTEGER NOT NULL,
+    points_against INTEGER NOT NULL,
+    PRIMARY KEY (player_id, played_at, match_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS appearances_pair ON appearances (player_id, opponent_id, played_at);
+CREATE TABLE IF NOT EXISTS head_to_head (
+    player_id INTEGER NOT NULL,
+    opponent_id INTEGER NOT NULL,
+    matches INTEGER NOT NULL,
+    wins INTEGER NOT NULL,
+    losses INTEGER NOT NULL,
+    draws INTEGER NOT NULL,
+    PRIMARY KEY (player_id, opponent_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS player_stats (
+    player_id INTEGER PRIMARY KEY,
+    matches INTEGER NOT NULL,
+    wins INTEGER NOT NULL,
+    losses INTEGER NOT NULL,
+    draws INTEGER NOT NULL,
+    points_for INTEGER NOT NULL,
+    points_against INTEGER NOT NULL,
+    last_played REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS player_stats_wins ON player_stats (wins DESC, matches);
+"""
+
+# Both sides of every match inserted since match id :after
+_NEW_APPEARANCES = """
+INSERT INTO appearances
+SELECT left_id, played_at, id, right_id, 'L',
+       CASE WHEN l_score > r_score THEN 1 WHEN l_score < r_score THEN 0 ELSE -1 END,
+       l_score, r_score
+FROM matches WHERE id > :after
+UNION ALL
+SELECT right_id, played_at, id, left_id, 'R',
+       CASE WHEN r_score > l_score THEN 1 WHEN r_score < l_score THEN 0 ELSE -1 END,
+       r_score, l_score
+FROM matches WHERE id > :after
+"""
+
+# Both sides of the new matches as (player, opponent, points for, points against)
+_NEW_SIDES = """
+WITH new (player_id, opponent_id, points_for, points_against, played_at) AS (
+    SELECT left_id, right_id, l_score, r_score, played_at FROM matches WHERE id > :after
+    UNION ALL
+    SELECT right_id, left_id, r_score, l_score, played_at FROM matches WHERE id > :after)
+"""
+
+_UPDATE_HEAD_TO_HEAD = _NEW_SIDES + """
+INSERT INTO head_to_head
+SELECT player_id, opponent_id, COUNT(*), SUM(points_for > points_against),
+       SUM(points_for < points_against), SUM(points_for = points_against)
+FROM new GROUP BY player_id, opponent_id
+ON CONFLICT (player_id, opponent_id) DO UPDATE SET
+    matches = matches + excluded.matches, wins = wins + excluded.wins,
+    losses = losses + excluded.losses, draws = draws + excluded.draws
+"""
+
+_UPDATE_PLAYER_STATS = _NEW_SIDES + """
+INSERT INTO player_stats
+SELECT player_id, COUNT(*), SUM(points_for > points_against), SUM(points_for < points_against),
+       SUM(points_for = points_against), SUM(points_for), SUM(points_against), MAX(played_at)
+FROM new GROUP BY player_id
+ON CONFLICT (player_id) DO UPDATE SET
+    matches = matches + excluded.matches, wins = wins + excluded.wins,
+    losses = losses + excluded.losses, draws = draws + excluded.draws,
+    points_for = points_for + excluded.points_for,
+    points_against = points_against + excluded.points_against,
+    last_played = MAX(last_played, excluded.last_played)
+"""
+
+_SENTINEL = None
+
+
+def connect(path):
+    """
+    Open (and if needed create) a match database in WAL mode
+    Returns: sqlite3 Connection
+    """
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def write_batch(conn, records):
+    """
+    Insert match records and update every summary table in one transaction
+    Args:
+        conn: sqlite3 Connection
+        records (list): Match dictionaries (see MatchStore.record)
+    Returns: Number of matches actually inserted (duplicates of an
+             external_id already stored, and players paired with
+             themselves, are skipped)
+    """
+    records = [record for record in records if record["left"] != record["right"]]
+    if not records:
+        return 0
+    with conn:
+        names = {record["left"] for record in records} | {record["right"] for record in records}
+        conn.executemany("INSERT OR IGNORE INTO players (name) VALUES (?)",
+                         [(name,) for name in names])
+        ids = {}
+        for name in names:
+            ids[name] = conn.execute("SELECT id FROM players WHERE name = ?", (name,)).fetchone()[0]
+
+        after = conn.execute("SELECT COALESCE(MAX(id), 0) FROM matches").fetchone()[0]
+        now = time.time()
+        conn.executemany(
+            "INSERT OR IGNORE INTO matches (left_id, right_id, " + ", ".join(MATCH_FIELDS) + ") "
+            "VALUES (?, ?" + ", ?" * len(MATCH_FIELDS) + ")",
+            [(ids[record["left"]], ids[record["right"]],
+              record.get("played_at") or now, record.get("l_score", 0), record.get("r_score", 0),
+              *(record.get(field) for field in MATCH_FIELDS[3:]))
+             for record in records])
+        inserted = conn.execute("SELECT COUNT(*) FROM matches WHERE id > ?", (after,)).fetchone()[0]
+        if inserted:
+            params = {"after": after}
+            conn.execute(_NEW_APPEARANCES, params)
+            conn.execute(_UPDATE_HEAD_TO_HEAD, params)
+            conn.execute(_UPDATE_PLAYER_STATS, params)
+    return inserted
+
+
+class MatchStore:
+    """
+    Match history with non-blocking writes and indexed queries
+    """
+
+    def __init__(self, path=DEFAULT_DB, batch_size=BATCH_SIZE, batch_seconds=BATCH_SECONDS):
+        """
+        Args:
+            path (str): SQLite database file
+            batch_size (int): Results per writer transaction at most
+            batch_seconds (float): Time the writer waits to fill a batch
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.batch_seconds = batch_seconds
+        connect(path).close()  # Create the schema before any thread touches it
+        self.queue = queue.Queue()
+        self.written = 0
+        self.errors = []
+        self._reader = None
+        self._writer = threading.Thread(target=self._write_loop, name="match-store-writer",
+                                        daemon=True)
+        self._writer.start()
+
+    # =========================================================================
+    # WRITES
+    # =========================================================================
+
+    def record(self, left, right, l_score, r_score, **fields):
+        """
+        Queue one finished match (returns immediately)
+        Args:
+            left (str): Left player name
+            right (str): Right player name
+            l_score (int): Final left score
+            r_score (int): Final right score
+            **fields: Any of MATCH_FIELDS (ticks, seconds, points, hits,
+                      longest_rally, mean_rally_ticks, replay, source, ...)
+        """
+        if left == right:
+            raise ValueError(f"a player can't play against themselves ({left!r})")
+        unknown = set(fields) - set(MATCH_FIELDS)
+        if unknown:
+            raise ValueError(f"unknown match fields: {', '.join(sorted(unknown))}")
+        record = {"left": left, "right": right, "l_score": l_score, "r_score": r_score,
+                  "played_at": fields.pop("played_at", None) or time.time()}
+        record.update(fields)
+        self.queue.put(record)
+
+    def _write_loop(self):
+        conn = connect(self.path)
+        running = True
+        while running:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + self.batch_seconds
+            while batch[-1] is not _SENTINEL and len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    batch.append(self.queue.get(timeout=remaining) if remaining > 0
+                                 else self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if batch[-1] is _SENTINEL:
+                running = False
+            records = [record for record in batch if record is not _SENTINEL]
+            try:
+                if records:
+                    self._write(conn, records)
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+        conn.close()
+
+    def _write(self, conn, records):
+        """
+        Commit a batch; if it fails, retry match by match so one bad record
+        doesn't cost the rest of the batch
+        """
+        try:
+            self.written += write_batch(conn, records)
+            return
+        except sqlite3.Error as error:
+            if len(records) == 1:
+                self.errors.append(error)
+                print(f"match store: could not save match {records[0]['left']} vs "
+                      f"{records[0]['right']}: {error}", file=sys.stderr)
+                return
+        for record in records:
+            self._write(conn, [record])
+
+    def flush(self):
+        """
+        Block until everything recorded so far is committed
+        """
+        self.queue.join()
+
+    def close(self):
+        """
+        Commit what is queued and stop the writer thread
+        """
+        if self._writer.is_alive():
+            self.queue.put(_SENTINEL)
+            self._writer.join()
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    def import_records(self, records, chunk=IMPORT_CHUNK):
+        """
+        Bulk-load match records synchronously, chunk by chunk
+        Returns: Matches inserted
+        """
+        conn = connect(self.path)
+        inserted = 0
+        try:
+            for start in range(0, len(records), chunk):
+                inserted += write_batch(conn, records[start:start + chunk])
+        finally:
+            conn.close()
+        return inserted
+
+    def import_tournament(self, path):
+        """
+        Bulk-load a tournament.py checkpoint file
+        Returns: Tuple (matches in the file, matches inserted)
+        """
+        with open(path) as file:
+            saved = json.load(file)
+        source = f"tournament:{saved.get('settings', {}).get('format', 'unknown')}"
+        played_at = os.path.getmtime(path)
+        records = [{"left": result["left"], "right": result["right"],
+                    "l_score": result["l_score"], "r_score": result["r_score"],
+                    "ticks": result["ticks"], "points": result["l_score"] + result["r_score"],
+                    "played_at": played_at, "source": source,
+                    "external_id": f"{os.path.basename(path)}:{result['id']}"}
+                   for result in saved["results"]]
+        return len(records), self.import_records(records)
+
+    # =========================================================================
+    # QUERIES
+    # =========================================================================
+
+    def _read(self, sql, params=()):
+        if self._reader is None:
+            self._reader = sqlite3.connect(self.path, check_same_thread=False)
+        return self._reader.execute(sql, params).fetchall()
+
+    def leaderboard(self, limit=LEADERBOARD_LIMIT):
+        """
+        Returns: List of (name, matches, wins, losses, draws, points_for, points_against)
+                 ordered by wins
+        """
+        return self._read(
+            "SELECT p.name, s.matches, s.wins, s.losses, s.draws, s.points_for, s.points_against "
+            "FROM player_stats s JOIN players p ON p.id = s.player_id "
+            "ORDER BY s.wins DESC, s.matches LIMIT ?", (limit,))
+
+    def history(self, player, limit=HISTORY_LIMIT):
+        """
+        Returns: Most recent matches of `player`, newest first, as
+                 (played_at, opponent, side, result, points_for, points_against, match_id)
+        """
+        return self._read(
+            "SELECT a.played_at, o.name, a.side, a.result, a.points_for, a.points_against, a.match_id "
+            "FROM appearances a JOIN players o ON o.id = a.opponent_id "
+            "WHERE a.player_id = (SELECT id FROM players WHERE name = ?) "
+            "ORDER BY a.played_at DESC LIMIT ?", (player, limit))
+
+    def head_to_head(self, player, opponent, limit=HISTORY_LIMIT):
+        """
+        Returns: Tuple ((matches, wins, losses, draws) from `player`'s side or
+                 None, most recent meetings as in history())
+        """
+        ids = "(SELECT id FROM players WHERE name = ?)"
+        totals = self._read(
+            f"SELECT matches, wins, losses, draws FROM head_to_head "
+            f"WHERE player_id = {ids} AND opponent_id = {ids}", (player, opponent))
+        recent = self._read(
+            f"SELECT a.played_at, ?, a.side, a.result, a.points_for, a.points_against, a.match_id "
+            f"FROM appearances a WHERE a.player_id = {ids} AND a.opponent_id = {ids} "
+            f"ORDER BY a.played_at DESC LIMIT ?", (opponent, player, opponent, limit))
+        return (totals[0] if totals else None), recent
+
+    def match_count(self):
+        return self._read("SELECT COUNT(*) FROM matches")[0][0]
+
+
+# =============================================================================
+# COMMAND LINE
+# =============================================================================
+
+RESULT_NAMES = {1: "won", 0: "lost", -1: "draw"}
+
+
+def _print_history(rows):
+    for played_at, opponent, side, result, points_for, points_against, match_id in rows:
+        when = time.strftime("%Y-%m-%d %H:%M", time.localtime(played_at))
+        print(f"{when}  #{match_id:<8} {RESULT_NAMES[result]:<5} {points_for}-{points_against} "
+              f"vs {opponent} ({'left' if side == 'L' else 'right'})")
+
+
+def bench(path, rows, players, seed):
+    """
+    Fill a database with synthetic matches and time the indexed queries
+    """
+    rng = random.Random(seed)
+    names = [f"player{i:04d}" for i in range(players)]
+    store = MatchStore(path)
+    start = time.perf_counter()
+    existing = store.match_count()
+    base = time.time() - rows
+    for first in range(existing, existing + rows, IMPORT_CHUNK):
+        records = []
+        for n in range(first, min(existing + rows, first + IMPORT_CHUNK)):
+            left, right = rng.sample(names, 2)
+            loser_score = rng.randrange(5)
+            l_score, r_score = (5, loser_score) if rng.random() < 0.5 else (loser_score, 5)
+            records.append({"left": left, "right": right, "l_score": l_score, "r_score": r_score,
+                            "ticks": rng.randrange(300, 5000), "played_at": base + n,
+                            "source": "bench"})
+        store.import_records(records)
+    elapsed = time.perf_counter() - start
+    total = store.match_count()
+    print(f"inserted {rows:,} matches in {elapsed:.1f}s ({rows / elapsed:,.0f}/s), {total:,} stored")
+
+    queries = {
+        "leaderboard": lambda: store.leaderboard(),
+        "history": lambda: store.history(rng.choice(names)),
+        "head-to-head": lambda: store.head_to_head(*rng.sample(names, 2)),
+    }
+    for name, query in queries.items():
+        start = time.perf_counter()
+        for _ in range(200):
+            query()
+        print(f"{name:<13} {(time.perf_counter() - start) / 200 * 1e3:8.3f} ms/query")
+    store.close()
+
+
+def main(argv=None):
+    """
+    Command line entry point
+    """
+    parser = argparse.ArgumentParser(description="Pong match history")
+    parser.add_argument("--db", default=DEFAULT_DB, help="database file")
+    sub = parser.add_subparsers(dest="command", required=True)
+    board = sub.add_parser("leaderboard", help="players ordered by wins")
+    board.add_argument("--limit", type=int, default=LEADERBOARD_LIMIT)
+    history = sub.add_parser("history", help="a player's latest matches")
+    history.add_argument("player")
+    history.add_argument("--limit", type=int, default=HISTORY_LIMIT)
+    h2h = sub.add_parser("h2h", help="head-to-head record of two players")
+    h2h.add_argument("player")
+    h2h.add_argument("opponent")
+    h2h.add_argument("--limit", type=int, default=HISTORY_LIMIT)
+    importer = sub.add_parser("import", help="bulk-load tournament.py checkpoint files")
+    importer.add_argument("files", nargs="+")
+    bench_parser = sub.add_parser("bench", help="synthetic rows + query timings")
+    bench_parser.add_argument("--rows", type=int, default=200_000)
+    bench_parser.add_argument("--players", type=int, default=1000)
+    bench_parser.add_argument("--seed", type=int, default=0)
+    for sub_parser in (board, history, h2h, importer, bench_parser):
+        sub_parser.add_argument("--db", default=argparse.SUPPRESS, help="database file")
+    args = parser.parse_args(argv)
+
+    if args.command == "bench":
+        bench(args.db, args.rows, args.players, args.seed)
+        return 0
+    store = MatchStore(args.db)
+    try:
+        if args.command == "import":
+            for path in args.files:
+                start = time.perf_counter()
+                found, inserted = store.import_tournament(path)
+                print(f"{path}: {inserted} of {found} matches imported "
+                      f"in {time.perf_counter() - start:.2f}s")
+        elif args.command == "leaderboard":
+            print(f"{'player':<16} {'played':>7} {'won':>6} {'lost':>6} {'drawn':>6} {'points':>11}")
+            for name, matches, wins, losses, draws, points_for, points_against in \
+                    store.leaderboard(args.limit):
+                print(f"{name:<16} {matches:>7} {wins:>6} {losses:>6} {draws:>6} "
+                      f"{points_for:>5}-{points_against:<5}")
+        elif args.command == "history":
+            _print_history(store.history(args.player, args.limit))
+        else:
+            totals, recent = store.head_to_head(args.player, args.opponent, args.limit)
+            if totals is None:
+                print(f"{args.player} and {args.opponent} have not played each other")
+            else:
+                matches, wins, losses, draws = totals
+                print(f"{args.player} vs {args.opponent}: {matches} played, "
+                      f"{wins} won, {losses} lost, {draws} drawn")
+                _print_history(recent)
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,562 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Network Play
+# NEW ADDITION - Two-machine versus play over UDP with rollback
+# =============================================================================
+#
+# The host plays the left paddle and runs the authoritative match with
+# game_state.step() - the same rules as main()'s loop. The client plays
+# the right paddle:
+#
+# - Client -> host: small input packets carrying the client's last few
+#   inputs (2 bits each), so a lost packet is covered by the next one.
+# - Host -> client: one snapshot per tick, delta-compressed with
+#   state_codec against the newest snapshot the client has acknowledged.
+# - The client never waits for the host. It applies its own input at once
+#   (predicting its paddle and the ball), and when a snapshot arrives it
+#   rolls back to that authoritative state and re-simulates the ticks it
+#   has already predicted.
+# - The host reports how far ahead the client's inputs arrive; the client
+#   runs faster or slower in proportion to keep its inputs just in time.
+#
+# Usage:
+#     python netplay.py host --port 5555
+#     python netplay.py join 192.168.1.20:5555
+#     python netplay.py demo --loss 0.1 --latency 0.05   # headless localhost test
+#
+# --loss/--latency/--jitter on any mode route traffic through LossyChannel.
+# =============================================================================
+
+import argparse
+import heapq
+import random
+import socket
+import struct
+import sys
+import time
+
+import game_state as gs
+import state_codec
+
+# =============================================================================
+# NETWORK CONSTANTS
+# =============================================================================
+DEFAULT_PORT = 5555
+MAX_PACKET = 512
+POLL_INTERVAL = 0.001  # Seconds between polls when nothing is due
+MAX_CATCH_UP_TICKS = 8  # Ticks simulated per poll at most when behind
+HISTORY_TICKS = 64  # Snapshots kept for delta bases and rollback
+REDUNDANT_INPUTS = 8  # Inputs repeated in every input packet
+LEAD_TARGET = 2  # Ticks the client's inputs should arrive ahead of use
+PACE_GAIN = 0.05  # Client tick interval change per tick of lead error
+PACE_MIN = 0.5
+PACE_MAX = 1.5
+HELLO_INTERVAL = 0.1
+FINAL_TIMEOUT = 2.0  # Seconds the host keeps resending the final snapshot
+
+# Packet types (first byte)
+HELLO = 1
+INPUT = 2
+SNAPSHOT = 3
+NO_BASE = 0xFFFFFFFF
+
+INPUT_HEADER = struct.Struct("<BIIB")  # type, ack tick, first tick, count
+SNAPSHOT_HEADER = struct.Struct("<BIBb")  # type, base tick, host input, lead
+
+
+def pack_inputs(directions):
+    """
+    Pack paddle directions (-1/0/1) four to a byte
+    Returns: bytes
+    """
+    out = bytearray((len(directions) + 3) // 4)
+    for i, direction in enumerate(directions):
+        out[i // 4] |= (direction + 1) << (2 * (i % 4))
+    return bytes(out)
+
+
+def unpack_inputs(data, count, offset=0):
+    """
+    Inverse of pack_inputs()
+    Returns: List of directions
+    """
+    return [((data[offset + i // 4] >> (2 * (i % 4))) & 3) - 1 for i in range(count)]
+
+
+# =============================================================================
+# CHANNELS
+# =============================================================================
+
+class UdpChannel:
+    """
+    Non-blocking UDP socket with byte counters
+    """
+
+    def __init__(self, bind=("0.0.0.0", 0)):
+        """
+        Args:
+            bind (tuple): (host, port) to listen on - port 0 picks a free one
+        """
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(bind)
+        self.sock.setblocking(False)
+        self.address = self.sock.getsockname()
+        self.bytes_sent = 0
+        self.packets_sent = 0
+
+    def send(self, data, address):
+        self.bytes_sent += len(data)
+        self.packets_sent += 1
+        self._transmit(data, address)
+
+    def _transmit(self, data, address):
+        try:
+            self.sock.sendto(data, address)
+        except OSError:
+            pass  # A full buffer or unreachable peer is just another lost packet
+
+    def flush(self):
+        """
+        Hook for channels that hold packets back (see LossyChannel)
+        """
+
+    def receive(self):
+        """
+        Read every datagram that is waiting
+        Returns: List of (data, address)
+        """
+        packets = []
+        while True:
+            try:
+                packets.append(self.sock.recvfrom(MAX_PACKET))
+            except (BlockingIOError, ConnectionResetError):
+                return packets
+
+    def close(self):
+        self.sock.close()
+
+
+class LossyChannel(UdpChannel):
+    """
+    UdpChannel that drops and delays outgoing packets, for testing on localhost
+    """
+
+    def __init__(self, bind=("0.0.0.0", 0), loss=0.0, latency=0.0, jitter=0.0,
+                 seed=None, clock=time.perf_counter):
+        """
+        Args:
+            bind (tuple): (host, port) to listen on
+            loss (float): Probability of dropping each packet
+            latency (float): One-way delay in seconds
+            jitter (float): Extra random delay, uniform in [0, jitter] seconds
+            seed (int | None): Seed for the loss and jitter draws
+            clock: Time source
+        """
+        super().__init__(bind)
+        self.loss = loss
+        self.latency = latency
+        self.jitter = jitter
+        self.random = random.Random(seed)
+        self.clock = clock
+        self.queue = []
+        self.sequence = 0
+        self.packets_dropped = 0
+
+    def send(self, data, address):
+        self.bytes_sent += len(data)
+        self.packets_sent += 1
+        if self.random.random() < self.loss:
+            self.packets_dropped += 1
+            return
+        due = self.clock() + self.latency + self.random.random() * self.jitter
+        self.sequence += 1
+        heapq.heappush(self.queue, (due, self.sequence, data, address))
+
+    def flush(self):
+        now = self.clock()
+        while self.queue and self.queue[0][0] <= now:
+            _, _, data, address = heapq.heappop(self.queue)
+            self._transmit(data, address)
+
+
+# =============================================================================
+# HOST (authoritative)
+# =============================================================================
+
+class HostSession:
+    """
+    Runs the authoritative match and streams snapshots to one client
+    """
+
+    def __init__(self, channel, left_input, time_scale=1.0, clock=time.perf_counter):
+        """
+        Args:
+            channel (UdpChannel): Channel bound to the host's port
+            left_input: Callable(state) -> direction for the host's paddle
+            time_scale (float): Tick interval is move_speed * time_scale
+            clock: Time source
+        """
+        self.channel = channel
+        self.left_input = left_input
+        self.time_scale = time_scale
+        self.clock = clock
+        self.state = gs.GameState()
+        self.client = None
+        self.next_tick = None
+        self.finished_at = None
+        self.done = False
+
+        self.client_inputs = {}  # tick -> direction received for that tick
+        self.newest_input = -1
+        self.last_client_input = gs.MOVE_NONE
+        self.last_host_input = gs.MOVE_NONE
+        self.acked = None
+        self.history = {}  # tick -> GameState sent in a snapshot
+
+        # Stats
+        self.snapshots_sent = 0
+        self.snapshot_bytes = 0
+        self.late_inputs = 0
+
+    def _receive(self):
+        for data, address in self.channel.receive():
+            if not data:
+                continue
+            if data[0] == HELLO and self.client is None:
+                self.client = address
+                self.next_tick = self.clock()
+            elif data[0] == INPUT and address == self.client and len(data) >= INPUT_HEADER.size:
+                _, ack, first, count = INPUT_HEADER.unpack_from(data)
+                if ack in self.history and (self.acked is None or ack > self.acked):
+                    self.acked = ack
+                directions = unpack_inputs(data, count, INPUT_HEADER.size)
+                for tick, direction in enumerate(directions, first):
+                    if tick >= self.state.tick:
+                        self.client_inputs[tick] = direction
+                self.newest_input = max(self.newest_input, first + count - 1)
+
+    def _send_snapshot(self):
+        state = self.state
+        base = self.history.get(self.acked) if self.acked is not None else None
+        payload = state_codec.encode(state, base)
+        lead = max(-128, min(127, self.newest_input - state.tick))
+        packet = SNAPSHOT_HEADER.pack(SNAPSHOT, base.tick if base else NO_BASE,
+                                      self.last_host_input + 1, lead) + payload
+        self.channel.send(packet, self.client)
+        self.snapshots_sent += 1
+        self.snapshot_bytes += len(packet)
+
+        self.history[state.tick] = state.copy()
+        oldest = state.tick - HISTORY_TICKS
+        for tick in [tick for tick in self.history if tick < oldest]:
+            del self.history[tick]
+
+    def poll(self):
+        """
+        Handle packets and simulate any ticks that are due
+        Returns: Number of ticks simulated
+        """
+        self.channel.flush()
+        self._receive()
+        if self.client is None or self.done:
+            return 0
+
+        if self.state.game_over:
+            # Keep resending the final state until the client confirms it
+            now = self.clock()
+            if self.acked == self.state.tick or now - self.finished_at > FINAL_TIMEOUT:
+                self.done = True
+            elif now >= self.next_tick:
+                self.next_tick = now + HELLO_INTERVAL
+                self._send_snapshot()
+            return 0
+
+        ticks = 0
+        while ticks < MAX_CATCH_UP_TICKS and self.clock() >= self.next_tick:
+            state = self.state
+            right = self.client_inputs.pop(state.tick, None)
+            if right is None:
+                self.late_inputs += 1
+                right = self.last_client_input
+            self.last_client_input = right
+            self.last_host_input = self.left_input(state)
+            gs.step(state, (self.last_host_input, right))
+            self.next_tick += state.move_speed * self.time_scale
+            ticks += 1
+            if state.game_over:
+                self.finished_at = self.clock()
+                break
+        if ticks:
+            if self.clock() - self.next_tick > MAX_CATCH_UP_TICKS * gs.INITIAL_MOVE_SPEED * self.time_scale:
+                self.next_tick = self.clock()  # Too far behind - stop catching up
+            self._send_snapshot()
+        return ticks
+
+
+# =============================================================================
+# CLIENT (prediction + rollback)
+# =============================================================================
+
+class ClientSession:
+    """
+    Predicts the match locally and reconciles with the host's snapshots
+    """
+
+    def __init__(self, channel, host, right_input, time_scale=1.0, clock=time.perf_counter):
+        """
+        Args:
+            channel (UdpChannel): Client's channel
+            host (tuple): Host (address, port)
+            right_input: Callable(state) -> direction for the client's paddle
+            time_scale (float): Must match the host's time_scale
+            clock: Time source
+        """
+        self.channel = channel
+        self.host = host
+        self.right_input = right_input
+        self.time_scale = time_scale
+        self.clock = clock
+
+        self.state = None  # Predicted state shown to the player
+        self.confirmed = None  # Newest authoritative state
+        self.snapshots = {}  # tick -> authoritative state (delta bases)
+        self.inputs = {}  # tick -> own direction applied at that tick
+        self.predicted = {}  # tick -> predicted state tuple (to spot corrections)
+        self.host_input = gs.MOVE_NONE
+        self.pace = 1.0
+        self.next_tick = None
+        self.next_hello = 0.0
+        self.done = False
+
+        # Stats
+        self.rollbacks = 0
+        self.corrections = 0
+        self.resimulated_ticks = 0
+        self.undecodable = 0
+        self.lead_total = 0
+        self.lead_samples = 0
+
+    def _send_inputs(self):
+        newest = self.state.tick - 1
+        first = max(newest - REDUNDANT_INPUTS + 1, self.confirmed.tick)
+        directions = [self.inputs.get(tick, gs.MOVE_NONE) for tick in range(first, newest + 1)]
+        packet = INPUT_HEADER.pack(INPUT, self.confirmed.tick, first, len(directions))
+        self.channel.send(packet + pack_inputs(directions), self.host)
+
+    def _on_snapshot(self, data):
+        _, base_tick, host_input, lead = SNAPSHOT_HEADER.unpack_from(data)
+        base = None
+        if base_tick != NO_BASE:
+            base = self.snapshots.get(base_tick)
+            if base is None:
+                self.undecodable += 1
+                return
+        try:
+            snapshot = state_codec.decode(data, base, SNAPSHOT_HEADER.size)
+        except state_codec.CodecError:
+            self.undecodable += 1
+            return
+        if self.confirmed is not None and snapshot.tick <= self.confirmed.tick:
+            return  # Old or duplicate
+
+        self.confirmed = snapshot
+        self.snapshots[snapshot.tick] = snapshot
+        oldest = snapshot.tick - HISTORY_TICKS
+        for tick in [tick for tick in self.snapshots if tick < oldest]:
+            del self.snapshots[tick]
+        self.host_input = host_input - 1
+        self.lead_total += lead
+        self.lead_samples += 1
+        self.pace = max(PACE_MIN, min(PACE_MAX, 1 + PACE_GAIN * (lead - LEAD_TARGET)))
+
+        if self.state is None or self.state.tick <= snapshot.tick:
+            # First snapshot, or the host got ahead of our prediction
+            self.state = snapshot.copy()
+            self.next_tick = self.clock()
+            return
+
+        # Roll back to the authoritative state and replay our own inputs
+        self.rollbacks += 1
+        if self.predicted.get(snapshot.tick) != snapshot.as_tuple():
+            self.corrections += 1
+        target = self.state.tick
+        state = snapshot.copy()
+        while state.tick < target and not state.game_over:
+            gs.step(state, (self.host_input, self.inputs.get(state.tick, gs.MOVE_NONE)))
+            self.predicted[state.tick] = state.as_tuple()
+            self.resimulated_ticks += 1
+        self.state = state
+        for tick in [tick for tick in self.inputs if tick < snapshot.tick]:
+            del self.inputs[tick]
+            self.predicted.pop(tick, None)
+
+    def poll(self):
+        """
+        Handle packets and predict any ticks that are due
+        Returns: Number of ticks predicted
+        """
+        self.channel.flush()
+        for data, address in self.channel.receive():
+            if address == self.host and data and data[0] == SNAPSHOT and \
+                    len(data) >= SNAPSHOT_HEADER.size:
+                self._on_snapshot(data)
+
+        if self.confirmed is None:
+            now = self.clock()
+            if now >= self.next_hello:
+                self.channel.send(bytes((HELLO,)), self.host)
+                self.next_hello = now + HELLO_INTERVAL
+            return 0
+        if self.confirmed.game_over:
+            if not self.done:
+                self.state = self.confirmed.copy()
+                self._send_inputs()  # Acknowledge the final snapshot
+                self.done = True
+            return 0
+
+        ticks = 0
+        while (ticks < MAX_CATCH_UP_TICKS and not self.state.game_over and
+               self.clock() >= self.next_tick):
+            state = self.state
+            direction = self.right_input(state)
+            self.inputs[state.tick] = direction
+            gs.step(state, (self.host_input, direction))
+            self.predicted[state.tick] = state.as_tuple()
+            self.next_tick += state.move_speed * self.time_scale * self.pace
+            ticks += 1
+        if ticks:
+            if self.clock() - self.next_tick > MAX_CATCH_UP_TICKS * gs.INITIAL_MOVE_SPEED * self.time_scale:
+                self.next_tick = self.clock()
+            self._send_inputs()
+        return ticks
+
+
+# =============================================================================
+# PLAYING AND TESTING
+# =============================================================================
+
+def make_channel(bind, args, seed=None):
+    """
+    UdpChannel, or LossyChannel when any impairment option is set
+    """
+    if args.loss or args.latency or args.jitter:
+        return LossyChannel(bind, args.loss, args.latency, args.jitter, seed)
+    return UdpChannel(bind)
+
+
+def play(session, side):
+    """
+    Run a session in a Turtle window until the match ends
+    Args:
+        session: HostSession or ClientSession
+        side (str): "left" or "right" - used for the window title
+    """
+    from main import setup_screen, setup_game_objects, setup_held_controls, display_winner
+
+    screen = setup_screen()
+    screen.title(f"Enhanced Pong Game - network play ({side} paddle)")
+    r_paddle, l_paddle, ball, scoreboard, center_line = setup_game_objects()
+    center_line.draw()
+    keys = setup_held_controls(screen)
+
+    def local_input(state):
+        # Either key set moves your paddle
+        left, right = keys.sample()
+        return left or right
+
+    if isinstance(session, HostSession):
+        session.left_input = local_input
+    else:
+        session.right_input = local_input
+
+    while not session.done:
+        screen.update()  # Runs the key handlers
+        if session.poll():
+            state = session.state
+            ball.draw_state(state)
+            l_paddle.draw_y(state.l_y)
+            r_paddle.draw_y(state.r_y)
+            scoreboard.draw_state(state)
+        else:
+            time.sleep(POLL_INTERVAL)
+
+    if gs.winner(session.state):
+        display_winner(scoreboard)
+    screen.update()
+    screen.exitonclick()
+
+
+def demo(args):
+    """
+    Host and client bots on localhost in one process, no display
+    Returns: Boolean - True if the client ended on the host's final state
+    """
+    from ai_player import PredictiveAI, LEFT, RIGHT
+
+    host_bot = PredictiveAI(LEFT, args.difficulty, seed=1)
+    client_bot = PredictiveAI(RIGHT, args.difficulty, seed=2)
+    host_channel = make_channel(("127.0.0.1", 0), args, seed=3)
+    client_channel = make_channel(("127.0.0.1", 0), args, seed=4)
+    host = HostSession(host_channel, host_bot.move_for_state, args.time_scale)
+    client = ClientSession(client_channel, host_channel.address, client_bot.move_for_state,
+                           args.time_scale)
+
+    start = time.perf_counter()
+    while not (host.done and client.done):
+        if not (host.poll() + client.poll()):
+            time.sleep(POLL_INTERVAL / 4)
+    elapsed = time.perf_counter() - start
+
+    full_size = SNAPSHOT_HEADER.size + len(state_codec.encode(host.state))
+    ok = client.state == host.state
+    print(f"match: {host.state.l_score}-{host.state.r_score} in {host.state.tick} ticks, "
+          f"{elapsed:.1f}s")
+    print(f"snapshots: {host.snapshots_sent} sent, "
+          f"{host.snapshot_bytes / host.snapshots_sent:.1f} bytes avg (full: {full_size})")
+    print(f"inputs: {client_channel.packets_sent} packets, "
+          f"{client_channel.bytes_sent / client_channel.packets_sent:.1f} bytes avg, "
+          f"{host.late_inputs} ticks without a client input in time")
+    print(f"client: {client.rollbacks} rollbacks, {client.corrections} corrections, "
+          f"{client.resimulated_ticks} ticks re-simulated, "
+          f"mean input lead {client.lead_total / max(1, client.lead_samples):.1f} ticks")
+    print("final state matches host" if ok else "FINAL STATE MISMATCH")
+    host_channel.close()
+    client_channel.close()
+    return ok
+
+
+def main(argv=None):
+    """
+    Command line entry point
+    """
+    parser = argparse.ArgumentParser(description="Pong network play over UDP")
+    sub = parser.add_subparsers(dest="mode", required=True)
+    host_parser = sub.add_parser("host", help="host a match (left paddle)")
+    host_parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    join_parser = sub.add_parser("join", help="join a match (right paddle)")
+    join_parser.add_argument("address", help="HOST:PORT of the host")
+    demo_parser = sub.add_parser("demo", help="headless bot match over localhost")
+    demo_parser.add_argument("--difficulty", default="medium")
+    demo_parser.add_argument("--time-scale", type=float, default=0.05,
+                             help="tick interval multiplier (1.0 = real speed)")
+    for sub_parser in (host_parser, join_parser, demo_parser):
+        sub_parser.add_argument("--loss", type=float, default=0.0, help="packet loss (0-1)")
+        sub_parser.add_argument("--latency", type=float, default=0.0, help="one-way delay (s)")
+        sub_parser.add_argument("--jitter", type=float, default=0.0, help="extra random delay (s)")
+    args = parser.parse_args(argv)
+
+    if args.mode == "demo":
+        return 0 if demo(args) else 1
+    if args.mode == "host":
+        channel = make_channel(("0.0.0.0", args.port), args)
+        print(f"Waiting for a player on port {args.port}...")
+        play(HostSession(channel, lambda state: gs.MOVE_NONE), "left")
+    else:
+        address, _, port = args.address.rpartition(":")
+        host = (socket.gethostbyname(address), int(port))
+        channel = make_channel(("0.0.0.0", 0), args)
+        play(ClientSession(channel, host, lambda state: gs.MOVE_NONE), "right")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
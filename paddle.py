@@ -77,6 +77,17 @@ class Paddle(Turtle):
         if new_y >= SCREEN_BOTTOM_BOUNDARY:
             self.goto(self.xcor(), new_y)
 
+    def draw_y(self, y):
+        """
+        ADDED: Show a paddle position from a headless GameState
+        Only moves the turtle when the position actually changed
+
+        Args:
+            y (float): Paddle centre (GameState.l_y or GameState.r_y)
+        """
+        if self.ycor() != y:
+            self.goto(self.xcor(), y)
+
 # =============================================================================
 # CHANGES MADE TO ORIGINAL ANGELA YU CODE:
 #
@@ -0,0 +1,229 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Parameter Sweeps
+# NEW ADDITION - Grid search over gameplay constants with an on-disk cache
+# =============================================================================
+#
+# SPEED_INCREASE_FACTOR, INITIAL_MOVE_DISTANCE, PADDLE_SPEED, PADDLE_WIDTH
+# and WINNING_SCORE live in main.py, ball.py and paddle.py. Instead of
+# editing them and playing by hand, this runs many headless bot matches
+# for every combination in a grid (game_state.make_step() with a
+# GameConfig) and reports how the game feels:
+#
+# - rally ticks:     ticks per point
+# - hits per point:  paddle hits per point
+# - match ticks / match seconds: match length (seconds = the time main()
+#   would sleep, i.e. the real duration of the match on screen)
+#
+# Every grid point's result is stored in CACHE_DIR under a hash of its
+# parameters, the match settings and game_state.ENGINE_VERSION, so widening
+# a grid only simulates the new points.
+#
+# Usage:
+#     python param_sweep.py --grid speed_increase_factor=0.8,0.9,1.0 paddle_speed=10,20,30
+#     python param_sweep.py --grid paddle_width=3,4,5 --matches 500 --bots hard follow
+# =============================================================================
+
+import argparse
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+import game_state as gs
+from ai_player import LEFT, RIGHT
+from bots import BOTS, MAX_MATCH_TICKS
+
+# =============================================================================
+# SWEEP CONSTANTS
+# =============================================================================
+CACHE_DIR = ".sweep_cache"
+MATCHES_PER_TASK = 25  # Matches of one grid point handed to a worker at a time
+DEFAULT_MATCHES = 200
+DEFAULT_BOTS = ("medium", "medium")
+
+# Totals collected per grid point (averaged in the report)
+COUNTERS = ("matches", "points", "hits", "ticks", "seconds", "left_wins", "draws")
+
+
+def parse_grid(items):
+    """
+    Turn ["name=v1,v2", ...] into an ordered {name: [values]} grid
+    Values are ints when they all look like ints, floats otherwise
+    """
+    grid = {}
+    for item in items:
+        name, _, values = item.partition("=")
+        if name not in gs.GameConfig.__slots__ or not values:
+            raise SystemExit(f"bad grid entry {item!r} - use NAME=V1,V2 with NAME one of "
+                             f"{', '.join(gs.GameConfig.__slots__)}")
+        texts = values.split(",")
+        try:
+            grid[name] = [int(text) for text in texts]
+        except ValueError:
+            grid[name] = [float(text) for text in texts]
+    return grid
+
+
+def grid_points(grid):
+    """
+    Returns: List of GameConfig parameter dictionaries, one per combination
+    """
+    defaults = gs.GameConfig().as_dict()
+    names = list(grid)
+    points = []
+    for values in itertools.product(*(grid[name] for name in names)):
+        params = dict(defaults)
+        params.update(zip(names, values))
+        points.append(params)
+    return points
+
+
+def cache_key(params, matches, bots, seed):
+    """
+    Hash identifying one grid point's result
+    """
+    blob = json.dumps({"engine": gs.ENGINE_VERSION, "params": params, "matches": matches,
+                       "bots": list(bots), "seed": seed, "max_ticks": MAX_MATCH_TICKS},
+                      sort_keys=True)
+    return hashlib.sha256(blob.encode()).hexdigest()[:32]
+
+
+def run_matches(task):
+    """
+    Play a batch of matches for one grid point (runs inside a pool worker)
+    Args:
+        task (tuple): (point index, params dict, bot names, first seed, count)
+    Returns: Tuple (point index, counter dictionary)
+    """
+    index, params, bots, first_seed, count = task
+    config = gs.GameConfig(**params)
+    step = gs.make_step(config)
+    totals = dict.fromkeys(COUNTERS, 0)
+    for seed in range(first_seed, first_seed + count):
+        left = BOTS[bots[0]](LEFT, 2 * seed)
+        right = BOTS[bots[1]](RIGHT, 2 * seed + 1)
+        state = config.new_state()
+        seconds = 0.0
+        hits = 0
+        while not state.game_over and state.tick < MAX_MATCH_TICKS:
+            seconds += state.move_speed
+            if step(state, (left(state), right(state))) & gs.EVENT_PADDLE:
+                hits += 1
+        totals["matches"] += 1
+        totals["points"] += state.l_score + state.r_score
+        totals["hits"] += hits
+        totals["ticks"] += state.tick
+        totals["seconds"] += seconds
+        if not state.game_over:
+            totals["draws"] += 1
+        elif state.l_score > state.r_score:
+            totals["left_wins"] += 1
+    return index, totals
+
+
+def summarize(totals):
+    """
+    Per-point metrics from summed counters
+    """
+    matches, points = totals["matches"], max(1, totals["points"])
+    return {
+        "rally_ticks": totals["ticks"] / points,
+        "hits_per_point": totals["hits"] / points,
+        "match_ticks": totals["ticks"] / matches,
+        "match_seconds": totals["seconds"] / matches,
+        "left_win_rate": totals["left_wins"] / matches,
+        "draw_rate": totals["draws"] / matches,
+    }
+
+
+def sweep(grid, matches=DEFAULT_MATCHES, bots=DEFAULT_BOTS, seed=0, workers=None,
+          cache_dir=CACHE_DIR):
+    """
+    Run (or load from cache) every point of a grid
+    Args:
+        grid (dict): {parameter name: [values]}
+        matches (int): Matches per grid point
+        bots (tuple): (left bot, right bot) names from bots.BOTS
+        seed (int): First match seed (the same seeds are used at every point)
+        workers (int): Pool size (default: CPU count)
+        cache_dir (str | None): Cache directory, None disables caching
+    Returns: Tuple (list of (params, metrics), points computed, points cached)
+    """
+    points = grid_points(grid)
+    results = [None] * len(points)
+    totals = {}
+    tasks = []
+    for index, params in enumerate(points):
+        path = cache_dir and os.path.join(cache_dir, cache_key(params, matches, bots, seed) + ".json")
+        if path and os.path.exists(path):
+            with open(path) as file:
+                results[index] = json.load(file)["metrics"]
+            continue
+        totals[index] = dict.fromkeys(COUNTERS, 0)
+        for first in range(seed, seed + matches, MATCHES_PER_TASK):
+            count = min(MATCHES_PER_TASK, seed + matches - first)
+            tasks.append((index, params, tuple(bots), first, count))
+
+    if tasks:
+        with multiprocessing.Pool(workers) as pool:
+            for index, batch in pool.imap_unordered(run_matches, tasks):
+                for name in COUNTERS:
+                    totals[index][name] += batch[name]
+                if totals[index]["matches"] < matches:
+                    continue
+                results[index] = metrics = summarize(totals[index])
+                if cache_dir:
+                    os.makedirs(cache_dir, exist_ok=True)
+                    path = os.path.join(cache_dir, cache_key(points[index], matches, bots, seed) + ".json")
+                    with open(path, "w") as file:
+                        json.dump({"params": points[index], "metrics": metrics}, file)
+    return list(zip(points, results)), len(totals), len(points) - len(totals)
+
+
+def main(argv=None):
+    """
+    Command line entry point
+    """
+    parser = argparse.ArgumentParser(description="Sweep gameplay parameters with headless matches")
+    parser.add_argument("--grid", nargs="+", required=True, metavar="NAME=V1,V2",
+                        help=f"parameters: {', '.join(gs.GameConfig.__slots__)}")
+    parser.add_argument("--matches", type=int, default=DEFAULT_MATCHES, help="matches per point")
+    parser.add_argument("--bots", nargs=2, default=DEFAULT_BOTS, choices=sorted(BOTS),
+                        metavar="BOT", help="left and right bot")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--cache", default=CACHE_DIR, help="cache directory")
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--json", metavar="FILE", help="also write the results as JSON")
+    args = parser.parse_args(argv)
+
+    grid = parse_grid(args.grid)
+    start = time.perf_counter()
+    rows, computed, cached = sweep(grid, args.matches, args.bots, args.seed, args.workers,
+                                   None if args.no_cache else args.cache)
+    elapsed = time.perf_counter() - start
+
+    names = list(grid)
+    header = [f"{name:>22}" for name in names] + [
+        f"{'rally ticks':>11}", f"{'hits/point':>10}", f"{'match ticks':>11}",
+        f"{'match s':>8}", f"{'left wins':>9}", f"{'draws':>6}"]
+    print(" ".join(header))
+    for params, metrics in rows:
+        cells = [f"{params[name]:>22}" for name in names] + [
+            f"{metrics['rally_ticks']:>11.1f}", f"{metrics['hits_per_point']:>10.2f}",
+            f"{metrics['match_ticks']:>11.0f}", f"{metrics['match_seconds']:>8.1f}",
+            f"{metrics['left_win_rate']:>9.0%}", f"{metrics['draw_rate']:>6.0%}"]
+        print(" ".join(cells))
+    print(f"{computed} points simulated, {cached} from cache, {elapsed:.1f}s")
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump([{"params": params, "metrics": metrics} for params, metrics in rows],
+                      file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
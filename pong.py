@@ -0,0 +1,183 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Unified Command Line
+# NEW ADDITION - One fast-starting entry point for every mode of the game
+# =============================================================================
+#
+# main.py, ball.py, paddle.py, scoreboard.py and center_line.py import
+# turtle (and with it tkinter) at import time, because the game objects
+# subclass Turtle. That is fine for playing, but a headless batch host
+# should not pay for - or fail on - a GUI toolkit just to simulate.
+#
+# Each subcommand here imports its modules only when it runs, and only
+# `play` (plus `replay play` and the turtle benchmarks) reaches turtle:
+#
+#     python pong.py play [--cpu hard --held-keys ...]   # main.py options
+#     python pong.py simulate --left hard --right medium --matches 100
+#     python pong.py replay verify match.pong
+#     python pong.py bench --headless
+#     python pong.py imports                               # import-time budget check
+# =============================================================================
+
+import sys
+
+# =============================================================================
+# CLI CONSTANTS
+# =============================================================================
+HEADLESS_COMMANDS = ("simulate", "replay", "bench")
+# Budgets are shares of `import turtle`, a fixed reference that doesn't
+# grow when main.py does
+IMPORT_REFERENCE = "import turtle"
+IMPORT_BUDGET = 0.40  # Headless startup must cost under 40% of the reference
+PLAY_IMPORT_BUDGET = 2.0  # `import main` = turtle plus the game modules
+IMPORT_REPEATS = 5  # Fresh interpreters per measurement (fastest one counts)
+GUI_MODULES = ("tkinter", "turtle")
+USAGE = """usage: pong.py COMMAND [options]
+
+commands:
+  play       play the game (options as for main.py, see play --help)
+  simulate   headless bot matches
+  replay     info | verify | play a recorded match
+  bench      benchmark suite (--headless skips the turtle benchmarks)
+  imports    check headless startup against the import-time budget"""
+
+
+# =============================================================================
+# SUBCOMMANDS (each returns the function that runs it)
+# =============================================================================
+
+def _load_play():
+    import main
+    return main.cli
+
+
+def _load_simulate():
+    import game_state as gs
+    from bots import BOTS, MAX_MATCH_TICKS, play_match
+
+    def simulate(argv):
+        import argparse
+        import time
+        parser = argparse.ArgumentParser(prog="pong.py simulate",
+                                         description="Headless bot matches")
+        parser.add_argument("--left", choices=sorted(BOTS), default="medium")
+        parser.add_argument("--right", choices=sorted(BOTS), default="medium")
+        parser.add_argument("--matches", type=int, default=10)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--max-ticks", type=int, default=MAX_MATCH_TICKS)
+        args = parser.parse_args(argv)
+
+        wins = [0, 0]
+        ticks = 0
+        start = time.perf_counter()
+        for match in range(args.matches):
+            state = play_match(args.left, args.right, args.seed + 2 * match, args.max_ticks)
+            ticks += state.tick
+            winner = gs.winner(state)
+            if winner:
+                wins[winner != "LEFT PLAYER"] += 1
+            print(f"match {match + 1}: {state.l_score}-{state.r_score} in {state.tick} ticks")
+        elapsed = time.perf_counter() - start
+        print(f"{args.left} (left) {wins[0]} - {wins[1]} {args.right} (right), "
+              f"{ticks / elapsed:,.0f} ticks/s")
+        return 0
+
+    return simulate
+
+
+def _load_replay():
+    import replay
+    return replay.main
+
+
+def _load_bench():
+    import benchmark
+    return benchmark.main
+
+
+def _load_imports():
+    return check_imports
+
+
+COMMANDS = {
+    "play": _load_play,
+    "simulate": _load_simulate,
+    "replay": _load_replay,
+    "bench": _load_bench,
+    "imports": _load_imports,
+}
+
+
+def load_command(name):
+    """
+    Import what a subcommand needs
+    Args:
+        name (str): Key of COMMANDS
+    Returns: Function taking the remaining argv
+    """
+    return COMMANDS[name]()
+
+
+# =============================================================================
+# IMPORT-TIME BUDGET
+# =============================================================================
+
+def _measure(code):
+    """
+    Fastest run of `code` in fresh interpreters
+    Returns: Tuple (milliseconds, GUI modules it loaded)
+    """
+    import json
+    import os
+    import subprocess
+    probe = ("import sys, time, json; t = time.perf_counter(); " + code +
+             "; print(json.dumps([time.perf_counter() - t, "
+             f"[m for m in {GUI_MODULES!r} if m in sys.modules]]))")
+    here = os.path.dirname(os.path.abspath(__file__))
+    best, loaded = float("inf"), []
+    for _ in range(IMPORT_REPEATS):
+        output = subprocess.run([sys.executable, "-c", probe], cwd=here, check=True,
+                                capture_output=True, text=True).stdout
+        seconds, loaded = json.loads(output.splitlines()[-1])
+        best = min(best, seconds)
+    return best * 1000, loaded
+
+
+def check_imports(argv):
+    """
+    Compare startup cost of every command against importing turtle
+    Returns: Exit code - 1 if a command is over budget or a headless one loads a GUI module
+    """
+    if argv:
+        print("usage: pong.py imports")
+        return 2
+    reference, _ = _measure(IMPORT_REFERENCE)
+    print(f"{IMPORT_REFERENCE + ' (reference)':<28} {reference:7.1f} ms")
+    failed = False
+    for name in ("play",) + HEADLESS_COMMANDS:
+        cost, loaded = _measure(f"import pong; pong.load_command({name!r})")
+        share = cost / reference
+        if name in HEADLESS_COMMANDS:
+            over = share > IMPORT_BUDGET or bool(loaded)
+        else:
+            over = share > PLAY_IMPORT_BUDGET  # Turtle expected, but nothing heavy on top
+        failed = failed or over
+        print(f"{'pong.py ' + name:<28} {cost:7.1f} ms  {share:5.0%}  "
+              f"gui={','.join(loaded) or '-':<15} {'OVER BUDGET' if over else 'ok'}")
+    print(f"budget: play under {PLAY_IMPORT_BUDGET:.0%} and headless commands under "
+          f"{IMPORT_BUDGET:.0%} of `{IMPORT_REFERENCE}`, headless without GUI modules")
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    """
+    Command line entry point: pong.py COMMAND [options]
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in COMMANDS:
+        print(USAGE)
+        return 0 if argv and argv[0] in ("-h", "--help") else 2
+    return load_command(argv[0])(argv[1:]) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
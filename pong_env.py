@@ -0,0 +1,368 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Training Environments
+# NEW ADDITION - Gym-style reset()/step() API and a multi-process vector env
+# =============================================================================
+#
+# PongEnv puts a learning agent on one paddle and a bot from
+# bots.BOTS on the other. The rules are game_state.step(), the
+# headless copy of main()'s loop: check_paddle_collision() bands,
+# bounce_x() speed-up and scoring at +/-380. The API follows gymnasium:
+#
+#     obs, info = env.reset(seed=0)
+#     obs, reward, terminated, truncated, info = env.step(action)
+#
+# - action:      0 = down, 1 = stay, 2 = up (ACTIONS)
+# - observation: OBS_SIZE float32 values seen from the agent's side, so the
+#                same policy can play left or right (OBS_FIELDS)
+# - reward:      +1 when the agent scores, -1 when the opponent does
+# - terminated:  the match was won; truncated: MAX_EPISODE_TICKS reached
+#
+# VectorEnv runs K environments in worker processes. Actions, observations,
+# rewards and done flags live in shared memory (multiprocessing RawArrays
+# viewed as NumPy arrays): each step the trainer writes actions, sends every
+# worker a one-byte command and reads the results in place - nothing is
+# pickled per step. Finished environments reset themselves; the last
+# observation of the finished episode is kept in final_obs.
+#
+# Usage:
+#     python pong_env.py bench --envs 16 --workers 0,1,2,4
+# =============================================================================
+
+import argparse
+import multiprocessing
+import sys
+import time
+from multiprocessing.sharedctypes import RawArray
+
+import numpy as np
+
+import game_state as gs
+from ai_player import LEFT, RIGHT
+from bots import BOTS
+
+# =============================================================================
+# ENVIRONMENT CONSTANTS
+# =============================================================================
+ACTIONS = (gs.MOVE_DOWN, gs.MOVE_NONE, gs.MOVE_UP)  # Action index -> paddle direction
+OBS_FIELDS = ("ball_x", "ball_y", "ball_dx", "ball_dy", "own_y", "opponent_y")
+OBS_SIZE = len(OBS_FIELDS)
+MAX_EPISODE_TICKS = 20_000
+DEFAULT_OPPONENT = "medium"
+X_SCALE = gs.RIGHT_BOUNDARY  # Observation scales (values end up roughly in [-1, 1])
+Y_SCALE = gs.WALL_BOUNDARY
+MOVE_SCALE = gs.INITIAL_MOVE_DISTANCE
+PADDLE_SCALE = gs.SCREEN_TOP_BOUNDARY
+
+# Worker commands (one byte each)
+CMD_STEP = b"s"
+CMD_RESET = b"r"
+CMD_CLOSE = b"c"
+
+
+class PongEnv:
+    """
+    One match: agent paddle against a bot paddle
+    """
+
+    def __init__(self, side=RIGHT, opponent=DEFAULT_OPPONENT, seed=None,
+                 max_ticks=MAX_EPISODE_TICKS, obs_out=None):
+        """
+        Args:
+            side (str): Paddle the agent plays (LEFT or RIGHT)
+            opponent (str): Bot name from bots.BOTS
+            seed (int | None): Seed for the opponent's noise
+            max_ticks (int): Ticks before an episode is truncated
+            obs_out (ndarray | None): float32 array of OBS_SIZE to write
+                                      observations into (VectorEnv rows)
+        """
+        self.side = side
+        self.opponent_name = opponent
+        self.max_ticks = max_ticks
+        self.obs = obs_out if obs_out is not None else np.zeros(OBS_SIZE, dtype=np.float32)
+        self.mirror = 1 if side == RIGHT else -1
+        self.point_for = gs.EVENT_RIGHT_POINT if side == RIGHT else gs.EVENT_LEFT_POINT
+        self.point_against = gs.EVENT_LEFT_POINT if side == RIGHT else gs.EVENT_RIGHT_POINT
+        self.seed = seed
+        self.state = None
+        self.opponent = None
+        self.episodes = 0
+
+    def _observe(self):
+        state, obs, mirror = self.state, self.obs, self.mirror
+        obs[0] = mirror * state.x / X_SCALE
+        obs[1] = state.y / Y_SCALE
+        obs[2] = mirror * state.x_move / MOVE_SCALE
+        obs[3] = state.y_move / MOVE_SCALE
+        own, other = (state.r_y, state.l_y) if self.side == RIGHT else (state.l_y, state.r_y)
+        obs[4] = own / PADDLE_SCALE
+        obs[5] = other / PADDLE_SCALE
+        return obs
+
+    def reset(self, seed=None):
+        """
+        Start a new match
+        Args:
+            seed (int | None): New opponent seed (default: derived from the
+                               constructor seed and the episode count)
+        Returns: Tuple (observation, info)
+        """
+        if seed is not None:
+            self.seed, self.episodes = seed, 0
+        episode_seed = None if self.seed is None else self.seed * 1_000_003 + self.episodes
+        opponent_side = LEFT if self.side == RIGHT else RIGHT
+        self.opponent = BOTS[self.opponent_name](opponent_side, episode_seed)
+        self.state = gs.GameState()
+        self.episodes += 1
+        return self._observe(), {}
+
+    def step(self, action):
+        """
+        Advance the match one tick
+        Args:
+            action (int): Index into ACTIONS
+        Returns: Tuple (observation, reward, terminated, truncated, info)
+        """
+        state = self.state
+        move = ACTIONS[action]
+        other = self.opponent(state)
+        events = gs.step(state, (other, move) if self.side == RIGHT else (move, other))
+        reward = 0.0
+        if events & self.point_for:
+            reward = 1.0
+        elif events & self.point_against:
+            reward = -1.0
+        truncated = not state.game_over and state.tick >= self.max_ticks
+        info = {"events": events}
+        return self._observe(), reward, state.game_over, truncated, info
+
+
+# =============================================================================
+# VECTOR ENVIRONMENT
+# =============================================================================
+
+class _Slots:
+    """
+    NumPy views of the shared arrays (built in the trainer and in each worker)
+    """
+
+    NAMES = (("obs", "f", OBS_SIZE), ("final_obs", "f", OBS_SIZE), ("actions", "b", None),
+             ("rewards", "f", None), ("terminated", "b", None), ("truncated", "b", None),
+             ("episode_return", "f", None), ("episode_length", "i", None))
+    DTYPES = {"f": np.float32, "b": np.int8, "i": np.int32}
+
+    def __init__(self, count, raws=None):
+        """
+        Args:
+            count (int): Environments (rows)
+            raws (dict | None): RawArrays to attach to (None = allocate new ones)
+        """
+        self.raws = raws or {}
+        for name, typecode, width in self.NAMES:
+            shape = (count, width) if width else (count,)
+            if raws is None:
+                self.raws[name] = RawArray(typecode, count * (width or 1))
+            view = np.frombuffer(self.raws[name], dtype=self.DTYPES[typecode]).reshape(shape)
+            setattr(self, name, view)
+
+
+class _EnvRunner:
+    """
+    A block of environments writing into rows [start, stop) of the shared arrays
+    """
+
+    def __init__(self, slots, start, stop, sides, opponent, seed):
+        self.slots = slots
+        self.start = start
+        self.envs = [PongEnv(sides[i % len(sides)], opponent, seed + i,
+                             obs_out=slots.obs[i]) for i in range(start, stop)]
+        self.returns = [0.0] * len(self.envs)
+
+    def reset(self):
+        for env in self.envs:
+            env.reset()
+        self.returns = [0.0] * len(self.envs)
+
+    def step(self):
+        slots, start = self.slots, self.start
+        actions = slots.actions
+        for offset, env in enumerate(self.envs):
+            row = start + offset
+            _, reward, terminated, truncated, _ = env.step(actions[row])
+            slots.rewards[row] = reward
+            slots.terminated[row] = terminated
+            slots.truncated[row] = truncated
+            self.returns[offset] += reward
+            if terminated or truncated:
+                # Auto-reset: keep the finished episode's last view, start the next
+                slots.final_obs[row] = env.obs
+                slots.episode_return[row] = self.returns[offset]
+                slots.episode_length[row] = env.state.tick
+                self.returns[offset] = 0.0
+                env.reset()
+
+
+def _worker(conn, raws, count, start, stop, sides, opponent, seed):
+    """
+    Worker process loop: wait for a command byte, act on the shared arrays, reply
+    """
+    runner = _EnvRunner(_Slots(count, raws), start, stop, sides, opponent, seed)
+    try:
+        while True:
+            command = conn.recv_bytes()
+            if command == CMD_STEP:
+                runner.step()
+            elif command == CMD_RESET:
+                runner.reset()
+            else:
+                break
+            conn.send_bytes(command)
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        conn.close()
+
+
+class VectorEnv:
+    """
+    K PongEnvs stepped together, results in shared-memory NumPy arrays
+
+    After step() the arrays obs, rewards, terminated, truncated (and, for
+    rows that just finished, final_obs, episode_return, episode_length) hold
+    the new values. They are views of shared memory, overwritten by the
+    next step - copy anything that must outlive it.
+    """
+
+    def __init__(self, num_envs, workers=None, opponent=DEFAULT_OPPONENT, seed=0,
+                 sides=(RIGHT, LEFT)):
+        """
+        Args:
+            num_envs (int): Environments (K)
+            workers (int | None): Worker processes (default: CPU count, at
+                                  most num_envs); 0 steps everything in this process
+            opponent (str): Bot name from bots.BOTS
+            seed (int): Environment i uses seed + i
+            sides (tuple): Agent sides, cycled over the environments
+        """
+        if workers is None:
+            workers = min(num_envs, multiprocessing.cpu_count())
+        self.num_envs = num_envs
+        self.slots = _Slots(num_envs)
+        for name, _, _ in _Slots.NAMES:
+            setattr(self, name, getattr(self.slots, name))
+        self.connections = []
+        self.processes = []
+        self.runner = None
+        if workers == 0:
+            self.runner = _EnvRunner(self.slots, 0, num_envs, sides, opponent, seed)
+            return
+        bounds = np.linspace(0, num_envs, min(workers, num_envs) + 1).astype(int)
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_worker, daemon=True,
+                args=(child, self.slots.raws, num_envs, int(start), int(stop), sides, opponent, seed))
+            process.start()
+            child.close()
+            self.connections.append(parent)
+            self.processes.append(process)
+
+    def _broadcast(self, command):
+        for conn in self.connections:
+            conn.send_bytes(command)
+        for conn in self.connections:
+            conn.recv_bytes()
+
+    def reset(self):
+        """
+        Start a new match in every environment
+        Returns: Tuple (obs array, info)
+        """
+        if self.runner:
+            self.runner.reset()
+        else:
+            self._broadcast(CMD_RESET)
+        return self.obs, {}
+
+    def step(self, actions):
+        """
+        Step every environment once (finished ones reset automatically)
+        Args:
+            actions: K action indices
+        Returns: Tuple (obs, rewards, terminated, truncated, info) - shared arrays
+        """
+        self.actions[:] = actions
+        if self.runner:
+            self.runner.step()
+        else:
+            self._broadcast(CMD_STEP)
+        return self.obs, self.rewards, self.terminated, self.truncated, {}
+
+    def close(self):
+        """
+        Stop the worker processes
+        """
+        for conn in self.connections:
+            try:
+                conn.send_bytes(CMD_CLOSE)
+            except OSError:
+                pass
+            conn.close()
+        for process in self.processes:
+            process.join(timeout=5)
+        self.connections, self.processes = [], []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# =============================================================================
+# THROUGHPUT BENCHMARK
+# =============================================================================
+
+def bench(num_envs, worker_counts, steps, opponent):
+    """
+    Environment steps per second at each worker count (random actions)
+    """
+    rng = np.random.default_rng(0)
+    actions = rng.integers(0, len(ACTIONS), size=(steps, num_envs), dtype=np.int8)
+    baseline = None
+    print(f"{'workers':>7} {'steps/s':>10} {'speedup':>8} {'episodes':>9}")
+    for workers in worker_counts:
+        with VectorEnv(num_envs, workers, opponent) as env:
+            env.reset()
+            episodes = 0
+            start = time.perf_counter()
+            for row in actions:
+                _, _, terminated, truncated, _ = env.step(row)
+                episodes += int(np.count_nonzero(terminated) + np.count_nonzero(truncated))
+            rate = steps * num_envs / (time.perf_counter() - start)
+        baseline = baseline or rate
+        label = "in-proc" if workers == 0 else workers
+        print(f"{label:>7} {rate:>10,.0f} {rate / baseline:>7.2f}x {episodes:>9}")
+    print(f"({num_envs} environments, {multiprocessing.cpu_count()} CPUs available)")
+
+
+def main(argv=None):
+    """
+    Command line entry point
+    """
+    parser = argparse.ArgumentParser(description="Pong training environments")
+    sub = parser.add_subparsers(dest="command", required=True)
+    bench_parser = sub.add_parser("bench", help="steps/sec against worker count")
+    bench_parser.add_argument("--envs", type=int, default=16)
+    bench_parser.add_argument("--workers", default="0,1,2,4",
+                              type=lambda text: [int(n) for n in text.split(",")],
+                              help="worker counts (0 = step in this process)")
+    bench_parser.add_argument("--steps", type=int, default=2000)
+    bench_parser.add_argument("--opponent", choices=sorted(BOTS), default=DEFAULT_OPPONENT)
+    args = parser.parse_args(argv)
+
+    bench(args.envs, args.workers, args.steps, args.opponent)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
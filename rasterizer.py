@@ -0,0 +1,292 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Offscreen Rasterizer
+# NEW ADDITION - Draws GameState frames into NumPy arrays, no display needed
+# =============================================================================
+#
+# Training and automated visual checks need pixels, not a Tk window.
+# Rasterizer draws the court into one preallocated uint8 array at any
+# resolution (800x600 or downscaled):
+#
+# - The CenterLine dashes are drawn once into a background buffer.
+# - Score digits come from a glyph atlas built once for the resolution;
+#   they are written into the background only when a score changes.
+# - Every frame, the ball and paddle boxes of the previous frame are
+#   restored from the background and the new ones are written with slice
+#   assignment and np.maximum(..., out=...) - all in place, so rendering a
+#   frame allocates no new arrays.
+#
+# render() returns the same array every time - copy it to keep a frame.
+#
+# Usage:
+#     python rasterizer.py bench --size 800x600 --size 160x120
+#     python rasterizer.py snapshot frame.pgm --ticks 120 --size 400x300
+# =============================================================================
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+import court
+import game_state as gs
+
+# =============================================================================
+# RASTERIZER CONSTANTS
+# =============================================================================
+WHITE = 255
+GLYPH_HEIGHT = 56  # Court pixels - roughly the digit height of Courier 80
+GLYPH_WIDTH = 40
+GLYPH_SPACING = 8
+SCORE_SLOT_DIGITS = 3  # Width cleared around each score when it changes
+BENCH_FRAMES = 5000
+
+# 5x7 bitmap digits, scaled to GLYPH_WIDTH x GLYPH_HEIGHT for the atlas
+DIGIT_BITMAPS = (
+    ("01110", "10001", "10011", "10101", "11001", "10001", "01110"),
+    ("00100", "01100", "00100", "00100", "00100", "00100", "01110"),
+    ("01110", "10001", "00001", "00010", "00100", "01000", "11111"),
+    ("11111", "00010", "00100", "00010", "00001", "10001", "01110"),
+    ("00010", "00110", "01010", "10010", "11111", "00010", "00010"),
+    ("11111", "10000", "11110", "00001", "00001", "10001", "01110"),
+    ("00110", "01000", "10000", "11110", "10001", "10001", "01110"),
+    ("11111", "00001", "00010", "00100", "01000", "01000", "01000"),
+    ("01110", "10001", "10001", "01110", "10001", "10001", "01110"),
+    ("01110", "10001", "10001", "01111", "00001", "00010", "01100"),
+)
+
+
+def glyph_atlas(width, height):
+    """
+    Scale the digit bitmaps to one pixel size (nearest neighbour)
+    Args:
+        width (int): Glyph width in pixels
+        height (int): Glyph height in pixels
+    Returns: uint8 array (10, height, width) of 0 / WHITE
+    """
+    bitmaps = np.array([[[cell == "1" for cell in row] for row in digit]
+                        for digit in DIGIT_BITMAPS], dtype=np.uint8) * WHITE
+    rows = np.arange(height) * bitmaps.shape[1] // height
+    cols = np.arange(width) * bitmaps.shape[2] // width
+    return np.ascontiguousarray(bitmaps[:, rows][:, :, cols])
+
+
+class Rasterizer:
+    """
+    Renders GameState objects into a reused uint8 frame
+    """
+
+    def __init__(self, width=court.SCREEN_WIDTH, height=court.SCREEN_HEIGHT, channels=1):
+        """
+        Args:
+            width (int): Frame width in pixels
+            height (int): Frame height in pixels
+            channels (int): 1 for a (height, width) grey frame, 3 for (height, width, 3)
+        """
+        self.width, self.height = width, height
+        self.scale_x = width / court.SCREEN_WIDTH
+        self.scale_y = height / court.SCREEN_HEIGHT
+        shape = (height, width) if channels == 1 else (height, width, channels)
+        self.frame = np.zeros(shape, dtype=np.uint8)
+        self.background = np.zeros(shape, dtype=np.uint8)
+
+        # Fixed-size sprites so an item never changes size as it moves
+        self.ball_size = self._size(2 * court.BALL_RADIUS, 2 * court.BALL_RADIUS)
+        self.paddle_size = self._size(2 * court.PADDLE_HALF_WIDTH, 2 * court.PADDLE_HALF_HEIGHT)
+        rows, cols = self.ball_size
+        y, x = np.ogrid[:rows, :cols]
+        inside = ((x + 0.5) / cols - 0.5) ** 2 + ((y + 0.5) / rows - 0.5) ** 2 <= 0.25
+        self.ball_sprite = np.zeros(self.ball_size + shape[2:], dtype=np.uint8)
+        self.ball_sprite[inside] = WHITE
+        glyph_rows, glyph_cols = self._size(GLYPH_WIDTH, GLYPH_HEIGHT)
+        self.glyphs = glyph_atlas(glyph_cols, glyph_rows)
+        if channels != 1:
+            self.glyphs = np.repeat(self.glyphs[..., None], channels, axis=3)
+        self.glyph_gap = max(1, round(GLYPH_SPACING * self.scale_x))
+
+        for x, top, bottom in court.center_line_dashes():
+            left, row = self._pixel(x - 1, top)
+            _, end = self._pixel(x, bottom)
+            self.background[max(0, row):end, left:left + max(1, round(2 * self.scale_x))] = WHITE
+
+        # Boxes (row, col, rows, cols) drawn in the last frame: ball, left, right paddle
+        self._drawn = [None, None, None]
+        self._scores = [None, None]
+        self.reset()
+
+    def _size(self, width, height):
+        """
+        Court size -> (rows, cols) in pixels, at least 1x1
+        """
+        return max(1, round(height * self.scale_y)), max(1, round(width * self.scale_x))
+
+    def _pixel(self, x, y):
+        """
+        Court coordinates (y up, origin in the centre) -> (col, row)
+        """
+        return (round((x + court.SCREEN_WIDTH / 2) * self.scale_x),
+                round((court.SCREEN_HEIGHT / 2 - y) * self.scale_y))
+
+    def _clip(self, row, col, rows, cols):
+        """
+        Returns: (frame rows slice, frame cols slice, sprite rows slice, sprite cols slice)
+                 or None when the box is entirely off the frame
+        """
+        top, left = max(row, 0), max(col, 0)
+        bottom, right = min(row + rows, self.height), min(col + cols, self.width)
+        if top >= bottom or left >= right:
+            return None
+        return (slice(top, bottom), slice(left, right),
+                slice(top - row, bottom - row), slice(left - col, right - col))
+
+    def reset(self):
+        """
+        Redraw the whole frame from the background (e.g. after editing it)
+        """
+        np.copyto(self.frame, self.background)
+        self._drawn = [None, None, None]
+
+    def _draw_score(self, score, center_x):
+        """
+        Write a score into the background and frame, centred on center_x
+        """
+        glyph_rows, glyph_cols = self.glyphs.shape[1:3]
+        slot = SCORE_SLOT_DIGITS * glyph_cols + (SCORE_SLOT_DIGITS - 1) * self.glyph_gap
+        center_col, bottom = self._pixel(center_x, court.LEFT_SCORE_POSITION[1])
+        slot_box = self._clip(bottom - glyph_rows, center_col - slot // 2, glyph_rows, slot)
+        if not slot_box:
+            return
+        self.background[slot_box[0], slot_box[1]] = 0
+
+        digits = str(score)
+        col = center_col - (len(digits) * (glyph_cols + self.glyph_gap) - self.glyph_gap) // 2
+        for digit in digits:
+            box = self._clip(bottom - glyph_rows, col, glyph_rows, glyph_cols)
+            if box:
+                rows, cols, sprite_rows, sprite_cols = box
+                self.background[rows, cols] = self.glyphs[int(digit)][sprite_rows, sprite_cols]
+            col += glyph_cols + self.glyph_gap
+        self.frame[slot_box[0], slot_box[1]] = self.background[slot_box[0], slot_box[1]]
+
+    def _erase(self, index):
+        box = self._drawn[index] and self._clip(*self._drawn[index])
+        if box:
+            self.frame[box[0], box[1]] = self.background[box[0], box[1]]
+
+    def _draw_paddle(self, index, x, y):
+        rows, cols = self.paddle_size
+        col, row = self._pixel(x - court.PADDLE_HALF_WIDTH, y + court.PADDLE_HALF_HEIGHT)
+        self._drawn[index] = (row, col, rows, cols)
+        box = self._clip(row, col, rows, cols)
+        if box:
+            self.frame[box[0], box[1]] = WHITE
+
+    def render(self, state):
+        """
+        Draw one GameState
+        Args:
+            state (GameState): State to draw
+        Returns: self.frame (updated in place - copy it to keep this frame)
+        """
+        if state.l_score != self._scores[0]:
+            self._draw_score(state.l_score, court.LEFT_SCORE_POSITION[0])
+            self._scores[0] = state.l_score
+        if state.r_score != self._scores[1]:
+            self._draw_score(state.r_score, court.RIGHT_SCORE_POSITION[0])
+            self._scores[1] = state.r_score
+
+        self._erase(0)
+        self._erase(1)
+        self._erase(2)
+        self._draw_paddle(1, court.LEFT_PADDLE_X, state.l_y)
+        self._draw_paddle(2, court.RIGHT_PADDLE_X, state.r_y)
+
+        rows, cols = self.ball_size
+        col, row = self._pixel(state.x - court.BALL_RADIUS, state.y + court.BALL_RADIUS)
+        self._drawn[0] = (row, col, rows, cols)
+        box = self._clip(row, col, rows, cols)
+        if box:
+            target = self.frame[box[0], box[1]]
+            np.maximum(target, self.ball_sprite[box[2], box[3]], out=target)
+        return self.frame
+
+
+# =============================================================================
+# COMMAND LINE
+# =============================================================================
+
+def _parse_size(text):
+    width, _, height = text.partition("x")
+    return int(width), int(height)
+
+
+def bench(sizes, frames, channels):
+    """
+    Frames per second and array allocations while rendering a bot match
+    """
+    import tracemalloc
+    from ai_player import bot_match_states
+
+    states = bot_match_states(frames)
+    print(f"{'size':>9} {'frames/s':>10} {'us/frame':>9} {'peak alloc':>10}")
+    for width, height in sizes:
+        rasterizer = Rasterizer(width, height, channels)
+        for state in states[:100]:
+            rasterizer.render(state)  # Warm up (scores drawn, caches filled)
+        start = time.perf_counter()
+        for state in states:
+            rasterizer.render(state)
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        for state in states:
+            rasterizer.render(state)
+        peak = tracemalloc.get_traced_memory()[1] - before
+        tracemalloc.stop()
+        print(f"{f'{width}x{height}':>9} {frames / elapsed:>10,.0f} "
+              f"{elapsed / frames * 1e6:>9.1f} {peak:>8} B")
+
+
+def snapshot(path, ticks, size, channels):
+    """
+    Write the frame after `ticks` ticks of an idle match as PGM (grey) or PPM (RGB)
+    """
+    state = gs.GameState()
+    for _ in range(ticks):
+        gs.step(state, (gs.MOVE_NONE, gs.MOVE_NONE))
+    frame = Rasterizer(*size, channels).render(state)
+    magic = b"P5" if channels == 1 else b"P6"
+    with open(path, "wb") as file:
+        file.write(magic + f"\n{size[0]} {size[1]}\n255\n".encode() + frame.tobytes())
+    print(f"wrote {path} (tick {state.tick}, score {state.l_score}-{state.r_score})")
+
+
+def main(argv=None):
+    """
+    Command line entry point
+    """
+    parser = argparse.ArgumentParser(description="Offscreen NumPy renderer")
+    sub = parser.add_subparsers(dest="command", required=True)
+    bench_parser = sub.add_parser("bench", help="frames per second by resolution")
+    bench_parser.add_argument("--size", type=_parse_size, action="append", metavar="WxH")
+    bench_parser.add_argument("--frames", type=int, default=BENCH_FRAMES)
+    snap_parser = sub.add_parser("snapshot", help="write one frame as PGM/PPM")
+    snap_parser.add_argument("path")
+    snap_parser.add_argument("--ticks", type=int, default=100)
+    snap_parser.add_argument("--size", type=_parse_size, default=(court.SCREEN_WIDTH, court.SCREEN_HEIGHT),
+                             metavar="WxH")
+    for sub_parser in (bench_parser, snap_parser):
+        sub_parser.add_argument("--rgb", action="store_true", help="3 channels instead of grey")
+    args = parser.parse_args(argv)
+
+    channels = 3 if args.rgb else 1
+    if args.command == "bench":
+        bench(args.size or [(800, 600), (400, 300), (160, 120), (84, 84)], args.frames, channels)
+    else:
+        snapshot(args.path, args.ticks, args.size, channels)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,302 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Match Replays
+# NEW ADDITION - Compact deterministic match recording and fast playback
+# =============================================================================
+#
+# A match is fully determined by its paddle inputs: the serve logic in
+# Ball.reset_position() has no randomness and game_state.step() reproduces
+# main()'s loop tick for tick. So a replay only stores a seed plus the
+# ticks where a paddle input changed.
+#
+# FILE FORMAT (all integers are unsigned LEB128 varints):
+#     header:  MAGIC, seed
+#     change:  ticks since previous change, input code (0-8)
+#     footer:  ticks since previous change, END_CODE, l_score, r_score
+#
+# The input code packs both paddles: (left + 1) * 3 + (right + 1).
+# Records are appended to the file as they happen, so a recording never
+# builds up in memory, and a crash leaves a readable (footer-less) file.
+#
+# Usage:
+#     python main.py --record match.pong       # record while playing
+#     python replay.py info match.pong
+#     python replay.py verify match.pong       # headless, maximum speed
+#     python replay.py play match.pong         # real time in the Turtle view
+# =============================================================================
+
+import mmap
+import random
+import sys
+import time
+
+import game_state as gs
+
+# =============================================================================
+# REPLAY CONSTANTS
+# =============================================================================
+MAGIC = b"PONGRPL\x01"
+END_CODE = 0xFF
+NO_INPUTS = (gs.MOVE_NONE, gs.MOVE_NONE)
+
+
+class ReplayError(Exception):
+    """Raised when a replay file is malformed"""
+
+
+def encode_varint(value):
+    """
+    Encode a non-negative integer as unsigned LEB128
+    Returns: bytes
+    """
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def decode_varint(buffer, offset):
+    """
+    Decode one unsigned LEB128 integer
+    Args:
+        buffer: bytes-like object (bytes, mmap)
+        offset (int): Position of the first byte
+    Returns: Tuple (value, offset after the varint)
+    """
+    value = 0
+    shift = 0
+    while True:
+        if offset >= len(buffer):
+            raise ReplayError("truncated varint")
+        byte = buffer[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, offset
+        shift += 7
+
+
+def encode_inputs(inputs):
+    """
+    Pack (left, right) directions into one input code (0-8)
+    """
+    left, right = inputs
+    return (left + 1) * 3 + (right + 1)
+
+
+def decode_inputs(code):
+    """
+    Unpack an input code into (left, right) directions
+    """
+    if code > 8:
+        raise ReplayError(f"bad input code {code}")
+    return code // 3 - 1, code % 3 - 1
+
+
+class ReplayRecorder:
+    """
+    Streams a match to disk, one record per paddle input change
+    """
+
+    def __init__(self, path, seed=None):
+        """
+        Create the file and write the header
+
+        Args:
+            path (str): Replay file to create (overwritten if present)
+            seed (int | None): Seed to record; random.seed() is called with it
+                               so anything random in the match is reproducible
+        """
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        random.seed(self.seed)
+        self.file = open(path, "wb")
+        self.file.write(MAGIC + encode_varint(self.seed))
+        self.tick = 0
+        self.last_change = 0
+        self.inputs = NO_INPUTS
+
+    def record(self, inputs):
+        """
+        Call once per tick with the inputs applied that tick
+        Args:
+            inputs (tuple): (left, right) paddle directions
+        """
+        if inputs != self.inputs:
+            self.file.write(encode_varint(self.tick - self.last_change) +
+                            bytes((encode_inputs(inputs),)))
+            self.last_change = self.tick
+            self.inputs = inputs
+        self.tick += 1
+
+    def close(self, l_score, r_score):
+        """
+        Write the footer with the final score and close the file
+        Args:
+            l_score (int): Final left score
+            r_score (int): Final right score
+        """
+        self.file.write(encode_varint(self.tick - self.last_change) + bytes((END_CODE,)) +
+                        encode_varint(l_score) + encode_varint(r_score))
+        self.file.close()
+
+
+class Replay:
+    """
+    Read-only view of a replay file through a memory map
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Replay file to open
+        """
+        with open(path, "rb") as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.data[:len(MAGIC)] != MAGIC:
+            raise ReplayError(f"{path} is not a Pong replay")
+        self.seed, self._body = decode_varint(self.data, len(MAGIC))
+
+        # Filled in by changes() once it reaches the footer
+        self.ticks = None
+        self.final_score = None
+
+    def changes(self):
+        """
+        Decode input changes in order
+        Yields: (tick, (left, right)) for every change
+        """
+        data, offset, tick = self.data, self._body, 0
+        end = len(data)
+        while offset < end:
+            delta, offset = decode_varint(data, offset)
+            if offset >= end:
+                raise ReplayError("truncated record")
+            code = data[offset]
+            offset += 1
+            tick += delta
+            if code == END_CODE:
+                l_score, offset = decode_varint(data, offset)
+                r_score, offset = decode_varint(data, offset)
+                self.ticks = tick
+                self.final_score = (l_score, r_score)
+                return
+            yield tick, decode_inputs(code)
+
+    def inputs_per_tick(self):
+        """
+        Expand the change list into one input pair per tick
+        Yields: (left, right) for every recorded tick
+        """
+        inputs, tick = NO_INPUTS, 0
+        for change_tick, new_inputs in self.changes():
+            while tick < change_tick:
+                yield inputs
+                tick += 1
+            inputs = new_inputs
+        end = self.ticks if self.ticks is not None else tick
+        while tick < end:
+            yield inputs
+            tick += 1
+
+    def close(self):
+        self.data.close()
+
+
+def play_headless(path):
+    """
+    Replay a file as fast as possible with the event-driven engine
+    Args:
+        path (str): Replay file
+    Returns: Tuple (final GameState, Replay) - compare with Replay.final_score
+    """
+    from event_engine import run_schedule
+
+    replay = Replay(path)
+    random.seed(replay.seed)
+    state = gs.GameState()
+    changes = list(replay.changes())
+    limit = replay.ticks if replay.ticks is not None else (changes[-1][0] if changes else 0)
+    run_schedule(state, changes, max_ticks=limit)
+    return state, replay
+
+
+def verify(path):
+    """
+    Replay headless and check the final score against the footer
+    Args:
+        path (str): Replay file
+    Returns: Boolean - True if the replay reproduces the recorded result
+    """
+    state, replay = play_headless(path)
+    replay.close()
+    if replay.final_score is None:
+        print(f"{path}: incomplete recording, replayed {state.tick} ticks "
+              f"to {state.l_score}-{state.r_score}")
+        return False
+    ok = (state.l_score, state.r_score) == replay.final_score and state.tick == replay.ticks
+    print(f"{path}: recorded {replay.final_score[0]}-{replay.final_score[1]} in {replay.ticks} ticks, "
+          f"replayed {state.l_score}-{state.r_score} in {state.tick} ticks -> {'OK' if ok else 'MISMATCH'}")
+    return ok
+
+
+def play_realtime(path):
+    """
+    Watch a replay at the original speed in the Turtle view
+    Args:
+        path (str): Replay file
+    """
+    from main import setup_screen, setup_game_objects, display_winner
+
+    replay = Replay(path)
+    random.seed(replay.seed)
+    screen = setup_screen()
+    r_paddle, l_paddle, ball, scoreboard, center_line = setup_game_objects()
+    center_line.draw()
+
+    state = gs.GameState()
+    for inputs in replay.inputs_per_tick():
+        time.sleep(state.move_speed)
+        screen.update()
+        gs.step(state, inputs)
+        ball.draw_state(state)
+        l_paddle.draw_y(state.l_y)
+        r_paddle.draw_y(state.r_y)
+        scoreboard.draw_state(state)
+
+    if gs.winner(state):
+        display_winner(scoreboard)
+    screen.update()
+    screen.exitonclick()
+    replay.close()
+
+
+def main(argv):
+    """
+    Command line entry point: replay.py (info|verify|play) FILE
+    """
+    if len(argv) != 2 or argv[0] not in ("info", "verify", "play"):
+        print("usage: replay.py (info|verify|play) FILE")
+        return 2
+    command, path = argv
+    if command == "info":
+        replay = Replay(path)
+        changes = sum(1 for _ in replay.changes())
+        print(f"seed={replay.seed} input_changes={changes} ticks={replay.ticks} "
+              f"final_score={replay.final_score} bytes={len(replay.data)}")
+        replay.close()
+    elif command == "verify":
+        start = time.perf_counter()
+        ok = verify(path)
+        print(f"verified in {time.perf_counter() - start:.3f}s")
+        return 0 if ok else 1
+    else:
+        play_realtime(path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,138 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Retained-Mode Renderer
+# NEW ADDITION - Persistent canvas items that are only touched when they change
+# =============================================================================
+#
+# Scoreboard.update_scoreboard() calls clear() and write() on every point,
+# which deletes and recreates Tk text items, and screen.update() walks
+# every turtle each frame whether it moved or not.
+#
+# RetainedRenderer creates one canvas item per ball, paddle, score and
+# centre-line dash up front. Each frame it compares the GameState with what
+# is already on the canvas, moves items with coords() or changes text with
+# itemconfigure() only where something changed, and skips the redraw
+# entirely when nothing did. The canvas item count therefore stays constant
+# for the whole session (see item_count()).
+#
+# Works on the turtle Screen's canvas or on a plain tkinter.Canvas.
+# =============================================================================
+
+import court
+
+# =============================================================================
+# RENDERER CONSTANTS
+# =============================================================================
+TEXT_ANCHOR = "s"  # turtle.write(align="center") anchors text at its bottom
+
+
+class RetainedRenderer:
+    """
+    Draws GameState objects with a fixed set of persistent canvas items
+    """
+
+    def __init__(self, canvas, update=None, origin=(0, 0)):
+        """
+        Create every canvas item once
+
+        Args:
+            canvas: tkinter Canvas (or the turtle Screen's canvas)
+            update: Callable that presents a frame (defaults to canvas.update_idletasks)
+            origin (tuple): Canvas coordinates of the court centre - (0, 0) on
+                            the turtle canvas, (width / 2, height / 2) on a raw Canvas
+        """
+        self.canvas = canvas
+        self.update = update if update is not None else canvas.update_idletasks
+        self.origin_x, self.origin_y = origin
+        self.frames_drawn = 0
+        self.frames_skipped = 0
+
+        for x, top, bottom in court.center_line_dashes():
+            canvas.create_line(*self._point(x, top), *self._point(x, bottom),
+                               fill=court.LINE_COLOR)
+        self.l_paddle = canvas.create_rectangle(
+            *self._rect(court.paddle_rect(court.LEFT_PADDLE_X, 0)),
+            fill=court.PADDLE_COLOR, outline="")
+        self.r_paddle = canvas.create_rectangle(
+            *self._rect(court.paddle_rect(court.RIGHT_PADDLE_X, 0)),
+            fill=court.PADDLE_COLOR, outline="")
+        self.ball = canvas.create_oval(*self._rect(court.ball_rect(0, 0)),
+                                       fill=court.BALL_COLOR, outline="")
+        self.l_score = canvas.create_text(*self._point(*court.LEFT_SCORE_POSITION), text="0",
+                                          anchor=TEXT_ANCHOR, fill=court.SCORE_COLOR,
+                                          font=court.SCORE_FONT)
+        self.r_score = canvas.create_text(*self._point(*court.RIGHT_SCORE_POSITION), text="0",
+                                          anchor=TEXT_ANCHOR, fill=court.SCORE_COLOR,
+                                          font=court.SCORE_FONT)
+        self.winner = canvas.create_text(*self._point(*court.WINNER_POSITION), text="",
+                                         anchor=TEXT_ANCHOR, fill=court.WINNER_COLOR,
+                                         font=court.WINNER_FONT)
+
+        # What is currently on the canvas: ball x/y, paddle y's, scores
+        self._shown = [0, 0, 0, 0, 0, 0]
+
+    def _point(self, x, y):
+        """
+        Convert world coordinates (y up) to canvas coordinates (y down)
+        """
+        return self.origin_x + x, self.origin_y - y
+
+    def _rect(self, box):
+        """
+        Convert a (left, bottom, right, top) world box to canvas coords
+        """
+        left, bottom, right, top = box
+        return self.origin_x + left, self.origin_y - top, self.origin_x + right, self.origin_y - bottom
+
+    def render(self, state):
+        """
+        Bring the canvas in line with a GameState, touching only what changed
+        Args:
+            state (GameState): State to display
+        Returns: Boolean - True if anything was redrawn
+        """
+        shown = self._shown
+        canvas = self.canvas
+        dirty = False
+
+        if state.x != shown[0] or state.y != shown[1]:
+            canvas.coords(self.ball, *self._rect(court.ball_rect(state.x, state.y)))
+            shown[0], shown[1] = state.x, state.y
+            dirty = True
+        if state.l_y != shown[2]:
+            canvas.coords(self.l_paddle, *self._rect(court.paddle_rect(court.LEFT_PADDLE_X, state.l_y)))
+            shown[2] = state.l_y
+            dirty = True
+        if state.r_y != shown[3]:
+            canvas.coords(self.r_paddle, *self._rect(court.paddle_rect(court.RIGHT_PADDLE_X, state.r_y)))
+            shown[3] = state.r_y
+            dirty = True
+        if state.l_score != shown[4]:
+            canvas.itemconfigure(self.l_score, text=str(state.l_score))
+            shown[4] = state.l_score
+            dirty = True
+        if state.r_score != shown[5]:
+            canvas.itemconfigure(self.r_score, text=str(state.r_score))
+            shown[5] = state.r_score
+            dirty = True
+
+        if dirty:
+            self.update()
+            self.frames_drawn += 1
+        else:
+            self.frames_skipped += 1
+        return dirty
+
+    def display_winner(self, winner):
+        """
+        Show the same announcement as Scoreboard.display_winner()
+        Args:
+            winner (str): Name of the winning player
+        """
+        self.canvas.itemconfigure(self.winner, text=f"🏆 {winner} WINS! 🏆\nClick to exit")
+        self.update()
+
+    def item_count(self):
+        """
+        Returns: Number of items on the canvas (constant after __init__)
+        """
+        return len(self.canvas.find_all())
@@ -0,0 +1,354 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Instant Rewind
+# NEW ADDITION - Pause, scrub back through recent ticks and resume from any
+# =============================================================================
+#
+# RewindBuffer keeps the last `capacity` ticks of a live match in memory
+# that is allocated once, so a session of any length uses the same amount:
+#
+# - Most ticks are stored as a 9-byte delta record against the tick before:
+#   a flags byte plus int16 moves of the ball and both paddles. The flags
+#   say whether x_move / y_move flipped sign, how move_speed changed
+#   (unchanged, sped up by a paddle hit, reset, or reset and sped up by a
+#   serve) and which player scored.
+# - Every KEYFRAME_INTERVAL ticks, and whenever a tick does not fit the
+#   delta format, the full state goes to a separate keyframe ring instead.
+#
+# Both rings are fixed-size bytearrays. Rebuilding any stored tick decodes
+# its nearest keyframe and applies fewer than KEYFRAME_INTERVAL deltas, so
+# scrubbing never replays the match from the start. The encoder checks
+# that every delta reproduces the state exactly, so a match resumed from a
+# rewound tick continues from the same numbers the game had.
+#
+# RewindControl binds the keys in main(): Space pauses, Left / Right step
+# back and forward through the buffer (redrawing the Ball, Paddle and
+# Scoreboard views at once) and Space again resumes play from the tick on
+# screen - the ticks after it are dropped.
+#
+# Usage:
+#     python main.py --rewind 30        # keep (at least) the last 30 seconds
+# =============================================================================
+
+import math
+import struct
+import time
+from array import array
+
+import game_state as gs
+
+# =============================================================================
+# REWIND CONSTANTS
+# =============================================================================
+REWIND_SECONDS = 30
+TICKS_PER_SECOND = 50  # Capacity per second - covers ticks down to 20 ms of sleep
+KEYFRAME_INTERVAL = 64  # Ticks between regular keyframes (restore cost)
+KEYFRAME_SLACK = 16  # Extra keyframe slots for ticks stored as forced keyframes
+
+# Controls
+PAUSE_KEY = "space"
+BACK_KEY = "Left"
+FORWARD_KEY = "Right"
+SCRUB_TICKS = 5  # Ticks moved per key press
+IDLE_SECONDS = 0.02  # Screen refresh interval while paused
+
+# Record layouts
+DELTA = struct.Struct("<Bhhhh")  # flags, dx, dy, d l_y, d r_y
+KEYFRAME = struct.Struct("<7d2iI?")  # GameState fields in __slots__ order
+SMALL_MIN = -32768
+SMALL_MAX = 32767
+
+# Delta flags
+KEY = 0x01  # Full state is in the keyframe ring (dx holds its slot)
+FLIP_X = 0x02
+FLIP_Y = 0x04
+SPEED_SHIFT = 3  # Two bits: index into _speed_candidates()
+SPEED_MASK = 0x18
+LEFT_POINT = 0x20
+RIGHT_POINT = 0x40
+
+
+def _speed_candidates(move_speed):
+    """
+    The move_speed values one tick of main() can produce from `move_speed`
+    (same order as the two speed bits of a delta record)
+    """
+    return (move_speed,
+            move_speed * gs.SPEED_INCREASE_FACTOR,  # Paddle hit
+            gs.INITIAL_MOVE_SPEED,
+            gs.INITIAL_MOVE_SPEED * gs.SPEED_INCREASE_FACTOR)  # Point: reset + serve
+
+
+def _small_step(before, after):
+    """
+    Returns: int16 d with before + d == after exactly, or None
+    """
+    step = after - before
+    if step != int(step) or not SMALL_MIN <= step <= SMALL_MAX:
+        return None
+    step = int(step)
+    return step if before + step == after else None
+
+
+def capacity_for(seconds):
+    """
+    Returns: Buffer capacity in ticks that holds at least `seconds` of play
+             while main() sleeps 1 / TICKS_PER_SECOND or more per tick
+             (plus one keyframe interval, which is freed as a unit)
+    """
+    return math.ceil(seconds * TICKS_PER_SECOND) + KEYFRAME_INTERVAL
+
+
+class RewindBuffer:
+    """
+    Fixed-memory history of the most recent GameStates, newest last
+
+    Stored ticks are addressed by how far back they are: state(0) is the
+    newest, state(len(buffer) - 1) the oldest. When the buffer is full the
+    oldest keyframe and its deltas are freed together, so between
+    capacity - keyframe_interval and capacity ticks stay available.
+    """
+
+    def __init__(self, capacity=None, keyframe_interval=KEYFRAME_INTERVAL):
+        """
+        Args:
+            capacity (int): Most ticks to keep (default: capacity_for(REWIND_SECONDS))
+            keyframe_interval (int): Ticks between regular keyframes
+        """
+        capacity = capacity or capacity_for(REWIND_SECONDS)
+        self.capacity = capacity
+        self.keyframe_interval = keyframe_interval
+        self.keyframe_slots = capacity // keyframe_interval + KEYFRAME_SLACK
+        self.deltas = bytearray(capacity * DELTA.size)
+        self.keyframes = bytearray(self.keyframe_slots * KEYFRAME.size)
+        self.keyframe_records = array("q", bytes(8 * self.keyframe_slots))
+        self.first = 0  # Record number of the oldest stored tick (always a keyframe)
+        self.end = 0  # Record number after the newest tick
+        self.first_keyframe = 0  # Keyframe number of the oldest usable keyframe
+        self.keyframe_count = 0
+        self._last = None  # Newest state, the base for the next delta
+        self._since_keyframe = 0
+
+    def __len__(self):
+        return self.end - self.first
+
+    def nbytes(self):
+        """
+        Returns: Bytes of record storage (fixed at construction)
+        """
+        return len(self.deltas) + len(self.keyframes) + self.keyframe_records.itemsize * self.keyframe_slots
+
+    # =========================================================================
+    # RECORDING
+    # =========================================================================
+
+    def push(self, state):
+        """
+        Store the state of the tick that just finished
+        Args:
+            state (GameState): The newest tick (copied, not kept)
+        """
+        if self.end - self.first == self.capacity:
+            self._drop_oldest()
+        flags = None
+        if self.end > self.first and self._since_keyframe + 1 < self.keyframe_interval:
+            flags, steps = self._encode_delta(self._last, state)
+        offset = (self.end % self.capacity) * DELTA.size
+        if flags is None:
+            slot = self._push_keyframe(state)
+            DELTA.pack_into(self.deltas, offset, KEY, slot, 0, 0, 0)
+            self._since_keyframe = 0
+        else:
+            DELTA.pack_into(self.deltas, offset, flags, *steps)
+            self._since_keyframe += 1
+        self.end += 1
+        self._last = state.copy()
+
+    def _encode_delta(self, prev, state):
+        """
+        Returns: (flags, (dx, dy, dl, dr)) reproducing `state` from `prev`,
+                 or (None, None) when it needs a keyframe
+        """
+        if state.tick != prev.tick + 1 or state.game_over != prev.game_over:
+            return None, None
+        steps = (_small_step(prev.x, state.x), _small_step(prev.y, state.y),
+                 _small_step(prev.l_y, state.l_y), _small_step(prev.r_y, state.r_y))
+        if None in steps:
+            return None, None
+
+        flags = 0
+        for flag, before, after in ((FLIP_X, prev.x_move, state.x_move),
+                                    (FLIP_Y, prev.y_move, state.y_move)):
+            if after != before:
+                if after != -before:
+                    return None, None
+                flags |= flag
+        try:
+            flags |= _speed_candidates(prev.move_speed).index(state.move_speed) << SPEED_SHIFT
+        except ValueError:
+            return None, None
+        for flag, before, after in ((LEFT_POINT, prev.l_score, state.l_score),
+                                    (RIGHT_POINT, prev.r_score, state.r_score)):
+            if after == before + 1:
+                flags |= flag
+            elif after != before:
+                return None, None
+        return flags, steps
+
+    def _push_keyframe(self, state):
+        """
+        Returns: Keyframe ring slot the state was written to
+        """
+        if self.keyframe_count - self.first_keyframe == self.keyframe_slots:
+            # Ring full: the ticks up to the next keyframe can no longer be rebuilt
+            self.first_keyframe += 1
+            self.first = self.keyframe_records[self.first_keyframe % self.keyframe_slots]
+        slot = self.keyframe_count % self.keyframe_slots
+        KEYFRAME.pack_into(self.keyframes, slot * KEYFRAME.size,
+                           *(getattr(state, name) for name in gs.GameState.__slots__))
+        self.keyframe_records[slot] = self.end
+        self.keyframe_count += 1
+        if self.keyframe_count - self.first_keyframe == 1:
+            self.first = self.end
+        return slot
+
+    def _drop_oldest(self):
+        """
+        Free the oldest record - and the ticks after it up to the next keyframe,
+        which need it to be rebuilt
+        """
+        self.first_keyframe += 1
+        if self.first_keyframe == self.keyframe_count:
+            self.first = self.end  # Empty - the next push starts with a keyframe
+        else:
+            self.first = self.keyframe_records[self.first_keyframe % self.keyframe_slots]
+
+    # =========================================================================
+    # RESTORING
+    # =========================================================================
+
+    def state(self, back=0):
+        """
+        Rebuild a stored tick
+        Args:
+            back (int): Ticks before the newest (0 = newest)
+        Returns: New GameState
+        """
+        if not 0 <= back < len(self):
+            raise IndexError(f"only {len(self)} ticks stored")
+        target = self.end - 1 - back
+        record = target
+        while not self.deltas[(record % self.capacity) * DELTA.size] & KEY:
+            record -= 1
+
+        _, slot, _, _, _ = DELTA.unpack_from(self.deltas, (record % self.capacity) * DELTA.size)
+        state = gs.GameState()
+        for name, value in zip(gs.GameState.__slots__,
+                               KEYFRAME.unpack_from(self.keyframes, slot * KEYFRAME.size)):
+            setattr(state, name, value)
+        for record in range(record + 1, target + 1):
+            flags, dx, dy, dl, dr = DELTA.unpack_from(self.deltas,
+                                                      (record % self.capacity) * DELTA.size)
+            state.x += dx
+            state.y += dy
+            state.l_y += dl
+            state.r_y += dr
+            if flags & FLIP_X:
+                state.x_move = -state.x_move
+            if flags & FLIP_Y:
+                state.y_move = -state.y_move
+            state.move_speed = _speed_candidates(state.move_speed)[(flags & SPEED_MASK) >> SPEED_SHIFT]
+            if flags & LEFT_POINT:
+                state.l_score += 1
+            if flags & RIGHT_POINT:
+                state.r_score += 1
+            state.tick += 1
+        return state
+
+    def truncate(self, back):
+        """
+        Drop the `back` newest ticks so recording continues after an older one
+        Args:
+            back (int): Ticks to drop (the tick `back` ticks ago becomes the newest)
+        """
+        if not 0 <= back < len(self):
+            raise IndexError(f"only {len(self)} ticks stored")
+        if not back:
+            return
+        self.end -= back
+        while self.keyframe_records[(self.keyframe_count - 1) % self.keyframe_slots] >= self.end:
+            self.keyframe_count -= 1
+        self._since_keyframe = self.end - 1 - self.keyframe_records[
+            (self.keyframe_count - 1) % self.keyframe_slots]
+        self._last = self.state(0)
+
+
+class RewindControl:
+    """
+    Pause / scrub / resume key handlers for main()'s Turtle views
+    """
+
+    def __init__(self, buffer, ball, l_paddle, r_paddle, scoreboard):
+        """
+        Args:
+            buffer (RewindBuffer): History filled by main() once per tick
+            ball, l_paddle, r_paddle, scoreboard: Objects from setup_game_objects()
+        """
+        self.buffer = buffer
+        self.ball = ball
+        self.l_paddle = l_paddle
+        self.r_paddle = r_paddle
+        self.scoreboard = scoreboard
+        self.paused = False
+        self.back = 0  # Ticks behind the newest while paused
+
+    def bind(self, screen):
+        """
+        Register the rewind keys on the screen
+        """
+        screen.onkey(self.toggle_pause, PAUSE_KEY)
+        screen.onkey(self.step_back, BACK_KEY)
+        screen.onkey(self.step_forward, FORWARD_KEY)
+
+    def toggle_pause(self):
+        """
+        Key handler: pause, or resume from the tick on screen
+        """
+        if len(self.buffer):
+            self.paused = not self.paused
+
+    def step_back(self):
+        """
+        Key handler: show an older tick while paused
+        """
+        if self.paused:
+            self._show(min(self.back + SCRUB_TICKS, len(self.buffer) - 1))
+
+    def step_forward(self):
+        """
+        Key handler: show a newer tick while paused
+        """
+        if self.paused:
+            self._show(max(self.back - SCRUB_TICKS, 0))
+
+    def _show(self, back):
+        self.back = back
+        state = self.buffer.state(back)
+        self.ball.draw_state(state)
+        self.l_paddle.draw_y(state.l_y)
+        self.r_paddle.draw_y(state.r_y)
+        self.scoreboard.draw_state(state)
+
+    def hold(self, screen):
+        """
+        Keep the window responsive while paused
+        Args:
+            screen: Game screen object
+        Returns: Tick number play resumes after
+        """
+        while self.paused:
+            screen.update()
+            time.sleep(IDLE_SECONDS)
+        self.buffer.truncate(self.back)
+        self.back = 0
+        return self.buffer.state(0).tick
+
@@ -76,6 +76,19 @@ class Scoreboard(Turtle):
         self.r_score += 1
         self.update_scoreboard()
 
+    def draw_state(self, state):
+        """
+        ADDED: Show the scores from a headless GameState
+        Only rewrites the text when a score actually changed
+
+        Args:
+            state (GameState): Simulation state to display
+        """
+        if self.l_score != state.l_score or self.r_score != state.r_score:
+            self.l_score = state.l_score
+            self.r_score = state.r_score
+            self.update_scoreboard()
+
     def display_winner(self, winner):
         """
         ADDED: Display the winner announcement with trophy emojis
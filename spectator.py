@@ -0,0 +1,454 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Spectator Broadcast
+# NEW ADDITION - Live match streaming to many viewers with asyncio
+# =============================================================================
+#
+# The game loop publishes its state once per tick (after ball.move() and
+# any score change). A Broadcaster fans that out over TCP:
+#
+# - A viewer that connects gets one full snapshot, then only deltas
+#   (state_codec) against the last state it was sent - usually 10-12 bytes.
+# - Each viewer's queue is bounded: the socket's write buffer is capped at
+#   QUEUE_BYTES and when it is full the viewer is paused. While paused only
+#   the newest state is kept, so a slow viewer skips intermediate frames and
+#   catches up with one delta instead of using more memory.
+# - Frames are encoded once per (base, state) pair, so all viewers that keep
+#   up share the same bytes and one publish costs one write per viewer.
+#
+# Broadcaster runs its asyncio loop in a background thread so the
+# synchronous Turtle game loop only pays for capturing its state per tick.
+#
+# Usage:
+#     python main.py --broadcast 8765                   # play and broadcast
+#     python spectator.py watch localhost:8765          # watch in a Turtle window
+#     python spectator.py serve --demo --port 8765      # headless bot match feed
+#     python spectator.py loadtest --clients 2000       # many local viewers
+# =============================================================================
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import time
+
+import game_state as gs
+import state_codec
+
+# =============================================================================
+# BROADCAST CONSTANTS
+# =============================================================================
+DEFAULT_PORT = 8765
+QUEUE_BYTES = 4096  # Write buffer per viewer before it counts as slow
+BACKLOG = 1024  # Pending connections the server accepts at once
+START_TIMEOUT = 10.0  # Load test: longest wait for every viewer to join the demo
+FRAME_HEADER = struct.Struct("<HB")  # payload length, frame type
+FULL = 1
+DELTA = 2
+
+
+def _frame(kind, payload):
+    return FRAME_HEADER.pack(len(payload), kind) + payload
+
+
+# =============================================================================
+# SERVER
+# =============================================================================
+
+class _Viewer(asyncio.Protocol):
+    """
+    One connected spectator
+    """
+
+    def __init__(self, broadcaster):
+        self.broadcaster = broadcaster
+        self.transport = None
+        self.last = None  # (serial, state) last written to this viewer
+        self.pending = None  # Newest (serial, state) held back while paused
+        self.paused = False
+
+    def connection_made(self, transport):
+        self.transport = transport
+        transport.set_write_buffer_limits(high=QUEUE_BYTES)
+        self.broadcaster._join(self)
+
+    def connection_lost(self, exc):
+        self.broadcaster._leave(self)
+
+    def data_received(self, data):
+        pass  # Viewers only listen
+
+    def pause_writing(self):
+        self.paused = True
+
+    def resume_writing(self):
+        self.paused = False
+        if self.pending is not None:
+            entry, self.pending = self.pending, None
+            self.broadcaster._send(self, entry)
+
+
+class Broadcaster:
+    """
+    Fans out published GameStates to every connected viewer
+    """
+
+    def __init__(self, host="0.0.0.0", port=DEFAULT_PORT):
+        """
+        Args:
+            host (str): Interface to listen on
+            port (int): TCP port (0 picks a free one, see self.port)
+        """
+        self.host = host
+        self.port = port
+        self.viewers = set()
+        self.latest = None
+        self.serial = 0
+        self._cache = {}
+        self.server = None
+        self.loop = None
+        self._thread = None
+
+        # Stats
+        self.published = 0
+        self.frames_sent = 0
+        self.bytes_sent = 0
+        self.frames_dropped = 0
+        self.peak_viewers = 0
+
+    async def start_server(self):
+        """
+        Start listening on the current event loop
+        """
+        self.loop = asyncio.get_running_loop()
+        self.server = await self.loop.create_server(lambda: _Viewer(self), self.host, self.port,
+                                                  backlog=BACKLOG)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    def start(self):
+        """
+        Run the server on its own event loop in a daemon thread
+        Returns: self (once the server is listening)
+        """
+        ready = threading.Event()
+
+        def run():
+            loop = asyncio.new_event_loop()
+            loop.run_until_complete(self.start_server())
+            ready.set()
+            loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name="spectator-broadcast", daemon=True)
+        self._thread.start()
+        ready.wait()
+        return self
+
+    def publish(self, state):
+        """
+        Thread-safe: queue state for every viewer
+        Args:
+            state (GameState): State after this tick - hand over a fresh
+                               object (e.g. from capture_state()), it must not
+                               be changed afterwards
+        """
+        self.loop.call_soon_threadsafe(self.publish_now, state)
+
+    def publish_now(self, state):
+        """
+        Send state to every viewer - call from the server's event loop
+        The state object must not be changed afterwards
+        """
+        self.serial += 1
+        self.published += 1
+        self.latest = entry = (self.serial, state)
+        self._cache.clear()
+        for viewer in self.viewers:
+            if viewer.paused:
+                if viewer.pending is not None:
+                    self.frames_dropped += 1
+                viewer.pending = entry
+            else:
+                self._send(viewer, entry)
+
+    def _encoded(self, base, entry):
+        """
+        Frame bytes for entry as seen by a viewer that last got base
+        """
+        key = (base[0] if base else None, entry[0])
+        frame = self._cache.get(key)
+        if frame is None:
+            if base is None:
+                frame = _frame(FULL, state_codec.encode(entry[1]))
+            else:
+                frame = _frame(DELTA, state_codec.encode(entry[1], base[1]))
+            self._cache[key] = frame
+        return frame
+
+    def _send(self, viewer, entry):
+        frame = self._encoded(viewer.last, entry)
+        viewer.transport.write(frame)
+        viewer.last = entry
+        self.frames_sent += 1
+        self.bytes_sent += len(frame)
+
+    def _join(self, viewer):
+        self.viewers.add(viewer)
+        self.peak_viewers = max(self.peak_viewers, len(self.viewers))
+        if self.latest is not None:
+            self._send(viewer, self.latest)  # Late joiner: full snapshot
+
+    def _leave(self, viewer):
+        self.viewers.discard(viewer)
+
+    def close(self):
+        """
+        Stop listening and disconnect every viewer - call from the event loop
+        """
+        self.server.close()
+        for viewer in list(self.viewers):
+            viewer.transport.close()
+
+    def stats(self):
+        """
+        Returns: Dictionary of broadcast counters
+        """
+        return {
+            "published": self.published,
+            "frames_sent": self.frames_sent,
+            "bytes_sent": self.bytes_sent,
+            "frames_dropped": self.frames_dropped,
+            "viewers": len(self.viewers),
+            "peak_viewers": self.peak_viewers,
+        }
+
+
+# =============================================================================
+# VIEWER CLIENTS
+# =============================================================================
+
+class FrameDecoder:
+    """
+    Turns a TCP byte stream back into GameStates
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.state = None
+
+    def feed(self, data):
+        """
+        Add received bytes
+        Returns: List of GameStates completed by this data
+        """
+        self.buffer += data
+        states = []
+        offset = 0
+        while len(self.buffer) - offset >= FRAME_HEADER.size:
+            length, kind = FRAME_HEADER.unpack_from(self.buffer, offset)
+            end = offset + FRAME_HEADER.size + length
+            if end > len(self.buffer):
+                break
+            payload = bytes(self.buffer[offset + FRAME_HEADER.size:end])
+            self.state = state_codec.decode(payload, None if kind == FULL else self.state)
+            states.append(self.state)
+            offset = end
+        del self.buffer[:offset]
+        return states
+
+
+def watch(host, port):
+    """
+    Render a broadcast in a Turtle window with the game's own classes
+    Args:
+        host (str): Broadcaster address
+        port (int): Broadcaster port
+    """
+    from main import setup_screen, setup_game_objects, display_winner
+
+    screen = setup_screen()
+    screen.title("Enhanced Pong Game - spectator")
+    r_paddle, l_paddle, ball, scoreboard, center_line = setup_game_objects()
+    center_line.draw()
+    screen.update()
+
+    decoder = FrameDecoder()
+    with socket.create_connection((host, port)) as sock:
+        while True:
+            data = sock.recv(65536)
+            if not data:
+                break
+            states = decoder.feed(data)
+            if not states:
+                continue
+            state = states[-1]  # Only draw the newest
+            ball.draw_state(state)
+            l_paddle.draw_y(state.l_y)
+            r_paddle.draw_y(state.r_y)
+            scoreboard.draw_state(state)
+            if state.game_over:
+                display_winner(scoreboard)
+                screen.update()
+                break
+            screen.update()
+    screen.exitonclick()
+
+
+class _LoadClient(asyncio.Protocol):
+    """
+    Headless viewer used by the load test
+    """
+
+    def __init__(self, results):
+        self.decoder = FrameDecoder()
+        self.results = results
+        self.frames = 0
+        self.skipped_ticks = 0
+        self.last_tick = None
+
+    def data_received(self, data):
+        for state in self.decoder.feed(data):
+            self.frames += 1
+            if self.last_tick is not None and state.tick > self.last_tick + 1:
+                self.skipped_ticks += state.tick - self.last_tick - 1
+            self.last_tick = state.tick
+
+    def connection_lost(self, exc):
+        self.results.append((self.frames, self.skipped_ticks))
+
+
+# =============================================================================
+# DEMO FEED AND LOAD TEST
+# =============================================================================
+
+async def serve_demo(port, seconds, time_scale, wait_start=False):
+    """
+    Broadcast back-to-back bot matches at game speed
+    Args:
+        port (int): TCP port (0 = any, printed on stdout)
+        seconds (float): Stop after this long (0 = forever)
+        time_scale (float): Tick interval is move_speed * time_scale
+        wait_start (bool): Start the matches (and the clock) only after a
+                           "start N" line on stdin and N viewers have joined
+    Returns: Stats dictionary including server CPU use
+    """
+    from ai_player import PredictiveAI, LEFT, RIGHT
+
+    broadcaster = Broadcaster(port=port)
+    await broadcaster.start_server()
+    print(f"listening {broadcaster.port}", flush=True)
+    if wait_start:
+        line = await asyncio.get_running_loop().run_in_executor(None, sys.stdin.readline)
+        expected = int(line.split()[1]) if line.strip() else 0
+        deadline = time.perf_counter() + START_TIMEOUT
+        while len(broadcaster.viewers) < expected and time.perf_counter() < deadline:
+            await asyncio.sleep(0.01)
+
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    next_tick = wall_start
+    match = 0
+    while not seconds or time.perf_counter() - wall_start < seconds:
+        state = gs.GameState()
+        left = PredictiveAI(LEFT, "hard", seed=match)
+        right = PredictiveAI(RIGHT, "hard", seed=match + 1)
+        match += 2
+        while not state.game_over and (not seconds or time.perf_counter() - wall_start < seconds):
+            gs.step(state, (left.move_for_state(state), right.move_for_state(state)))
+            broadcaster.publish_now(state.copy())
+            next_tick += state.move_speed * time_scale
+            await asyncio.sleep(max(0.0, next_tick - time.perf_counter()))
+
+    stats = broadcaster.stats()
+    wall = time.perf_counter() - wall_start
+    stats["seconds"] = wall
+    stats["server_cpu_percent"] = 100 * (time.process_time() - cpu_start) / wall
+    stats["ticks_per_sec"] = stats["published"] / wall
+    broadcaster.close()
+    return stats
+
+
+async def load_test(clients, seconds, time_scale):
+    """
+    Start a demo server in a subprocess and connect many viewers to it
+    The viewers connect concurrently and the server's timed run only
+    starts once they have all joined, so every one sees the whole run
+
+    Returns: Report dictionary
+    """
+    server = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "serve", "--demo", "--port", "0",
+         "--seconds", str(seconds), "--time-scale", str(time_scale), "--json", "--wait-start"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+    port = int(server.stdout.readline().split()[1])
+
+    loop = asyncio.get_running_loop()
+    results = []
+    start = time.perf_counter()
+    outcomes = await asyncio.gather(
+        *(loop.create_connection(lambda: _LoadClient(results), "127.0.0.1", port)
+          for _ in range(clients)),
+        return_exceptions=True)
+    connected = sum(not isinstance(outcome, BaseException) for outcome in outcomes)
+    connect_seconds = time.perf_counter() - start
+    server.stdin.write(f"start {connected}\n")
+    server.stdin.flush()
+
+    while len(results) < connected:  # Server closes every connection when it stops
+        await asyncio.sleep(0.1)
+    stats = json.loads(server.stdout.readline())
+    server.wait()
+
+    frames = sorted(result[0] for result in results) or [0]
+    return {
+        "clients": connected,
+        "connect_seconds": connect_seconds,
+        "server": stats,
+        "frames_per_client_min": frames[0],
+        "frames_per_client_median": frames[len(frames) // 2],
+        "skipped_ticks_total": sum(result[1] for result in results),
+        "frames_per_sec_delivered": stats["frames_sent"] / stats["seconds"],
+        "bytes_per_frame": stats["bytes_sent"] / max(1, stats["frames_sent"]),
+    }
+
+
+def main(argv=None):
+    """
+    Command line entry point
+    """
+    parser = argparse.ArgumentParser(description="Pong spectator broadcast")
+    sub = parser.add_subparsers(dest="mode", required=True)
+    watch_parser = sub.add_parser("watch", help="watch a broadcast")
+    watch_parser.add_argument("address", help="HOST:PORT of the broadcaster")
+    serve_parser = sub.add_parser("serve", help="broadcast a headless bot match")
+    serve_parser.add_argument("--demo", action="store_true", required=True)
+    serve_parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    serve_parser.add_argument("--seconds", type=float, default=0)
+    serve_parser.add_argument("--json", action="store_true", help="print stats as JSON")
+    serve_parser.add_argument("--wait-start", action="store_true",
+                              help="wait for 'start N' on stdin and N viewers (used by loadtest)")
+    load_parser = sub.add_parser("loadtest", help="many local viewers against a demo server")
+    load_parser.add_argument("--clients", type=int, default=1000)
+    load_parser.add_argument("--seconds", type=float, default=10)
+    for sub_parser in (serve_parser, load_parser):
+        sub_parser.add_argument("--time-scale", type=float, default=1.0,
+                                help="tick interval multiplier (1.0 = real speed)")
+    args = parser.parse_args(argv)
+
+    if args.mode == "watch":
+        host, _, port = args.address.rpartition(":")
+        watch(host or "localhost", int(port))
+    elif args.mode == "serve":
+        stats = asyncio.run(serve_demo(args.port, args.seconds, args.time_scale,
+                                       args.wait_start))
+        print(json.dumps(stats) if args.json else stats, flush=True)
+    else:
+        report = asyncio.run(load_test(args.clients, args.seconds, args.time_scale))
+        print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
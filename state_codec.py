@@ -0,0 +1,119 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: GameState Wire Format
+# NEW ADDITION - Compact full and delta encoding of GameState snapshots
+# =============================================================================
+#
+# Network features send the match state many times per second. Most ticks
+# only the ball position and tick counter change, so a snapshot is encoded
+# as a delta against an earlier state the receiver already has:
+#
+#     changed mask (uint16)  - bit i set: field i of GameState.__slots__ follows
+#     small mask   (uint16)  - bit i set: that number fits an int16
+#     values                 - changed fields in __slots__ order
+#
+# Numbers are sent as int16 when they are whole and small (positions,
+# velocities, scores) and as float64 otherwise, so decoding is always exact
+# and a receiver re-simulating from a snapshot stays in lockstep with the
+# sender. A full snapshot is simply a delta against no base.
+# =============================================================================
+
+import struct
+
+import game_state as gs
+
+# =============================================================================
+# CODEC CONSTANTS
+# =============================================================================
+FIELDS = gs.GameState.__slots__
+HEADER = struct.Struct("<HH")
+SMALL = struct.Struct("<h")
+WIDE = struct.Struct("<d")
+TICK = struct.Struct("<I")
+FLAG = struct.Struct("<?")
+SMALL_MIN = -32768
+SMALL_MAX = 32767
+
+# Fields with a fixed encoding instead of the small/wide choice
+FIXED_FIELDS = {"tick": TICK, "game_over": FLAG}
+
+
+class CodecError(Exception):
+    """Raised when an encoded snapshot cannot be decoded"""
+
+
+def encode(state, base=None):
+    """
+    Encode a GameState, as a delta against `base` if given
+    Args:
+        state (GameState): State to send
+        base (GameState | None): State the receiver already has
+    Returns: bytes
+    """
+    changed = small = 0
+    values = []
+    for bit, name in enumerate(FIELDS):
+        value = getattr(state, name)
+        if base is not None and getattr(base, name) == value:
+            continue
+        changed |= 1 << bit
+        fixed = FIXED_FIELDS.get(name)
+        if fixed is not None:
+            values.append(fixed.pack(value))
+        elif value == int(value) and SMALL_MIN <= value <= SMALL_MAX:
+            small |= 1 << bit
+            values.append(SMALL.pack(int(value)))
+        else:
+            values.append(WIDE.pack(value))
+    return HEADER.pack(changed, small) + b"".join(values)
+
+
+def decode(data, base=None, offset=0):
+    """
+    Decode a snapshot produced by encode()
+    Args:
+        data: bytes-like buffer
+        base (GameState | None): The same base the sender used
+        offset (int): Position of the snapshot inside data
+    Returns: New GameState (base is not modified)
+    """
+    try:
+        changed, small = HEADER.unpack_from(data, offset)
+    except struct.error as error:
+        raise CodecError("truncated snapshot header") from error
+    if base is None and changed != (1 << len(FIELDS)) - 1:
+        raise CodecError("delta snapshot without a base state")
+
+    state = base.copy() if base is not None else gs.GameState()
+    offset += HEADER.size
+    try:
+        for bit, name in enumerate(FIELDS):
+            if not changed & (1 << bit):
+                continue
+            fixed = FIXED_FIELDS.get(name)
+            codec = fixed if fixed is not None else SMALL if small & (1 << bit) else WIDE
+            value, = codec.unpack_from(data, offset)
+            offset += codec.size
+            setattr(state, name, value)
+    except struct.error as error:
+        raise CodecError("truncated snapshot body") from error
+    return state
+
+
+def encoded_size(data, offset=0):
+    """
+    Length of the snapshot at `offset`, to walk a stream of snapshots
+    Args:
+        data: bytes-like buffer
+        offset (int): Position of the snapshot inside data
+    Returns: Size in bytes
+    """
+    try:
+        changed, small = HEADER.unpack_from(data, offset)
+    except struct.error as error:
+        raise CodecError("truncated snapshot header") from error
+    size = HEADER.size
+    for bit, name in enumerate(FIELDS):
+        if changed & (1 << bit):
+            fixed = FIXED_FIELDS.get(name)
+            size += (fixed if fixed is not None else SMALL if small & (1 << bit) else WIDE).size
+    return size
@@ -0,0 +1,602 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Match Telemetry
+# NEW ADDITION - Event log plus constant-memory rally statistics
+# =============================================================================
+#
+# The game only remembers Scoreboard.l_score and r_score. Telemetry
+# follows a match through a few hooks (tick, wall, hit, point, end_match -
+# or observe() for game_state.step() loops) and produces:
+#
+# - An append-only JSON-lines event log, one record per event, rotated
+#   by size (events.jsonl -> events.jsonl.1 -> ... -> .LOG_BACKUPS) so it
+#   never grows past (LOG_BACKUPS + 1) * LOG_MAX_BYTES.
+# - Running aggregates for rally length in ticks, paddle hits per rally,
+#   seconds per point and peak ball speed (the per-tick step divided by
+#   move_speed, which bounce_x() keeps shrinking). Each metric keeps
+#   Welford mean/variance, a fixed-edge histogram and a log-bucketed
+#   quantile sketch (relative error SKETCH_ACCURACY, fixed bucket array),
+#   so memory is the same after ten points or ten million.
+#
+# Aggregates can be queried live (summary()), written to a JSON snapshot
+# every SNAPSHOT_EVERY points, and merged across runs - no log re-reading.
+#
+# Usage:
+#     python main.py --telemetry events.jsonl
+#     python telemetry.py simulate --matches 5000 --log batch.jsonl --snapshot batch.json
+#     python telemetry.py query batch.json other_run.json
+# =============================================================================
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from array import array
+from bisect import bisect_right
+
+import game_state as gs
+
+# =============================================================================
+# TELEMETRY CONSTANTS
+# =============================================================================
+LOG_MAX_BYTES = 1_000_000
+LOG_BACKUPS = 5
+SNAPSHOT_EVERY = 100  # Points between snapshot writes
+SKETCH_ACCURACY = 0.01  # Quantiles are within 1% of the true value
+SKETCH_MIN = 1e-3  # Values below this share one bucket
+SKETCH_MAX = 1e7
+QUANTILES = (0.5, 0.9, 0.99)
+BALL_STEP = math.hypot(gs.INITIAL_MOVE_DISTANCE, gs.INITIAL_MOVE_DISTANCE)  # Pixels per tick
+LEFT = "left"
+RIGHT = "right"
+
+# Metric name -> histogram bin edges
+METRICS = {
+    "rally_ticks": (25, 50, 100, 200, 400, 800, 1600, 3200),
+    "rally_hits": (1, 2, 3, 4, 5, 6, 8, 10, 15, 20),
+    "rally_seconds": (1, 2, 4, 8, 15, 30, 60, 120),
+    "peak_speed": (150, 200, 300, 500, 1000, 2000, 5000, 10000),  # Pixels per second
+}
+INTEGER_METRICS = ("rally_ticks", "rally_hits")  # Quantiles reported as whole numbers
+
+
+# =============================================================================
+# CONSTANT-MEMORY AGGREGATES
+# =============================================================================
+
+class RunningStats:
+    """
+    Count, mean, variance (Welford), min and max
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        """
+        Combine with another RunningStats (Chan et al. parallel update)
+        """
+        if not other.count:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def std(self):
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def to_dict(self):
+        return {"count": self.count, "mean": self.mean, "m2": self.m2,
+                "min": self.min if self.count else None, "max": self.max if self.count else None}
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        stats.count, stats.mean, stats.m2 = data["count"], data["mean"], data["m2"]
+        if stats.count:
+            stats.min, stats.max = data["min"], data["max"]
+        return stats
+
+
+class Histogram:
+    """
+    Counts per fixed bin: [-inf, e0), [e0, e1), ..., [e_last, inf)
+    """
+
+    def __init__(self, edges):
+        self.edges = tuple(edges)
+        self.counts = array("q", bytes(8 * (len(self.edges) + 1)))
+
+    def add(self, value):
+        self.counts[bisect_right(self.edges, value)] += 1
+
+    def merge(self, other):
+        if other.edges != self.edges:
+            raise ValueError("histograms have different bin edges")
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+
+    def bins(self):
+        """
+        Returns: List of (label, count)
+        """
+        labels = [f"<{self.edges[0]}"]
+        labels += [f"{low}-{high}" for low, high in zip(self.edges, self.edges[1:])]
+        labels.append(f">={self.edges[-1]}")
+        return list(zip(labels, self.counts))
+
+    def to_dict(self):
+        return {"edges": list(self.edges), "counts": list(self.counts)}
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls(data["edges"])
+        histogram.counts = array("q", data["counts"])
+        return histogram
+
+
+class QuantileSketch:
+    """
+    Log-bucketed quantile sketch with a fixed bucket array
+
+    Bucket i holds values in (gamma^(i-1), gamma^i] with
+    gamma = (1 + accuracy) / (1 - accuracy), so reporting a bucket's
+    midpoint is within `accuracy` of any value in it. Sketches built with
+    the same settings merge by adding counts.
+    """
+
+    def __init__(self, accuracy=SKETCH_ACCURACY, min_value=SKETCH_MIN, max_value=SKETCH_MAX):
+        self.accuracy, self.min_value, self.max_value = accuracy, min_value, max_value
+        self.gamma = (1 + accuracy) / (1 - accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.offset = math.ceil(math.log(min_value) / self.log_gamma)
+        size = math.ceil(math.log(max_value) / self.log_gamma) - self.offset + 2
+        self.counts = array("q", bytes(8 * size))  # counts[0]: values <= min_value
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value):
+        if value <= self.min_value:
+            index = 0
+        else:
+            index = math.ceil(math.log(value) / self.log_gamma) - self.offset + 1
+            index = max(1, min(len(self.counts) - 1, index))
+        self.counts[index] += 1
+        self.count += 1
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def quantile(self, q):
+        """
+        Args:
+            q (float): Quantile in [0, 1]
+        Returns: Estimate, or None when empty
+        """
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen > rank:
+                break
+        if index == 0:
+            estimate = self.min
+        else:
+            estimate = 2 * self.gamma ** (index + self.offset - 1) / (self.gamma + 1)
+        return min(self.max, max(self.min, estimate))
+
+    def merge(self, other):
+        if len(other.counts) != len(self.counts) or other.accuracy != self.accuracy:
+            raise ValueError("sketches were built with different settings")
+        for i, count in enumerate(other.counts):
+            if count:
+                self.counts[i] += count
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def to_dict(self):
+        return {"accuracy": self.accuracy, "min_value": self.min_value, "max_value": self.max_value,
+                "count": self.count, "min": self.min if self.count else None,
+                "max": self.max if self.count else None,
+                "buckets": {str(i): count for i, count in enumerate(self.counts) if count}}
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(data["accuracy"], data["min_value"], data["max_value"])
+        for index, count in data["buckets"].items():
+            sketch.counts[int(index)] = count
+        sketch.count = data["count"]
+        if sketch.count:
+            sketch.min, sketch.max = data["min"], data["max"]
+        return sketch
+
+
+class Metric:
+    """
+    Stats, histogram and quantile sketch of one stream of values
+    """
+
+    def __init__(self, edges, integer=False):
+        self.integer = integer
+        self.stats = RunningStats()
+        self.histogram = Histogram(edges)
+        self.sketch = QuantileSketch()
+
+    def add(self, value):
+        self.stats.add(value)
+        self.histogram.add(value)
+        self.sketch.add(value)
+
+    def merge(self, other):
+        self.stats.merge(other.stats)
+        self.histogram.merge(other.histogram)
+        self.sketch.merge(other.sketch)
+
+    def summary(self):
+        stats = self.stats.to_dict()
+        result = {"count": stats["count"], "mean": stats["mean"] if stats["count"] else None,
+                  "std": self.stats.std(), "min": stats["min"], "max": stats["max"]}
+        for q in QUANTILES:
+            value = self.sketch.quantile(q)
+            result[f"p{round(q * 100)}"] = round(value) if self.integer and value is not None else value
+        result["histogram"] = self.histogram.bins()
+        return result
+
+    def to_dict(self):
+        return {"stats": self.stats.to_dict(), "histogram": self.histogram.to_dict(),
+                "sketch": self.sketch.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data, integer=False):
+        metric = cls(data["histogram"]["edges"], integer)
+        metric.stats = RunningStats.from_dict(data["stats"])
+        metric.histogram = Histogram.from_dict(data["histogram"])
+        metric.sketch = QuantileSketch.from_dict(data["sketch"])
+        return metric
+
+
+class Aggregates:
+    """
+    Every metric in METRICS plus match and point counters
+    """
+
+    def __init__(self):
+        self.metrics = {name: Metric(edges, name in INTEGER_METRICS) for name, edges in METRICS.items()}
+        self.counters = {"matches": 0, "points": 0, "hits": 0, "walls": 0,
+                         "left_points": 0, "right_points": 0, "left_wins": 0, "right_wins": 0}
+
+    def merge(self, other):
+        for name, metric in other.metrics.items():
+            self.metrics[name].merge(metric)
+        for name, value in other.counters.items():
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def summary(self):
+        return {"counters": dict(self.counters),
+                "metrics": {name: metric.summary() for name, metric in self.metrics.items()}}
+
+    def to_dict(self):
+        return {"counters": self.counters,
+                "metrics": {name: metric.to_dict() for name, metric in self.metrics.items()}}
+
+    @classmethod
+    def from_dict(cls, data):
+        aggregates = cls()
+        aggregates.counters.update(data["counters"])
+        for name, metric in data["metrics"].items():
+            aggregates.metrics[name] = Metric.from_dict(metric, name in INTEGER_METRICS)
+        return aggregates
+
+    def save(self, path):
+        """
+        Atomically write a JSON snapshot
+        """
+        temp = path + ".tmp"
+        with open(temp, "w") as file:
+            json.dump(self.to_dict(), file)
+        os.replace(temp, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as file:
+            return cls.from_dict(json.load(file))
+
+
+# =============================================================================
+# EVENT LOG
+# =============================================================================
+
+class RotatingLog:
+    """
+    Append-only JSON-lines file, rotated once it passes max_bytes
+    """
+
+    def __init__(self, path, max_bytes=LOG_MAX_BYTES, backups=LOG_BACKUPS):
+        """
+        Args:
+            path (str): Current log file (older ones get .1, .2, ... suffixes)
+            max_bytes (int): Size that triggers a rotation
+            backups (int): Rotated files kept
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.file = open(path, "a", encoding="utf-8")
+        self.size = self.file.tell()
+
+    def write(self, record):
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        if self.size + len(line) > self.max_bytes and self.size:
+            self.rotate()
+        self.file.write(line)
+        self.size += len(line)
+
+    def rotate(self):
+        """
+        path -> path.1 -> path.2 ...; the oldest backup is dropped
+        """
+        self.file.close()
+        for index in range(self.backups - 1, 0, -1):
+            older = f"{self.path}.{index}"
+            if os.path.exists(older):
+                os.replace(older, f"{self.path}.{index + 1}")
+        if self.backups:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self.file = open(self.path, "a", encoding="utf-8")
+        self.size = 0
+
+    def close(self):
+        self.file.close()
+
+
+# =============================================================================
+# TELEMETRY PIPELINE
+# =============================================================================
+
+class Telemetry:
+    """
+    Turns match hooks into log records and running aggregates
+    """
+
+    def __init__(self, log_path=None, snapshot_path=None, max_bytes=LOG_MAX_BYTES,
+                 backups=LOG_BACKUPS, snapshot_every=SNAPSHOT_EVERY, clock=time.perf_counter):
+        """
+        Args:
+            log_path (str | None): Event log (None = aggregates only)
+            snapshot_path (str | None): Aggregates JSON written every
+                                        snapshot_every points and on close()
+            max_bytes (int): Log rotation size
+            backups (int): Rotated log files kept
+            snapshot_every (int): Points between snapshots
+            clock: Time source for tick() without an explicit duration
+        """
+        self.log = RotatingLog(log_path, max_bytes, backups) if log_path else None
+        self.snapshot_path = snapshot_path
+        self.snapshot_every = snapshot_every
+        self.clock = clock
+        self.aggregates = Aggregates()
+        self.match = 0
+        self.tick_count = 0
+        self._last_tick = None
+        self._new_rally()
+
+    def _new_rally(self):
+        self.rally_ticks = 0
+        self.rally_hits = 0
+        self.rally_seconds = 0.0
+        self.peak_speed = 0.0
+
+    def _emit(self, kind, **fields):
+        if self.log:
+            self.log.write({"ts": round(time.time(), 3), "match": self.match,
+                            "tick": self.tick_count, "event": kind, **fields})
+
+    # Hooks ===================================================================
+
+    def start_match(self):
+        self.match += 1
+        self.tick_count = 0
+        self._last_tick = None
+        self._new_rally()
+        self._emit("match_start")
+
+    def tick(self, seconds=None):
+        """
+        One loop iteration
+        Args:
+            seconds (float | None): Its duration (default: measured with clock)
+        """
+        if seconds is None:
+            now = self.clock()
+            seconds = 0.0 if self._last_tick is None else now - self._last_tick
+            self._last_tick = now
+        self.tick_count += 1
+        self.rally_ticks += 1
+        self.rally_seconds += seconds
+
+    def wall(self):
+        self.aggregates.counters["walls"] += 1
+        self._emit("wall")
+
+    def hit(self, move_speed):
+        """
+        A paddle hit, after bounce_x() shortened move_speed
+        """
+        speed = BALL_STEP / move_speed
+        self.rally_hits += 1
+        self.peak_speed = max(self.peak_speed, speed)
+        self.aggregates.counters["hits"] += 1
+        self._emit("hit", move_speed=round(move_speed, 6), speed=round(speed, 1))
+
+    def point(self, scorer, l_score, r_score):
+        """
+        A point for `scorer` (LEFT or RIGHT) - closes the rally
+        """
+        counters = self.aggregates.counters
+        peak = self.peak_speed or BALL_STEP / gs.INITIAL_MOVE_SPEED
+        metrics = self.aggregates.metrics
+        metrics["rally_ticks"].add(self.rally_ticks)
+        metrics["rally_hits"].add(self.rally_hits)
+        metrics["rally_seconds"].add(self.rally_seconds)
+        metrics["peak_speed"].add(peak)
+        counters["points"] += 1
+        counters[f"{scorer}_points"] += 1
+        self._emit("point", scorer=scorer, score=[l_score, r_score], rally_ticks=self.rally_ticks,
+                   rally_hits=self.rally_hits, rally_seconds=round(self.rally_seconds, 4),
+                   peak_speed=round(peak, 1))
+        self._new_rally()
+        if self.snapshot_path and counters["points"] % self.snapshot_every == 0:
+            self.aggregates.save(self.snapshot_path)
+
+    def end_match(self, winner):
+        """
+        Args:
+            winner (str | None): LEFT, RIGHT or None for an unfinished match
+        """
+        self.aggregates.counters["matches"] += 1
+        if winner:
+            self.aggregates.counters[f"{winner}_wins"] += 1
+        self._emit("match_end", winner=winner, ticks=self.tick_count)
+
+    def observe(self, state, events, seconds):
+        """
+        Feed one game_state.step() result (call after every step)
+        Args:
+            state (GameState): State after the step
+            events (int): Event flags step() returned
+            seconds (float): How long the tick lasted - the move_speed from
+                             BEFORE the step (what main() sleeps), since a
+                             hit or point changes state.move_speed
+        """
+        if state.tick == 1:
+            self.start_match()
+        self.tick(seconds)
+        if events & gs.EVENT_WALL:
+            self.wall()
+        if events & gs.EVENT_PADDLE:
+            self.hit(state.move_speed)
+        if events & gs.EVENT_LEFT_POINT:
+            self.point(LEFT, state.l_score, state.r_score)
+        if events & gs.EVENT_RIGHT_POINT:
+            self.point(RIGHT, state.l_score, state.r_score)
+        if events & gs.EVENT_GAME_OVER:
+            self.end_match(LEFT if state.l_score > state.r_score else RIGHT)
+
+    # Queries =================================================================
+
+    def summary(self):
+        return self.aggregates.summary()
+
+    def close(self):
+        """
+        Flush the log and write a final snapshot
+        """
+        if self.log:
+            self.log.close()
+        if self.snapshot_path:
+            self.aggregates.save(self.snapshot_path)
+
+
+def format_summary(summary):
+    """
+    Returns: Printable table of an Aggregates.summary()
+    """
+    counters = summary["counters"]
+    lines = [", ".join(f"{name} {value}" for name, value in counters.items()),
+             f"{'metric':<14} {'count':>7} {'mean':>9} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}"]
+    for name, metric in summary["metrics"].items():
+        if not metric["count"]:
+            lines.append(f"{name:<14} {0:>7}")
+            continue
+        lines.append(f"{name:<14} {metric['count']:>7} {metric['mean']:>9.2f} {metric['p50']:>9.2f} "
+                     f"{metric['p90']:>9.2f} {metric['p99']:>9.2f} {metric['max']:>9.2f}")
+    return "\n".join(lines)
+
+
+# =============================================================================
+# COMMAND LINE
+# =============================================================================
+
+def simulate(args):
+    """
+    Headless bot matches feeding a Telemetry pipeline
+    """
+    from ai_player import LEFT as AI_LEFT, RIGHT as AI_RIGHT
+    from bots import BOTS, MAX_MATCH_TICKS
+
+    telemetry = Telemetry(args.log, args.snapshot, args.max_bytes, args.backups)
+    step = gs.step
+    start = time.perf_counter()
+    for match in range(args.matches):
+        left = BOTS[args.left](AI_LEFT, args.seed + 2 * match)
+        right = BOTS[args.right](AI_RIGHT, args.seed + 2 * match + 1)
+        state = gs.GameState()
+        while not state.game_over and state.tick < MAX_MATCH_TICKS:
+            seconds = state.move_speed
+            telemetry.observe(state, step(state, (left(state), right(state))), seconds)
+        if not state.game_over:
+            telemetry.end_match(None)
+    telemetry.close()
+    elapsed = time.perf_counter() - start
+    print(format_summary(telemetry.summary()))
+    print(f"{args.matches} matches in {elapsed:.1f}s")
+
+
+def main(argv=None):
+    """
+    Command line entry point
+    """
+    parser = argparse.ArgumentParser(description="Match telemetry")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sim = sub.add_parser("simulate", help="headless bot matches with telemetry")
+    sim.add_argument("--matches", type=int, default=1000)
+    sim.add_argument("--left", default="medium")
+    sim.add_argument("--right", default="medium")
+    sim.add_argument("--seed", type=int, default=0)
+    sim.add_argument("--log", metavar="FILE", help="event log (JSON lines, rotated)")
+    sim.add_argument("--snapshot", metavar="FILE", help="aggregates snapshot (JSON)")
+    sim.add_argument("--max-bytes", type=int, default=LOG_MAX_BYTES)
+    sim.add_argument("--backups", type=int, default=LOG_BACKUPS)
+    query = sub.add_parser("query", help="print (merged) aggregate snapshots")
+    query.add_argument("snapshots", nargs="+")
+    query.add_argument("--json", action="store_true", help="print the full summary as JSON")
+    args = parser.parse_args(argv)
+
+    if args.command == "simulate":
+        simulate(args)
+        return 0
+    aggregates = Aggregates.load(args.snapshots[0])
+    for path in args.snapshots[1:]:
+        aggregates.merge(Aggregates.load(path))
+    if args.json:
+        json.dump(aggregates.summary(), sys.stdout, indent=2)
+        print()
+    else:
+        print(format_summary(aggregates.summary()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
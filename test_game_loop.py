@@ -0,0 +1,81 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Game Loop Test
+# NEW ADDITION - Fast balls must still bounce off the paddle in their path
+# =============================================================================
+#
+# FixedTimestepLoop turns move_speed into velocity, so after enough paddle
+# hits one physics step moves the ball further than the 30 px paddle band
+# is deep. main() always moves it 10 px a tick, so the loop must still
+# bounce a ball that its paddle is lined up with, however fast it is.
+#
+# Usage:
+#     python -m unittest test_game_loop   # or: python -m pytest test_game_loop.py
+# =============================================================================
+
+import unittest
+
+import game_state as gs
+from game_loop import PHYSICS_DT, FixedTimestepLoop
+
+# =============================================================================
+# TEST CONSTANTS
+# =============================================================================
+MAX_HITS = 60  # move_speed after this many hits: ~460 px per physics step
+START_X = 200  # Ball starts this far from the centre, heading for a paddle
+STEPS = 400  # Physics steps to run - enough to reach the paddle at any speed
+
+
+def _fast_state(hits, x_move, y_move=gs.INITIAL_MOVE_DISTANCE):
+    """
+    Returns: GameState with the ball heading for the paddle on its side of
+             x_move, after `hits` paddle hits, that paddle lined up with
+             where the ball will cross its band
+    """
+    state = gs.GameState()
+    state.move_speed = gs.INITIAL_MOVE_SPEED * gs.SPEED_INCREASE_FACTOR ** hits
+    state.x = START_X if x_move > 0 else -START_X
+    state.y = 0
+    state.x_move = x_move
+    state.y_move = y_move
+    # Distance to the band is the same in y (|x_move| == |y_move|), capped
+    # so the paddle stays on screen
+    crossing = (gs.RIGHT_PADDLE_X_BOUNDARY + gs.PADDLE_BAND_DEPTH / 2 - START_X) * (y_move / abs(x_move))
+    if x_move > 0:
+        state.r_y = crossing
+    else:
+        state.l_y = crossing
+    return state
+
+
+class FixedTimestepLoopTest(unittest.TestCase):
+
+    def run_until_event(self, state):
+        """
+        Returns: EVENT_* flags of the first physics step that raises any
+        """
+        loop = FixedTimestepLoop(state)
+        for _ in range(STEPS):
+            events = loop.advance(PHYSICS_DT)
+            if events & ~gs.EVENT_WALL:
+                return events
+        self.fail(f"no paddle or goal event within {STEPS} steps")
+
+    def test_fast_ball_hits_paddle(self):
+        for hits in range(MAX_HITS + 1):
+            for x_move in (gs.INITIAL_MOVE_DISTANCE, -gs.INITIAL_MOVE_DISTANCE):
+                for y_move in (gs.INITIAL_MOVE_DISTANCE, -gs.INITIAL_MOVE_DISTANCE):
+                    with self.subTest(hits=hits, x_move=x_move, y_move=y_move):
+                        events = self.run_until_event(_fast_state(hits, x_move, y_move))
+                        self.assertTrue(events & gs.EVENT_PADDLE)
+                        self.assertFalse(events & (gs.EVENT_LEFT_POINT | gs.EVENT_RIGHT_POINT))
+
+    def test_fast_ball_still_misses(self):
+        # Swept collision must not invent hits: paddle well out of the way
+        state = _fast_state(MAX_HITS, gs.INITIAL_MOVE_DISTANCE)
+        state.r_y = -state.r_y
+        events = self.run_until_event(state)
+        self.assertTrue(events & gs.EVENT_LEFT_POINT)
+
+
+if __name__ == "__main__":
+    unittest.main()
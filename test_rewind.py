@@ -0,0 +1,119 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Rewind Buffer Test
+# NEW ADDITION - Checks every stored tick against the real history
+# =============================================================================
+#
+# RewindBuffer rebuilds ticks from a keyframe plus deltas in two fixed-size
+# rings, so the easy mistakes are off-by-ones where a ring wraps, a tick
+# that had to go out as a forced keyframe, and truncate() leaving the next
+# delta built on the wrong base. Each test keeps the plain list of states
+# it pushed and compares every tick still in the buffer against it.
+#
+# Usage:
+#     python -m unittest test_rewind      # or: python -m pytest test_rewind.py
+# =============================================================================
+
+import random
+import unittest
+
+import game_state as gs
+from rewind import RewindBuffer
+
+# =============================================================================
+# TEST CONSTANTS
+# =============================================================================
+CAPACITY = 40  # Small rings so a short match wraps them many times
+KEYFRAME_INTERVAL = 8
+TICKS = 1500
+SEED = 22
+
+
+def _play(ticks, seed=SEED):
+    """
+    Yield the states of a headless match with random paddle inputs
+    (a new match starts whenever one ends)
+    """
+    rng = random.Random(seed)
+    state = gs.GameState()
+    for _ in range(ticks):
+        if state.game_over:
+            state = gs.GameState()
+        gs.step(state, (rng.choice((-1, 0, 1)), rng.choice((-1, 0, 1))))
+        yield state.copy()
+
+
+class RewindBufferTest(unittest.TestCase):
+
+    def assert_matches(self, buffer, history):
+        """
+        Every stored tick must rebuild to the state pushed for it
+        """
+        self.assertLessEqual(len(buffer), buffer.capacity)
+        self.assertGreater(len(buffer), 0)
+        for back in range(len(buffer)):
+            self.assertEqual(buffer.state(back), history[-1 - back], f"{back} ticks back")
+        with self.assertRaises(IndexError):
+            buffer.state(len(buffer))
+
+    def test_wraparound(self):
+        buffer = RewindBuffer(CAPACITY, KEYFRAME_INTERVAL)
+        history = []
+        for state in _play(TICKS):
+            buffer.push(state)
+            history.append(state)
+            self.assert_matches(buffer, history)
+            if len(history) >= CAPACITY:
+                self.assertGreaterEqual(len(buffer), CAPACITY - KEYFRAME_INTERVAL)
+
+    def test_forced_keyframes(self):
+        buffer = RewindBuffer(CAPACITY, KEYFRAME_INTERVAL)
+        history = []
+        for index, state in enumerate(_play(TICKS)):
+            # Changes no delta record can encode
+            if index % 7 == 3:
+                state.x += 100_000  # Move too large for int16
+            elif index % 11 == 5:
+                state.move_speed *= 0.5  # Not a speed one tick can produce
+            elif index % 13 == 0:
+                state.tick += 2  # Skipped tick
+            keyframes = buffer.keyframe_count
+            buffer.push(state)
+            history.append(state)
+            if len(history) > 1 and index % 7 == 3:
+                self.assertEqual(buffer.keyframe_count, keyframes + 1)
+            self.assert_matches(buffer, history)
+
+    def test_keyframe_ring_full(self):
+        # Every tick a keyframe: the keyframe ring fills before the delta ring
+        buffer = RewindBuffer(CAPACITY, KEYFRAME_INTERVAL)
+        history = []
+        for index, state in enumerate(_play(TICKS // 10)):
+            state.x += 100_000 * (index % 2)
+            buffer.push(state)
+            history.append(state)
+            self.assert_matches(buffer, history)
+        self.assertLessEqual(len(buffer), buffer.keyframe_slots)
+
+    def test_truncate(self):
+        rng = random.Random(SEED)
+        buffer = RewindBuffer(CAPACITY, KEYFRAME_INTERVAL)
+        history = []
+        for state in _play(TICKS):
+            if len(buffer) > 1 and rng.random() < 0.05:
+                back = rng.randrange(len(buffer))
+                buffer.truncate(back)
+                del history[len(history) - back:len(history)]
+                self.assert_matches(buffer, history)
+                # Resume as RewindControl.hold() does: from the rebuilt tick
+                resumed = buffer.state(0)
+                gs.step(resumed, (1, -1))
+                state = resumed
+            buffer.push(state)
+            history.append(state)
+            self.assert_matches(buffer, history)
+        with self.assertRaises(IndexError):
+            buffer.truncate(len(buffer))
+
+
+if __name__ == "__main__":
+    unittest.main()
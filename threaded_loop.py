@@ -0,0 +1,598 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Threaded Game Loop
+# NEW ADDITION - Physics on its own thread, Tk renders from ontimer callbacks
+# =============================================================================
+#
+# main() does everything on one thread: time.sleep(move_speed), then
+# screen.update() (which is also the only place Tk runs key handlers), then
+# one tick of physics. Two problems follow:
+# - A key pressed during the sleep waits in Tk's queue until the next
+#   update(), and its effect is only drawn one more sleep later
+# - Every tick takes move_speed PLUS the drawing time, so the game runs
+#   slower than intended and speeds up and slows down as drawing cost varies
+#
+# Here a PhysicsThread runs game_state.step() against absolute deadlines
+# (drawing time is never added to a tick) and hands each new state to the
+# Tk thread through StateBuffers: two preallocated GameStates and a
+# sequence number. The writer fills the buffer that is not published, then
+# publishes it by bumping the sequence - the parity of the sequence is the
+# buffer index, so the bump is the swap. No locks: the reader copies the
+# published buffer and retries if the sequence moved meanwhile (the writer
+# may have started refilling that buffer). Tk itself sits in mainloop(),
+# running key handlers the moment they arrive, and draws the latest state
+# from a screen.ontimer() callback every RENDER_INTERVAL_MS.
+#
+# `compare` measures both loops on the display-free screen with the same
+# scripted key presses and a simulated Tk drawing cost.
+#
+# Usage:
+#     python main.py --threaded [--cpu hard --record match.pong]
+#     python threaded_loop.py compare                  # single loop vs threaded
+#     python threaded_loop.py compare --seconds 20 --render-cost 6
+# =============================================================================
+
+import argparse
+import heapq
+import itertools
+import queue
+import random
+import sys
+import threading
+import time
+from array import array
+
+import game_state as gs
+from ai_player import PredictiveAI, DIFFICULTIES, LEFT
+
+# =============================================================================
+# THREADED LOOP CONSTANTS
+# =============================================================================
+RENDER_INTERVAL_MS = 16  # Tk frame timer (~60 fps); physics ticks every move_speed
+FRAME_INTERVAL = RENDER_INTERVAL_MS / 1000
+MAX_LAG = 0.25  # Physics further behind than this resynchronises instead of catching up
+SWITCH_INTERVAL = 0.001  # GIL hand-over time while both threads run (Python default: 5 ms)
+FIELDS = gs.GameState.__slots__
+
+# Measurement defaults for `compare`
+SINGLE = "single loop"
+THREADED = "threaded"
+COMPARE_SECONDS = 10.0  # Per loop - main() only ticks 10 times a second
+RENDER_COST = 0.004  # Mean simulated Tk drawing time per frame (seconds)
+RENDER_SPIKE = 0.025  # Occasional slow frame (window moved, other redraws)
+RENDER_SPIKE_CHANCE = 0.03
+KEY_GAP = (0.04, 0.25)  # Seconds between scripted key events
+COMPARE_SEED = 22
+
+
+class StateBuffers:
+    """
+    Lock-free handoff of GameStates from one writer thread to one reader
+
+    buffers[sequence & 1] is the published state. Relies on CPython's GIL
+    making each attribute store atomic and visible in program order.
+    """
+
+    def __init__(self, state=None):
+        """
+        Args:
+            state (GameState | None): Initial published state (a new match by default)
+        """
+        state = state if state is not None else gs.GameState()
+        self.buffers = (state.copy(), state.copy())
+        self.sequence = 0
+        self.retries = 0  # Reads repeated because the writer published meanwhile
+
+    def publish(self, state):
+        """
+        Writer side: copy state into the back buffer and make it the front one
+        Args:
+            state (GameState): State to publish
+        """
+        back = self.buffers[(self.sequence + 1) & 1]
+        for name in FIELDS:
+            setattr(back, name, getattr(state, name))
+        self.sequence += 1  # The only store the reader synchronises on
+
+    def read_into(self, view):
+        """
+        Reader side: copy the latest published state
+        Args:
+            view (GameState): Reader-owned state to overwrite
+        Returns: Sequence number of the state copied
+        """
+        while True:
+            sequence = self.sequence
+            front = self.buffers[sequence & 1]
+            for name in FIELDS:
+                setattr(view, name, getattr(front, name))
+            # The writer only touches this buffer again after publishing
+            # sequence + 1, so an unchanged sequence means an untorn copy
+            if self.sequence == sequence:
+                return sequence
+            self.retries += 1
+
+
+class PhysicsThread(threading.Thread):
+    """
+    Runs game_state.step() once per move_speed seconds and publishes every tick
+
+    Deadlines are absolute, like game_loop.FrameScheduler: time spent
+    stepping (or waiting for the GIL) comes off the next wait.
+    """
+
+    def __init__(self, state, buffers, sample, clock=time.perf_counter):
+        """
+        Args:
+            state (GameState): Match to simulate (owned by this thread from start())
+            buffers (StateBuffers): Where each tick is published
+            sample: Callable(state) returning the (left, right) inputs for a tick
+            clock: Time source (seconds)
+        """
+        super().__init__(name="pong-physics", daemon=True)
+        self.state = state
+        self.buffers = buffers
+        self.sample = sample
+        self.clock = clock
+        self.tick_times = array("d")  # When each tick ran
+        self.tick_periods = array("d")  # The move_speed it waited for
+        self._stopped = threading.Event()
+
+    def run(self):
+        state = self.state
+        deadline = self.clock()
+        while not state.game_over:
+            deadline += state.move_speed
+            delay = deadline - self.clock()
+            if delay > 0:
+                if self._stopped.wait(delay):
+                    return
+            elif delay < -MAX_LAG:
+                deadline = self.clock()
+            if self._stopped.is_set():
+                return
+            self.tick_times.append(self.clock())
+            self.tick_periods.append(state.move_speed)
+            gs.step(state, self.sample(state))
+            self.buffers.publish(state)
+
+    def stop(self):
+        """
+        Ask the thread to finish and wait for it
+        """
+        self._stopped.set()
+        if self.is_alive():
+            self.join()
+
+
+class ThreadedGame:
+    """
+    Pong with physics on a PhysicsThread and drawing on the Tk thread
+
+    The Tk side only ever reads StateBuffers and draws; all game rules run
+    on the physics thread. Key handlers stay on the Tk thread and reach the
+    physics through HeldKeys.
+    """
+
+    def __init__(self, screen, objects, keys, ai=None, recorder=None, ontimer=None,
+                 clock=time.perf_counter):
+        """
+        Args:
+            screen: turtle Screen to present frames on
+            objects (tuple): (r_paddle, l_paddle, ball, scoreboard) turtles
+            keys (HeldKeys): Paddle keys, already bound
+            ai (PredictiveAI): Plays the left paddle if given
+            recorder (ReplayRecorder): Records every tick's inputs if given
+            ontimer: Callable(fun, ms) scheduling the next frame (default: screen.ontimer)
+            clock: Time source (seconds)
+        """
+        self.screen = screen
+        self.r_paddle, self.l_paddle, self.ball, self.scoreboard = objects
+        self.keys = keys
+        self.ai = ai
+        self.recorder = recorder
+        self.ontimer = ontimer if ontimer is not None else screen.ontimer
+        self.clock = clock
+        self.on_game_over = None  # Called on the Tk thread after the final frame
+
+        self.buffers = StateBuffers()
+        self.view = gs.GameState()
+        self.shown = 0  # Sequence number on screen
+        self.physics = PhysicsThread(gs.GameState(), self.buffers, self._sample, clock)
+        self.frame_times = array("d")  # When each frame callback ran
+        self.frames_drawn = 0
+        self._deadline = 0.0
+        self._switch_interval = None
+
+    def _sample(self, state):
+        """
+        Physics thread: inputs for the next tick
+        """
+        inputs = self.keys.sample(state.tick + 1)  # Published as sequence tick + 1
+        if self.ai:
+            inputs = (self.ai.move_for_state(state), inputs[1])
+        if self.recorder:
+            self.recorder.record(inputs)
+        return inputs
+
+    def start(self):
+        """
+        Start the physics thread and schedule the first frame
+        """
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(SWITCH_INTERVAL)
+        self._deadline = self.clock() + FRAME_INTERVAL
+        self.physics.start()
+        self.ontimer(self.render, RENDER_INTERVAL_MS)
+
+    def stop(self):
+        """
+        Stop the physics thread (safe to call more than once)
+        """
+        self.physics.stop()
+        if self._switch_interval is not None:
+            sys.setswitchinterval(self._switch_interval)
+            self._switch_interval = None
+
+    def render(self):
+        """
+        Tk thread: draw the latest published tick, then schedule the next frame
+        Frames with nothing new skip the drawing entirely
+        """
+        now = self.clock()
+        self.frame_times.append(now)
+        sequence = self.buffers.read_into(self.view)
+        if sequence != self.shown:
+            self.shown = sequence
+            view = self.view
+            self.ball.draw_state(view)
+            self.l_paddle.draw_y(view.l_y)
+            self.r_paddle.draw_y(view.r_y)
+            self.scoreboard.draw_state(view)
+            self.screen.update()
+            # Key events sampled for a tick that isn't published yet stay queued
+            self.keys.frame_presented(sequence)
+            self.frames_drawn += 1
+        if self.view.game_over:
+            self.stop()
+            if self.on_game_over:
+                self.on_game_over()
+            return
+
+        # Deadline pacing so drawing time doesn't stretch the frame interval
+        self._deadline += FRAME_INTERVAL
+        now = self.clock()
+        if self._deadline < now - FRAME_INTERVAL:
+            self._deadline = now + FRAME_INTERVAL
+        self.ontimer(self.render, max(0, round((self._deadline - now) * 1000)))
+
+    def tick_jitter(self):
+        """
+        Returns: jitter_summary() of the physics tick intervals
+        """
+        return jitter_summary(self.physics.tick_times, self.physics.tick_periods)
+
+    def frame_jitter(self):
+        """
+        Returns: jitter_summary() of the frame timer intervals
+        """
+        return jitter_summary(self.frame_times, [FRAME_INTERVAL] * len(self.frame_times))
+
+
+def jitter_summary(times, intended):
+    """
+    How far each interval between events strayed from its intended length
+
+    Args:
+        times: Event timestamps in seconds
+        intended: Intended length of the interval ending at each event
+    Returns: Dictionary with the mean signed error (drift) and p50/p99/max
+             absolute error in milliseconds
+    """
+    errors = [times[i] - times[i - 1] - intended[i] for i in range(1, len(times))]
+    if not errors:
+        return {"samples": 0, "mean_ms": None, "p50_ms": None, "p99_ms": None, "max_ms": None}
+    ordered = sorted(abs(error) for error in errors)
+    count = len(ordered)
+    return {
+        "samples": count,
+        "mean_ms": sum(errors) / count * 1000,
+        "p50_ms": ordered[(count - 1) // 2] * 1000,
+        "p99_ms": ordered[min(count - 1, int(count * 0.99))] * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+def run(cpu=None, record_path=None):
+    """
+    Play a match with threaded physics
+    Uses the same screen, turtles, controls and winner display as main.py
+
+    Args:
+        cpu (str): Difficulty of a CPU left paddle (None = two players)
+        record_path (str): Save a replay of the match to this file
+    """
+    from main import setup_screen, setup_game_objects, setup_held_controls, display_winner
+
+    screen = setup_screen()
+    r_paddle, l_paddle, ball, scoreboard, center_line = setup_game_objects()
+    center_line.draw()
+    keys = setup_held_controls(screen)
+    ai = PredictiveAI(LEFT, cpu) if cpu else None
+    recorder = None
+    if record_path:
+        from replay import ReplayRecorder
+        recorder = ReplayRecorder(record_path)
+    game = ThreadedGame(screen, (r_paddle, l_paddle, ball, scoreboard), keys, ai, recorder)
+
+    def game_over():
+        display_winner(scoreboard)
+        screen.update()
+        if recorder:
+            recorder.close(scoreboard.l_score, scoreboard.r_score)
+        print(f"Input latency: {keys.latency_percentiles()}")
+        print(f"Tick jitter: {game.tick_jitter()}")
+        print(f"State buffer read retries: {game.buffers.retries}")
+        screen.onclick(lambda x, y: screen.bye())
+
+    game.on_game_over = game_over
+    game.start()
+    try:
+        screen.mainloop()  # Tk now runs key handlers as soon as they arrive
+    finally:
+        game.stop()  # Window closed mid-match
+
+
+# =============================================================================
+# SINGLE LOOP VS THREADED COMPARISON
+# =============================================================================
+
+class _TimeUp(Exception):
+    """Ends the main() run in compare() once its time is over"""
+
+
+class _Keyboard(threading.Thread):
+    """
+    Scripted player: random paddle key presses and releases at random times,
+    each stamped with when it "happened" so queueing delay counts as latency
+    """
+
+    def __init__(self, events, seed):
+        super().__init__(name="pong-keyboard", daemon=True)
+        self.events = events
+        self.random = random.Random(seed)
+        self._stopped = threading.Event()
+
+    def run(self):
+        held = [False, False, False, False]
+        while not self._stopped.wait(self.random.uniform(*KEY_GAP)):
+            index = self.random.randrange(4)
+            held[index] = not held[index]
+            self.events.put((time.perf_counter(), index, held[index]))
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+
+
+class _EventLoop:
+    """
+    Stand-in for Tk's mainloop(): runs queued key events as soon as they
+    arrive and timer callbacks when they are due
+    """
+
+    def __init__(self, events, dispatch):
+        self.events = events
+        self.dispatch = dispatch
+        self.timers = []
+        self._order = itertools.count()
+
+    def ontimer(self, fun, delay_ms):
+        heapq.heappush(self.timers, (time.perf_counter() + delay_ms / 1000, next(self._order), fun))
+
+    def run(self, until):
+        while True:
+            now = time.perf_counter()
+            if now >= until:
+                return
+            if self.timers and self.timers[0][0] <= now:
+                heapq.heappop(self.timers)[2]()
+                continue
+            wake = min(until, self.timers[0][0]) if self.timers else until
+            try:
+                event = self.events.get(timeout=wake - now)
+            except queue.Empty:
+                continue
+            self.dispatch(event)
+
+
+def _headless_tk(events, keys_ref, render_cost, seed, sleep):
+    """
+    Stand-ins for Tk's key dispatch and for what screen.update() costs:
+    a (random) drawing time, then every key event that queued up meanwhile
+
+    Args:
+        events (queue.Queue): _Keyboard events
+        keys_ref (dict): Holds the HeldKeys object under "keys" once it exists
+        render_cost (float): Mean drawing time per update in seconds
+        seed (int): Seed for the drawing times
+        sleep: Unpatched time.sleep (drawing happens in Tk's C code, without the GIL)
+    Returns: Tuple (dispatch(event), update()) functions
+    """
+    rng = random.Random(seed)
+
+    def dispatch(event):
+        stamp, index, down = event
+        keys = keys_ref["keys"]
+        if down:
+            keys.press(index, stamp)
+        else:
+            keys.release(index, stamp)
+
+    def update():
+        cost = rng.uniform(0, 2 * render_cost)
+        if rng.random() < RENDER_SPIKE_CHANCE:
+            cost += RENDER_SPIKE
+        sleep(cost)
+        while True:
+            try:
+                dispatch(events.get_nowait())
+            except queue.Empty:
+                return
+
+    return dispatch, update
+
+
+def measure_single_loop(seconds=COMPARE_SECONDS, render_cost=RENDER_COST, seed=COMPARE_SEED):
+    """
+    Run main(held_keys=True) unmodified on the display-free screen
+
+    Args:
+        seconds (float): How long to play
+        render_cost (float): Mean simulated drawing time per frame
+        seed (int): Seed for key events and drawing times
+    Returns: Dictionary of tick_jitter, frame_jitter and input_latency
+    """
+    import fake_turtle
+    screen = fake_turtle.install()
+    import main
+
+    events = queue.Queue()
+    keys_ref = {}
+    real_sleep = main.time.sleep
+    _, update = _headless_tk(events, keys_ref, render_cost, seed, real_sleep)
+    times, intended = array("d"), array("d")
+    slept = [0.0]
+    end = time.perf_counter() + seconds
+
+    def on_update():
+        # Top of every loop iteration: the tick (and frame) starts here
+        now = time.perf_counter()
+        times.append(now)
+        intended.append(slept[0])
+        if now >= end:
+            raise _TimeUp
+        update()
+
+    def sleep(seconds):
+        slept[0] = seconds
+        real_sleep(seconds)
+
+    original_controls = main.setup_held_controls
+
+    def setup_held_controls(screen):
+        keys_ref["keys"] = original_controls(screen)
+        return keys_ref["keys"]
+
+    keyboard = _Keyboard(events, seed)
+    screen.on_update = on_update
+    main.setup_held_controls = setup_held_controls
+    main.time.sleep = sleep
+    keyboard.start()
+    try:
+        main.main(held_keys=True)
+    except _TimeUp:
+        pass
+    finally:
+        keyboard.stop()
+        main.time.sleep = real_sleep
+        main.setup_held_controls = original_controls
+
+    jitter = jitter_summary(times, intended)
+    return {"tick_jitter": jitter, "frame_jitter": jitter,
+            "input_latency": keys_ref["keys"].latency_percentiles()}
+
+
+def measure_threaded(seconds=COMPARE_SECONDS, render_cost=RENDER_COST, seed=COMPARE_SEED):
+    """
+    Run ThreadedGame on the display-free screen with an emulated Tk mainloop
+
+    Args:
+        seconds (float): How long to play
+        render_cost (float): Mean simulated drawing time per frame
+        seed (int): Seed for key events and drawing times
+    Returns: Dictionary of tick_jitter, frame_jitter, input_latency and retries
+    """
+    import fake_turtle
+    screen = fake_turtle.install()
+    from main import setup_game_objects, setup_held_controls
+
+    events = queue.Queue()
+    r_paddle, l_paddle, ball, scoreboard, center_line = setup_game_objects()
+    center_line.draw()
+    keys_ref = {"keys": setup_held_controls(screen)}
+    dispatch, screen.on_update = _headless_tk(events, keys_ref, render_cost, seed, time.sleep)
+    loop = _EventLoop(events, dispatch)
+    game = ThreadedGame(screen, (r_paddle, l_paddle, ball, scoreboard), keys_ref["keys"],
+                        ontimer=loop.ontimer)
+
+    keyboard = _Keyboard(events, seed)
+    keyboard.start()
+    game.start()
+    try:
+        loop.run(time.perf_counter() + seconds)
+    finally:
+        game.stop()
+        keyboard.stop()
+    return {"tick_jitter": game.tick_jitter(), "frame_jitter": game.frame_jitter(),
+            "input_latency": keys_ref["keys"].latency_percentiles(),
+            "retries": game.buffers.retries}
+
+
+def compare(seconds=COMPARE_SECONDS, render_cost=RENDER_COST, seed=COMPARE_SEED):
+    """
+    Measure main()'s single loop and ThreadedGame under the same conditions
+    Returns: {SINGLE: measurements, THREADED: measurements}
+    """
+    return {SINGLE: measure_single_loop(seconds, render_cost, seed),
+            THREADED: measure_threaded(seconds, render_cost, seed)}
+
+
+def print_comparison(results):
+    """
+    Side-by-side table of compare() results
+    """
+    single, threaded = results[SINGLE], results[THREADED]
+    print(f"{'(ms)':<26} {SINGLE:>12} {THREADED:>12}")
+    for metric, label in (("tick_jitter", "tick interval error"),
+                          ("frame_jitter", "frame interval error"),
+                          ("input_latency", "input latency")):
+        for field in ("mean_ms", "p50_ms", "p99_ms", "max_ms"):
+            if field not in single[metric]:
+                continue
+            values = [result[metric][field] for result in (single, threaded)]
+            cells = " ".join("-".rjust(12) if value is None else f"{value:>12.2f}"
+                             for value in values)
+            print(f"{label + ' ' + field[:-3]:<26} {cells}")
+    print(f"(key events: {single['input_latency']['samples']} single, "
+          f"{threaded['input_latency']['samples']} threaded; "
+          f"state buffer read retries: {threaded['retries']})")
+
+
+def cli(argv=None):
+    """
+    Command line entry point
+    """
+    parser = argparse.ArgumentParser(description="Pong with physics on its own thread")
+    sub = parser.add_subparsers(dest="command")
+    play_parser = sub.add_parser("play", help="play a match (default)")
+    play_parser.add_argument("--cpu", choices=sorted(DIFFICULTIES))
+    play_parser.add_argument("--record", metavar="FILE")
+    compare_parser = sub.add_parser("compare", help="single loop vs threaded timing, no display")
+    compare_parser.add_argument("--seconds", type=float, default=COMPARE_SECONDS,
+                                help="play time per loop")
+    compare_parser.add_argument("--render-cost", type=float, default=RENDER_COST * 1000,
+                                metavar="MS", help="mean simulated drawing time per frame")
+    compare_parser.add_argument("--seed", type=int, default=COMPARE_SEED)
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        print_comparison(compare(args.seconds, args.render_cost / 1000, args.seed))
+    elif args.command == "play":
+        run(cpu=args.cpu, record_path=args.record)
+    else:
+        run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(cli())
@@ -0,0 +1,306 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Bot Tournaments
+# NEW ADDITION - Multi-process round-robin and Swiss tournaments with Elo
+# =============================================================================
+#
+# Every match is a headless game_state.step() match to WINNING_SCORE between
+# two bot controllers from bots.BOTS. Matches are sharded over a process pool
+# and results stream back with imap_unordered as soon as each one finishes,
+# updating the Elo ratings incrementally.
+#
+# With --checkpoint, finished results are saved to a JSON file every
+# CHECKPOINT_EVERY matches (written to a temp file, then renamed, so a
+# crash never leaves half a checkpoint). Running the same command again
+# skips the finished matches and rebuilds the ratings from the saved
+# results in their original order.
+#
+# Usage:
+#     python tournament.py round-robin --games 50 --workers 4
+#     python tournament.py swiss --rounds 7 --games 10 --checkpoint swiss.json
+#     python tournament.py scaling --matches 400 --workers 1,2,4
+# =============================================================================
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+import game_state as gs
+from bots import BOTS, MAX_MATCH_TICKS, play_match
+
+# =============================================================================
+# TOURNAMENT CONSTANTS
+# =============================================================================
+INITIAL_RATING = 1500
+ELO_K = 16
+CHECKPOINT_EVERY = 50  # Results between checkpoint writes
+CHUNK_SIZE = 4  # Matches handed to a worker at a time
+
+
+# =============================================================================
+# MATCHES
+# =============================================================================
+
+def run_match(spec):
+    """
+    Play one headless match (runs inside a pool worker)
+    Args:
+        spec (tuple): (match_id, left bot name, right bot name, seed)
+    Returns: Result dictionary
+    """
+    match_id, left_name, right_name, seed = spec
+    state = play_match(left_name, right_name, seed, MAX_MATCH_TICKS)
+    if state.l_score >= gs.WINNING_SCORE:
+        score = 1.0
+    elif state.r_score >= gs.WINNING_SCORE:
+        score = 0.0
+    else:
+        score = 0.5
+    return {"id": match_id, "left": left_name, "right": right_name, "score": score,
+            "l_score": state.l_score, "r_score": state.r_score, "ticks": state.tick}
+
+
+# =============================================================================
+# RATINGS
+# =============================================================================
+
+class Standings:
+    """
+    Elo ratings and win/loss/draw records, updated one result at a time
+    """
+
+    def __init__(self, bots):
+        self.rating = {bot: float(INITIAL_RATING) for bot in bots}
+        self.record = {bot: [0, 0, 0] for bot in bots}  # wins, losses, draws
+        self.points = {bot: 0.0 for bot in bots}
+        self.opponents = {bot: set() for bot in bots}
+
+    def add(self, result):
+        """
+        Apply one match result (score is from the left bot's point of view)
+        """
+        left, right, score = result["left"], result["right"], result["score"]
+        expected = 1 / (1 + 10 ** ((self.rating[right] - self.rating[left]) / 400))
+        change = ELO_K * (score - expected)
+        self.rating[left] += change
+        self.rating[right] -= change
+        self.points[left] += score
+        self.points[right] += 1 - score
+        self.opponents[left].add(right)
+        self.opponents[right].add(left)
+        outcome = 0 if score == 1 else 1 if score == 0 else 2
+        self.record[left][outcome] += 1
+        self.record[right][(1, 0, 2)[outcome]] += 1
+
+    def table(self):
+        """
+        Returns: Printable standings sorted by rating
+        """
+        lines = [f"{'bot':<10} {'rating':>7} {'points':>7}   W-L-D"]
+        for bot in sorted(self.rating, key=self.rating.get, reverse=True):
+            wins, losses, draws = self.record[bot]
+            lines.append(f"{bot:<10} {self.rating[bot]:7.1f} {self.points[bot]:7.1f}   "
+                         f"{wins}-{losses}-{draws}")
+        return "\n".join(lines)
+
+
+# =============================================================================
+# SCHEDULING
+# =============================================================================
+
+def round_robin_schedule(bots, games, seed):
+    """
+    Every pair plays `games` matches, swapping sides each game
+    Returns: List of match specs
+    """
+    specs = []
+    for i, first in enumerate(bots):
+        for second in bots[i + 1:]:
+            for game in range(games):
+                left, right = (first, second) if game % 2 == 0 else (second, first)
+                match_id = f"rr-{first}-{second}-{game}"
+                specs.append((match_id, left, right, seed + 2 * len(specs)))
+    return specs
+
+
+def swiss_pairings(standings, bots, rng):
+    """
+    Pair bots with similar points, avoiding rematches where possible
+    Returns: List of (bot, bot) pairs (one bot gets a bye on odd counts)
+    """
+    order = sorted(bots, key=lambda bot: (-standings.points[bot], -standings.rating[bot],
+                                          rng.random()))
+    pairs = []
+    while len(order) > 1:
+        first = order.pop(0)
+        partner = next((bot for bot in order if bot not in standings.opponents[first]), order[0])
+        order.remove(partner)
+        pairs.append((first, partner))
+    return pairs
+
+
+class Tournament:
+    """
+    Runs match specs on a process pool with checkpointing
+    """
+
+    def __init__(self, bots, workers, checkpoint=None, settings=None):
+        """
+        Args:
+            bots (list): Bot names taking part
+            workers (int): Pool size
+            checkpoint (str | None): JSON file to save to and resume from
+            settings (dict): Command settings stored in the checkpoint;
+                             resuming with different settings is refused
+        """
+        self.bots = bots
+        self.workers = workers
+        self.checkpoint = checkpoint
+        self.settings = settings or {}
+        self.results = []
+        self.done = set()
+        self.standings = Standings(bots)
+        self.started = time.perf_counter()
+        self.played = 0
+        if checkpoint and os.path.exists(checkpoint):
+            self._resume()
+
+    def _resume(self):
+        with open(self.checkpoint) as file:
+            saved = json.load(file)
+        if saved["settings"] != self.settings:
+            raise SystemExit(f"{self.checkpoint} was written with different settings: "
+                             f"{saved['settings']}")
+        for result in saved["results"]:
+            self._record(result)
+        print(f"resumed {len(self.results)} finished matches from {self.checkpoint}")
+
+    def _record(self, result):
+        self.results.append(result)
+        self.done.add(result["id"])
+        self.standings.add(result)
+
+    def save(self):
+        """
+        Atomically write the checkpoint file
+        """
+        if not self.checkpoint:
+            return
+        temp = self.checkpoint + ".tmp"
+        with open(temp, "w") as file:
+            json.dump({"settings": self.settings, "results": self.results}, file)
+        os.replace(temp, self.checkpoint)
+
+    def run(self, specs, pool):
+        """
+        Play every spec not finished yet, updating ratings as results arrive
+        Args:
+            specs (list): Match specs
+            pool: multiprocessing Pool
+        """
+        todo = [spec for spec in specs if spec[0] not in self.done]
+        for result in pool.imap_unordered(run_match, todo, chunksize=CHUNK_SIZE):
+            self._record(result)
+            self.played += 1
+            if self.played % CHECKPOINT_EVERY == 0:
+                self.save()
+        self.save()
+
+    def rate(self):
+        """
+        Returns: Matches per second played in this session
+        """
+        return self.played / max(1e-9, time.perf_counter() - self.started)
+
+
+def run_round_robin(args):
+    specs = round_robin_schedule(args.bots, args.games, args.seed)
+    settings = {"format": "round-robin", "bots": args.bots, "games": args.games, "seed": args.seed}
+    tournament = Tournament(args.bots, args.workers, args.checkpoint, settings)
+    with multiprocessing.Pool(args.workers) as pool:
+        tournament.run(specs, pool)
+    return tournament
+
+
+def run_swiss(args):
+    settings = {"format": "swiss", "bots": args.bots, "rounds": args.rounds,
+                "games": args.games, "seed": args.seed}
+    tournament = Tournament(args.bots, args.workers, args.checkpoint, settings)
+    rng = random.Random(args.seed)
+    with multiprocessing.Pool(args.workers) as pool:
+        for round_number in range(args.rounds):
+            # Rebuild standings from completed rounds only, so resumed runs
+            # pair exactly like the original run did
+            standings = Standings(args.bots)
+            for result in tournament.results:
+                if int(result["id"].split("-")[1]) < round_number:
+                    standings.add(result)
+            specs = []
+            for first, second in swiss_pairings(standings, args.bots, rng):
+                for game in range(args.games):
+                    left, right = (first, second) if game % 2 == 0 else (second, first)
+                    match_id = f"sw-{round_number}-{first}-{second}-{game}"
+                    seed = args.seed + 1_000_003 * round_number + 2 * len(specs)
+                    specs.append((match_id, left, right, seed))
+            tournament.run(specs, pool)
+            print(f"round {round_number + 1}/{args.rounds} done")
+    return tournament
+
+
+def run_scaling(args):
+    """
+    Matches/sec for a fixed batch at each worker count
+    """
+    bots = args.bots
+    specs = [(f"scale-{i}", bots[i % len(bots)], bots[(i + 1) % len(bots)], args.seed + 2 * i)
+             for i in range(args.matches)]
+    baseline = None
+    print(f"{'workers':>7} {'matches/s':>10} {'speedup':>8}")
+    for workers in args.worker_counts:
+        with multiprocessing.Pool(workers) as pool:
+            start = time.perf_counter()
+            for _ in pool.imap_unordered(run_match, specs, chunksize=CHUNK_SIZE):
+                pass
+            rate = len(specs) / (time.perf_counter() - start)
+        baseline = baseline or rate
+        print(f"{workers:>7} {rate:>10.1f} {rate / baseline:>7.2f}x")
+    print(f"({os.cpu_count()} CPUs available)")
+
+
+def main(argv=None):
+    """
+    Command line entry point
+    """
+    parser = argparse.ArgumentParser(description="Pong bot tournaments")
+    sub = parser.add_subparsers(dest="mode", required=True)
+    rr = sub.add_parser("round-robin", help="every bot plays every other bot")
+    swiss = sub.add_parser("swiss", help="Swiss-system rounds")
+    swiss.add_argument("--rounds", type=int, default=5)
+    scaling = sub.add_parser("scaling", help="matches/sec against worker count")
+    scaling.add_argument("--matches", type=int, default=400)
+    scaling.add_argument("--workers", dest="worker_counts", default="1,2,4",
+                         type=lambda text: [int(n) for n in text.split(",")])
+    for sub_parser in (rr, swiss):
+        sub_parser.add_argument("--games", type=int, default=10, help="games per pairing")
+        sub_parser.add_argument("--workers", type=int, default=os.cpu_count())
+        sub_parser.add_argument("--checkpoint", metavar="FILE", help="save/resume progress")
+    for sub_parser in (rr, swiss, scaling):
+        sub_parser.add_argument("--bots", nargs="+", default=sorted(BOTS), choices=sorted(BOTS))
+        sub_parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.mode == "scaling":
+        run_scaling(args)
+        return 0
+    tournament = run_round_robin(args) if args.mode == "round-robin" else run_swiss(args)
+    print(tournament.standings.table())
+    print(f"{len(tournament.results)} matches, {tournament.played} this run "
+          f"at {tournament.rate():.1f} matches/s with {args.workers} workers")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
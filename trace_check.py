@@ -0,0 +1,496 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Differential Trace Checker
+# NEW ADDITION - Tick-exact comparison of game engines against main()
+# =============================================================================
+#
+# main() defines the rules, including details that are easy to lose in a
+# faster rewrite:
+# - check_paddle_collision() uses strict > / <, so a ball exactly on a band
+#   edge, or exactly 50 px from the paddle centre, misses
+# - the wall check runs before the paddle check (both can fire in one tick)
+# - reset_position() calls bounce_x(), so every serve also scales
+#   move_speed
+#
+# This module runs the unmodified main() on fake_turtle's display-free
+# screen. A screen.update() hook sets the start state, presses the keys
+# of an input sequence and records the state after every tick. The record
+# is a compact trace of state_codec deltas, about 13 bytes a tick. Any
+# engine - a function advance(state, inputs, ticks) - is traced the same
+# way. The first tick where two traces disagree is reported with a
+# field-by-field diff.
+#
+# The Turtle loop is far too slow to fuzz with, so checking has two tiers:
+# - check: Turtle traces against game_state.step() and the chosen engine
+# - fuzz:  game_state.step() is the oracle for millions of short random
+#          sequences on a process pool, and is itself compared with the
+#          Turtle loop every TURTLE_EVERY sequences. Engines are compared
+#          after every input segment, so engines that jump ahead keep
+#          their speed. A mismatch is re-run tick by tick to find the
+#          first tick that differs.
+#
+# Random start states are biased towards the exact band, paddle-edge and
+# wall positions where the strict comparisons decide the outcome.
+#
+# Usage:
+#     python trace_check.py check --engine event --sequences 100
+#     python trace_check.py fuzz --engine event --sequences 1000000
+#     python trace_check.py fuzz --engine my_engine:advance --workers 8
+# =============================================================================
+
+import argparse
+import importlib
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+import event_engine
+import game_state as gs
+import state_codec
+
+# =============================================================================
+# TRACE CONSTANTS
+# =============================================================================
+CHECK_TICKS = 3000  # Most ticks per Turtle-checked sequence
+FUZZ_TICKS = 300  # Most ticks per fuzzed sequence
+HOLD_TICKS = 40  # Longest time one input pair is held
+TURTLE_EVERY = 2000  # Fuzz: also run every Nth sequence through main()
+BATCH_SEQUENCES = 2000  # Fuzz sequences per pool task
+BOUNDARY_SHARE = 0.5  # Share of start states placed on a collision boundary
+MAX_SPEED_HITS = 15  # Paddle hits a random start state's move_speed may have
+REPORT_FAILURES = 5
+
+# Keys main()'s setup_controls() binds, by (side, direction)
+KEYS = {(0, gs.MOVE_UP): "w", (0, gs.MOVE_DOWN): "s",
+        (1, gs.MOVE_UP): "Up", (1, gs.MOVE_DOWN): "Down"}
+
+
+# =============================================================================
+# ENGINES - advance(state, inputs, ticks): run `ticks` ticks or until game over
+# =============================================================================
+
+def advance_step(state, inputs, ticks):
+    """
+    game_state.step() one tick at a time (the fuzzing oracle)
+    """
+    while ticks and not state.game_over:
+        gs.step(state, inputs)
+        ticks -= 1
+
+
+def _event_engine(swept):
+    def advance(state, inputs, ticks):
+        while ticks and not state.game_over:
+            done, _ = event_engine.advance(state, inputs, ticks, swept)
+            ticks -= done
+    return advance
+
+
+ENGINES = {
+    "step": advance_step,
+    "event": _event_engine(swept=True),
+    "event-unswept": _event_engine(swept=False),
+}
+
+
+def load_engine(name):
+    """
+    Args:
+        name (str): Key of ENGINES, or "module:function" for any other engine
+    Returns: advance(state, inputs, ticks) function
+    """
+    if name in ENGINES:
+        return ENGINES[name]
+    module, _, function = name.partition(":")
+    if not function:
+        raise SystemExit(f"unknown engine {name!r} (choose from {', '.join(ENGINES)} "
+                         f"or give module:function)")
+    return getattr(importlib.import_module(module), function)
+
+
+# =============================================================================
+# TRACES
+# =============================================================================
+
+def engine_trace(advance, start, inputs):
+    """
+    Trace an engine one tick at a time
+    Args:
+        advance: Engine function
+        start (GameState): State before the first tick (not modified)
+        inputs (list): (left, right) pair for every tick
+    Returns: bytearray - start state, then the state after every tick
+             until the inputs run out or the match ends
+    """
+    state = start.copy()
+    trace = bytearray(state_codec.encode(state))
+    previous = state.copy()
+    for pair in inputs:
+        if state.game_over:
+            break
+        advance(state, pair, 1)
+        trace += state_codec.encode(state, previous)
+        previous = state.copy()
+    return trace
+
+
+class _Stop(Exception):
+    """Ends main() once the input sequence is used up"""
+
+
+def turtle_trace(start, inputs):
+    """
+    Trace the real main() loop on fake_turtle's display-free screen
+    Args:
+        start (GameState): Court to set up before the first tick
+        inputs (list): (left, right) pair for every tick, played as key presses
+    Returns: bytearray in the same format as engine_trace()
+    """
+    import fake_turtle
+    screen = fake_turtle.install()
+    import main
+
+    objects = {}
+    trace = bytearray()
+    previous = [None]
+    iterations = [0]
+    original_setup = main.setup_game_objects
+
+    def setup_game_objects():
+        objects["all"] = original_setup()
+        return objects["all"]
+
+    def record(state):
+        trace.extend(state_codec.encode(state, previous[0]))
+        previous[0] = state
+
+    def on_update():
+        # Runs at the top of every loop iteration, where key handlers run
+        n = iterations[0]
+        iterations[0] += 1
+        r_paddle, l_paddle, ball, scoreboard, _ = objects["all"]
+        if n == 0:
+            ball.draw_state(start)
+            l_paddle.draw_y(start.l_y)
+            r_paddle.draw_y(start.r_y)
+            scoreboard.draw_state(start)
+        record(gs.capture_state(ball, l_paddle, r_paddle, scoreboard, start.tick + n))
+        if n == len(inputs):
+            raise _Stop
+        for side, direction in enumerate(inputs[n]):
+            if direction:
+                screen.release(KEYS[side, direction])
+
+    screen.on_update = on_update
+    main.setup_game_objects = setup_game_objects
+    real_sleep = main.time.sleep
+    main.time.sleep = lambda seconds: None
+    try:
+        main.main()
+        r_paddle, l_paddle, ball, scoreboard, _ = objects["all"]
+        record(gs.capture_state(ball, l_paddle, r_paddle, scoreboard,
+                             start.tick + iterations[0], True))
+    except _Stop:
+        pass
+    finally:
+        main.time.sleep = real_sleep
+        main.setup_game_objects = original_setup
+    return trace
+
+
+def decode_trace(trace):
+    """
+    Yields: GameState for every tick of a trace
+    """
+    offset, state = 0, None
+    while offset < len(trace):
+        state = state_codec.decode(trace, state, offset)
+        offset += state_codec.encoded_size(trace, offset)
+        yield state
+
+
+def first_divergence(expected, actual):
+    """
+    Compare two traces tick by tick
+    Args:
+        expected, actual: Traces from engine_trace() / turtle_trace()
+    Returns: None if identical, else dict with the index of the first
+             differing tick and the expected / actual GameState (None if
+             that trace had already ended)
+    """
+    if expected == actual:
+        return None
+    missing = object()
+    expected_states, actual_states = decode_trace(expected), decode_trace(actual)
+    index = 0
+    while True:
+        want, got = next(expected_states, missing), next(actual_states, missing)
+        if want != got:
+            return {"index": index, "expected": None if want is missing else want,
+                    "actual": None if got is missing else got}
+        index += 1
+
+
+def state_diff(expected, actual):
+    """
+    Returns: "field expected != actual" text for every differing field
+    """
+    if expected is None or actual is None:
+        return "expected trace ended" if expected is None else "actual trace ended"
+    return ", ".join(f"{name} {getattr(expected, name)!r} != {getattr(actual, name)!r}"
+                     for name in gs.GameState.__slots__
+                     if getattr(expected, name) != getattr(actual, name))
+
+
+# =============================================================================
+# RANDOM SEQUENCES
+# =============================================================================
+
+def _near(rng, value):
+    return value + rng.choice((-10, 0, 0, 10))
+
+
+def random_state(rng):
+    """
+    A state main() can reach (10 px ball grid, 20 px paddle grid), placed
+    on a collision boundary BOUNDARY_SHARE of the time
+    """
+    state = gs.GameState()
+    state.l_y = rng.randrange(-12, 13) * gs.PADDLE_SPEED
+    state.r_y = rng.randrange(-12, 13) * gs.PADDLE_SPEED
+    state.x_move = rng.choice((-1, 1)) * gs.INITIAL_MOVE_DISTANCE
+    state.y_move = rng.choice((-1, 1)) * gs.INITIAL_MOVE_DISTANCE
+    state.l_score = rng.randrange(gs.WINNING_SCORE)
+    state.r_score = rng.randrange(gs.WINNING_SCORE)
+    state.tick = rng.randrange(10_000)
+    for _ in range(rng.randrange(MAX_SPEED_HITS)):
+        state.move_speed *= gs.SPEED_INCREASE_FACTOR
+
+    if rng.random() < BOUNDARY_SHARE:
+        right = state.x_move > 0
+        paddle_y = state.r_y if right else state.l_y
+        band = (gs.RIGHT_PADDLE_X_BOUNDARY, gs.RIGHT_PADDLE_X_BOUNDARY + gs.PADDLE_BAND_DEPTH,
+                gs.RIGHT_BOUNDARY)
+        state.x = _near(rng, rng.choice(band)) * (1 if right else -1)
+        state.y = _near(rng, rng.choice((paddle_y - gs.PADDLE_HALF_HEIGHT,
+                                         paddle_y + gs.PADDLE_HALF_HEIGHT,
+                                         rng.choice((-1, 1)) * gs.WALL_BOUNDARY)))
+    else:
+        state.x = rng.randrange(-37, 38) * gs.INITIAL_MOVE_DISTANCE
+        state.y = rng.randrange(-28, 29) * gs.INITIAL_MOVE_DISTANCE
+    return state
+
+
+def random_segments(rng, ticks):
+    """
+    Returns: List of ((left, right), hold) covering `ticks` ticks
+    """
+    segments, left = [], ticks
+    moves = (gs.MOVE_DOWN, gs.MOVE_NONE, gs.MOVE_UP)
+    while left:
+        hold = min(left, rng.randrange(1, HOLD_TICKS + 1))
+        segments.append(((rng.choice(moves), rng.choice(moves)), hold))
+        left -= hold
+    return segments
+
+
+def per_tick(segments):
+    """
+    Returns: One input pair per tick
+    """
+    return [pair for pair, hold in segments for _ in range(hold)]
+
+
+def random_case(rng, max_ticks, kickoff=False):
+    """
+    Returns: Tuple (start GameState, segments) - kickoff starts from a new match
+    """
+    start = gs.GameState() if kickoff else random_state(rng)
+    return start, random_segments(rng, rng.randrange(1, max_ticks + 1))
+
+
+# =============================================================================
+# CHECKING
+# =============================================================================
+
+def run_case(advance, start, segments):
+    """
+    Run the oracle and an engine side by side, comparing after each segment
+    Returns: Tuple (ticks run, failure dict or None)
+    """
+    expected, actual = start.copy(), start.copy()
+    ticks = 0
+    for number, (pair, hold) in enumerate(segments):
+        before = expected.copy()
+        advance_step(expected, pair, hold)
+        advance(actual, pair, hold)
+        ticks += expected.tick - before.tick
+        if expected != actual:
+            # Re-run this segment tick by tick from the last agreeing state
+            divergence = first_divergence(engine_trace(advance_step, before, [pair] * hold),
+                                          engine_trace(advance, before, [pair] * hold))
+            if divergence is None:
+                divergence = {"index": hold, "expected": expected, "actual": actual,
+                              "note": f"only when advancing {hold} ticks at once"}
+            divergence["tick"] = before.tick + divergence["index"]
+            divergence.update(start=start, segments=segments, segment=number)
+            return ticks, divergence
+        if expected.game_over:
+            break
+    return ticks, None
+
+
+def check_turtle(start, segments, advance=None):
+    """
+    Compare main() with game_state.step() (and an engine) on one sequence
+    Returns: Tuple (turtle trace, failure dict or None)
+    """
+    inputs = per_tick(segments)
+    reference = turtle_trace(start, inputs)
+    for name, engine in (("step", advance_step), ("engine", advance)):
+        if engine is None:
+            continue
+        divergence = first_divergence(reference, engine_trace(engine, start, inputs))
+        if divergence:
+            divergence.update(tick=start.tick + divergence["index"], start=start,
+                              segments=segments, against=f"main() vs {name}")
+            return reference, divergence
+    return reference, None
+
+
+def format_failure(failure):
+    """
+    Returns: Multi-line report of where and how a case diverged
+    """
+    where = f"segment {failure['segment']}" if "segment" in failure else "the sequence"
+    heading = f"first divergence at tick {failure['tick']} ({failure['index']} ticks into {where})"
+    for extra in ("against", "note"):
+        if extra in failure:
+            heading += f" - {failure[extra]}"
+    lines = [heading,
+             f"  diff:     {state_diff(failure['expected'], failure['actual'])}",
+             f"  expected: {failure['expected']!r}",
+             f"  actual:   {failure['actual']!r}",
+             f"  start:    {failure['start']!r}",
+             f"  inputs:   {failure['segments']!r}"]
+    return "\n".join(lines)
+
+
+def fuzz_batch(task):
+    """
+    Pool task: fuzz a batch of random sequences
+    Args:
+        task (tuple): (engine name, seed, sequences, max ticks, turtle_every)
+    Returns: Tuple (sequences, ticks, turtle sequences, failures)
+    """
+    engine, seed, count, max_ticks, turtle_every = task
+    advance = load_engine(engine)
+    rng = random.Random(seed)
+    ticks = turtle_runs = 0
+    failures = []
+    for number in range(count):
+        start, segments = random_case(rng, max_ticks, kickoff=number % 10 == 0)
+        done, failure = run_case(advance, start, segments)
+        ticks += done
+        if failure is None and turtle_every and number % turtle_every == 0:
+            _, failure = check_turtle(start, segments)
+            turtle_runs += 1
+        if failure is not None and len(failures) < REPORT_FAILURES:
+            failures.append(failure)
+    return count, ticks, turtle_runs, failures
+
+
+def fuzz(engine, sequences, workers, seed=0, max_ticks=FUZZ_TICKS, turtle_every=TURTLE_EVERY):
+    """
+    Fuzz an engine against game_state.step() on a process pool
+    Returns: Dictionary with sequences, ticks, turtle_runs, failures, seconds
+    """
+    load_engine(engine)  # Fail early on a bad name
+    tasks = []
+    for batch, first in enumerate(range(0, sequences, BATCH_SEQUENCES)):
+        tasks.append((engine, seed * 1_000_003 + batch, min(BATCH_SEQUENCES, sequences - first),
+                      max_ticks, turtle_every))
+    totals = {"sequences": 0, "ticks": 0, "turtle_runs": 0, "failures": []}
+    started = time.perf_counter()
+    pool = multiprocessing.Pool(workers) if workers else None
+    try:
+        results = pool.imap_unordered(fuzz_batch, tasks) if pool else map(fuzz_batch, tasks)
+        for count, ticks, turtle_runs, failures in results:
+            totals["sequences"] += count
+            totals["ticks"] += ticks
+            totals["turtle_runs"] += turtle_runs
+            totals["failures"].extend(failures)
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+    totals["seconds"] = time.perf_counter() - started
+    return totals
+
+
+# =============================================================================
+# COMMAND LINE
+# =============================================================================
+
+def run_check(args):
+    rng = random.Random(args.seed)
+    advance = load_engine(args.engine)
+    ticks = size = failed = 0
+    started = time.perf_counter()
+    for number in range(args.sequences):
+        start, segments = random_case(rng, args.ticks, kickoff=number % 2 == 0)
+        trace, failure = check_turtle(start, segments, advance)
+        ticks += sum(1 for _ in decode_trace(trace)) - 1
+        size += len(trace)
+        if failure:
+            failed += 1
+            if failed <= REPORT_FAILURES:
+                print(format_failure(failure))
+    elapsed = time.perf_counter() - started
+    print(f"{args.sequences} sequences, {ticks:,} ticks through main() at {ticks / elapsed:,.0f} ticks/s, "
+          f"traces {size / max(ticks, 1):.1f} bytes/tick")
+    print(f"main() vs step vs {args.engine}: {'OK' if not failed else f'{failed} sequences diverged'}")
+    return 1 if failed else 0
+
+
+def run_fuzz(args):
+    totals = fuzz(args.engine, args.sequences, args.workers, args.seed, args.ticks,
+                  args.turtle_every)
+    for failure in totals["failures"][:REPORT_FAILURES]:
+        print(format_failure(failure))
+    seconds = totals["seconds"]
+    print(f"{totals['sequences']:,} sequences, {totals['ticks']:,} ticks in {seconds:.1f}s "
+          f"({totals['sequences'] / seconds:,.0f} sequences/s, {totals['ticks'] / seconds:,.0f} ticks/s, "
+          f"{args.workers} workers); {totals['turtle_runs']} also checked against main()")
+    failed = len(totals["failures"])
+    print(f"step vs {args.engine}: {'OK' if not failed else f'{failed}+ sequences diverged'}")
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    """
+    Command line entry point
+    """
+    parser = argparse.ArgumentParser(description="Tick-exact engine checks against main()")
+    sub = parser.add_subparsers(dest="command", required=True)
+    check = sub.add_parser("check", help="trace main() itself against step() and an engine")
+    check.add_argument("--sequences", type=int, default=100)
+    check.add_argument("--ticks", type=int, default=CHECK_TICKS, help="most ticks per sequence")
+    fuzz_parser = sub.add_parser("fuzz", help="many short random sequences against step()")
+    fuzz_parser.add_argument("--sequences", type=int, default=100_000)
+    fuzz_parser.add_argument("--ticks", type=int, default=FUZZ_TICKS, help="most ticks per sequence")
+    fuzz_parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                             help="processes (0 = run in this process)")
+    fuzz_parser.add_argument("--turtle-every", type=int, default=TURTLE_EVERY,
+                             help="also run every Nth sequence through main() (0 = never)")
+    for sub_parser in (check, fuzz_parser):
+        sub_parser.add_argument("--engine", default="event",
+                                help=f"{', '.join(ENGINES)} or module:function")
+        sub_parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    return run_check(args) if args.command == "check" else run_fuzz(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
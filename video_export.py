@@ -0,0 +1,514 @@
+# =============================================================================
+# Angela Yu's 100 Days of Code Challenge - Day 22: Video Export
+# NEW ADDITION - Replays to animated GIF or PNG frames, rendered in parallel
+# =============================================================================
+#
+# Screen-recording the Tk window drops frames and needs a display. This
+# module renders a replay offscreen with rasterizer.Rasterizer (the court
+# geometry of CenterLine, Scoreboard and Paddle from court.py) and streams
+# the frames to disk:
+#
+# - The replay is first simulated once without drawing anything. That
+#   pass decides which ticks become frames (at most FRAME_RATE per second
+#   of match time - faster ticks are merged) and splits the frames into
+#   chunks of CHUNK_FRAMES, each with the GameState it starts from.
+# - A process pool renders the chunks. Each worker re-simulates only its
+#   own tick range and writes its frames straight to a part file (GIF) or
+#   to numbered PNG files, so no process ever holds more than two frames.
+# - The parent appends finished GIF parts to the output in chunk order
+#   while later chunks are still rendering.
+#
+# GIF frames only cover the box that changed since the previous frame,
+# with unchanged pixels inside it transparent, and are LZW-compressed here
+# (no imaging library needed). Frame delays follow the match's real
+# timing. A PNG export also writes frames.ffconcat with the same timing:
+#     ffmpeg -f concat -i frames/frames.ffconcat highlight.mp4
+#
+# Usage:
+#     python video_export.py match.pong highlight.gif
+#     python video_export.py match.pong frames/ --png --workers 4
+#     python video_export.py match.pong rally.gif --start 300 --stop 900 --size 800x600
+# =============================================================================
+
+import argparse
+import multiprocessing
+import os
+import shutil
+import struct
+import sys
+import time
+import zlib
+from array import array
+
+import numpy as np
+
+import game_state as gs
+from rasterizer import Rasterizer
+from replay import Replay, encode_inputs, decode_inputs
+
+# =============================================================================
+# EXPORT CONSTANTS
+# =============================================================================
+EXPORT_SIZE = (400, 300)
+FRAME_RATE = 50  # Most frames per second of match time
+FINAL_FRAME_CS = 300  # Centiseconds the last frame stays on screen
+CHUNK_FRAMES = 400  # Frames per process pool task
+
+# GIF - palette index 0 black, 1 white, 2 transparent (unchanged pixel)
+GIF_PALETTE = bytes((0, 0, 0, 255, 255, 255, 0, 0, 0, 0, 0, 0))
+GIF_PALETTE_BITS = 1  # Global color table of 2 ** (1 + 1) entries
+GIF_MIN_CODE_SIZE = 2
+GIF_MAX_CODE = 4095
+GIF_SUB_BLOCK = 255
+TRANSPARENT = 2
+DISPOSE_KEEP = 1  # Leave each frame in place under the next one
+GIF_LOOP = 0  # Repeat forever
+
+# PNG
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PNG_LEVEL = 6
+FRAME_NAME = "frame_{:06d}.png"
+CONCAT_NAME = "frames.ffconcat"
+
+
+# =============================================================================
+# FRAME TIMING
+# =============================================================================
+
+class Timeline:
+    """
+    Steps a match tick by tick and picks the ticks that become frames
+
+    main() sleeps move_speed seconds before every tick, so tick times are
+    known without a clock. A tick becomes a frame when it is shown at least
+    1 / rate seconds after the previous frame.
+    """
+
+    def __init__(self, state, elapsed=0.0, frame_cs=0, rate=FRAME_RATE):
+        """
+        Args:
+            state (GameState): State to step (modified in place)
+            elapsed (float): Match seconds from tick 0 to this state
+            frame_cs (int): Time of the previous frame in centiseconds
+            rate (int): Most frames per second
+        """
+        self.state = state
+        self.elapsed = elapsed
+        self.frame_cs = frame_cs
+        self.min_cs = max(1, round(100 / rate))
+
+    def step(self, code):
+        """
+        Advance one tick
+        Args:
+            code (int): Input code from replay.encode_inputs()
+        Returns: Frame time in centiseconds if this tick is a new frame, else None
+        """
+        self.elapsed += self.state.move_speed
+        gs.step(self.state, decode_inputs(code))
+        cs = round(self.elapsed * 100)
+        if cs - self.frame_cs < self.min_cs:
+            return None
+        self.frame_cs = cs
+        return cs
+
+
+def plan_chunks(codes, start=0, stop=None, rate=FRAME_RATE, chunk_frames=CHUNK_FRAMES):
+    """
+    Simulate the match once (no drawing) and split its frames into chunks
+    Args:
+        codes (bytes): One input code per tick
+        start (int): First tick to export
+        stop (int | None): Tick to stop at (default: end of match)
+        rate (int): Most frames per second
+        chunk_frames (int): Frames per chunk
+    Returns: Tuple (list of chunk dicts, total frames)
+    """
+    stop = len(codes) if stop is None else min(stop, len(codes))
+    timeline = Timeline(gs.GameState(), rate=rate)
+    for code in codes[:start]:
+        timeline.step(code)
+    timeline.frame_cs = round(timeline.elapsed * 100)
+
+    def chunk(base, emit_base, first_frame):
+        state, elapsed, frame_cs = base
+        return {"state": state, "elapsed": elapsed, "frame_cs": frame_cs, "emit_base": emit_base,
+                "first_frame": first_frame, "frames": 0, "codes_from": state.tick}
+
+    # The first chunk starts with the frame at `start`; later chunks start after
+    # the last frame of the chunk before, which they render only to diff against
+    last_frame = (timeline.state.copy(), timeline.elapsed, timeline.frame_cs)
+    chunks = [chunk(last_frame, True, 0)]
+    chunks[0]["frames"] = 1
+    frames = 1
+    for tick in range(start, stop):
+        if timeline.step(codes[tick]) is None:
+            continue
+        if chunks[-1]["frames"] == chunk_frames:
+            chunks[-1]["codes_to"] = tick + 1  # Look ahead to this frame for the last delay
+            chunks.append(chunk(last_frame, False, frames))
+        chunks[-1]["frames"] += 1
+        frames += 1
+        last_frame = (timeline.state.copy(), timeline.elapsed, timeline.frame_cs)
+    chunks[-1]["codes_to"] = stop
+    return chunks, frames
+
+
+# =============================================================================
+# GIF ENCODING
+# =============================================================================
+
+def lzw_encode(pixels, min_code_size=GIF_MIN_CODE_SIZE):
+    """
+    Variable-length LZW as used by GIF (same code-size steps as giflib)
+
+    Frames are mostly long runs of one index. LZW adds the strings of one
+    repeated index in order of length, so runs[v] lists the codes for 1, 2,
+    3... copies of v and a run is matched by jumping along that list
+    instead of looking up every pixel.
+
+    Args:
+        pixels (bytes): Palette indices, at least one
+        min_code_size (int): Bits per index (at least 2)
+    Returns: bytes (before splitting into sub-blocks)
+    """
+    clear = 1 << min_code_size
+    out = bytearray()
+    bits = count = 0
+    size = min_code_size + 1
+    next_code = clear + 2
+    table = {}
+    runs = [[value] for value in range(clear)]  # runs[v][k]: code for k + 1 copies of v
+
+    def emit(code):
+        nonlocal bits, count, size
+        bits |= code << count
+        count += size
+        while count >= 8:
+            out.append(bits & 0xFF)
+            bits >>= 8
+            count -= 8
+        if next_code >= 1 << size:
+            size += 1
+
+    def miss(prefix, pixel, extends_run):
+        """
+        Emit prefix and add prefix + pixel to the table (new table when full)
+        """
+        nonlocal next_code, size
+        emit(prefix)
+        if next_code >= GIF_MAX_CODE:
+            emit(clear)
+            table.clear()
+            for run in runs:
+                del run[1:]
+            next_code = clear + 2
+            size = min_code_size + 1
+        else:
+            table[prefix << 8 | pixel] = next_code
+            if extends_run:
+                runs[pixel].append(next_code)
+            next_code += 1
+
+    data = np.frombuffer(pixels, dtype=np.uint8)
+    starts = np.concatenate(([0], np.flatnonzero(data[1:] != data[:-1]) + 1))
+    lengths = np.diff(np.append(starts, data.size))
+
+    emit(clear)
+    prefix = None
+    for pixel, rest in zip(data[starts].tolist(), lengths.tolist()):
+        if prefix is None:
+            length, rest = 1, rest - 1  # First pixel of the image
+        else:
+            # The previous run had another index, so prefix + pixel is mixed
+            length = 0
+            while rest and not length:
+                code = table.get(prefix << 8 | pixel)
+                if code is not None:
+                    prefix = code
+                else:
+                    miss(prefix, pixel, False)
+                    length = 1
+                rest -= 1
+            if not length:
+                continue
+        # prefix is now `length` copies of pixel - match the rest of the run
+        while rest:
+            codes = runs[pixel]
+            if length + rest <= len(codes):
+                length += rest
+                break
+            rest -= len(codes) - length + 1
+            miss(codes[-1], pixel, True)
+            length = 1
+        prefix = runs[pixel][length - 1]
+    emit(prefix)
+    emit(clear + 1)
+    if count:
+        out.append(bits & 0xFF)
+    return bytes(out)
+
+
+def _sub_blocks(data):
+    return b"".join(bytes((len(data[i:i + GIF_SUB_BLOCK]),)) + data[i:i + GIF_SUB_BLOCK]
+                    for i in range(0, len(data), GIF_SUB_BLOCK)) + b"\x00"
+
+
+def gif_header(width, height):
+    """
+    Returns: bytes from the GIF signature to the looping extension
+    """
+    return (b"GIF89a" + struct.pack("<HHBBB", width, height, 0x80 | GIF_PALETTE_BITS, 0, 0)
+            + GIF_PALETTE + b"\x21\xff\x0bNETSCAPE2.0\x03\x01" + struct.pack("<H", GIF_LOOP)
+            + b"\x00")
+
+
+class GifPartWriter:
+    """
+    Writes a chunk's frames as GIF blocks (no header) to a part file
+
+    A frame's delay is only known when the next frame is found, so the
+    newest frame is kept encoded until finish_frame() gives its delay.
+    """
+
+    def __init__(self, path, height, width):
+        self.file = open(path, "wb")
+        self.previous = np.zeros((height, width), dtype=np.uint8)
+        self.changed = np.zeros((height, width), dtype=bool)
+        self.pending = None
+
+    def reference(self, frame):
+        """
+        Diff the next frame against this one (last frame of the chunk before)
+        """
+        np.copyto(self.previous, frame)
+
+    def frame(self, frame, full=False):
+        """
+        Encode the box of pixels that changed since the previous frame
+        Args:
+            frame (ndarray): Grey frame from Rasterizer.render()
+            full (bool): Encode the whole frame (first frame of the GIF)
+        """
+        np.not_equal(frame, self.previous, out=self.changed)
+        if full:
+            self.changed[:] = True
+        rows = np.flatnonzero(self.changed.any(axis=1))
+        cols = np.flatnonzero(self.changed.any(axis=0))
+        if rows.size:
+            top, bottom, left, right = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+        else:
+            top, bottom, left, right = 0, 1, 0, 1  # Nothing moved - one transparent pixel
+        box = (slice(top, bottom), slice(left, right))
+        indices = np.where(self.changed[box], frame[box] >> 7, TRANSPARENT).astype(np.uint8)
+        np.copyto(self.previous, frame)
+        self.pending = (struct.pack("<BHHHHB", 0x2C, left, top, right - left, bottom - top, 0)
+                        + bytes((GIF_MIN_CODE_SIZE,)) + _sub_blocks(lzw_encode(indices.tobytes())))
+
+    def finish_frame(self, delay):
+        """
+        Write the pending frame, shown for `delay` centiseconds
+        """
+        control = struct.pack("<BBBBHBB", 0x21, 0xF9, 4, DISPOSE_KEEP << 2 | 1, delay, TRANSPARENT, 0)
+        self.file.write(control + self.pending)
+        self.pending = None
+
+    def close(self):
+        self.file.close()
+
+
+# =============================================================================
+# PNG ENCODING
+# =============================================================================
+
+def _png_chunk(kind, data):
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def encode_png(frame):
+    """
+    Args:
+        frame (ndarray): uint8 (height, width) grey frame
+    Returns: PNG file contents
+    """
+    height, width = frame.shape
+    rows = np.zeros((height, width + 1), dtype=np.uint8)  # Filter byte 0 in front of every row
+    rows[:, 1:] = frame
+    return (PNG_SIGNATURE + _png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 0, 0, 0, 0))
+            + _png_chunk(b"IDAT", zlib.compress(rows.tobytes(), PNG_LEVEL)) + _png_chunk(b"IEND", b""))
+
+
+class PngWriter:
+    """
+    Writes every frame of a chunk to its own numbered PNG file
+    """
+
+    def __init__(self, directory, first_frame):
+        self.directory = directory
+        self.number = first_frame
+
+    def reference(self, frame):
+        pass  # Every PNG is a full frame
+
+    def frame(self, frame, full=False):
+        with open(os.path.join(self.directory, FRAME_NAME.format(self.number)), "wb") as file:
+            file.write(encode_png(frame))
+        self.number += 1
+
+    def finish_frame(self, delay):
+        pass  # Delays go to the concat list written by the parent
+
+    def close(self):
+        pass
+
+
+# =============================================================================
+# RENDERING
+# =============================================================================
+
+def render_chunk(task):
+    """
+    Pool task: re-simulate one chunk's ticks and write its frames
+    Args:
+        task (tuple): (chunk index, chunk dict with its codes, output format,
+                      part file or PNG directory, (width, height), rate)
+    Returns: Tuple (chunk index, frame delays as array('H') bytes, seconds)
+    """
+    index, chunk, fmt, target, size, rate = task
+    started = time.perf_counter()
+    rasterizer = Rasterizer(*size)
+    writer = (GifPartWriter(target, size[1], size[0]) if fmt == "gif"
+              else PngWriter(target, chunk["first_frame"]))
+    timeline = Timeline(chunk["state"], chunk["elapsed"], chunk["frame_cs"], rate)
+    delays = array("H")
+
+    rendered, frame_cs = 0, chunk["frame_cs"]
+    frame = rasterizer.render(timeline.state)
+    if chunk["emit_base"]:
+        writer.frame(frame, full=index == 0)
+        rendered = 1
+    else:
+        writer.reference(frame)
+    for code in chunk["codes"]:
+        cs = timeline.step(code)
+        if cs is None:
+            continue
+        if rendered:
+            delays.append(cs - frame_cs)
+            writer.finish_frame(delays[-1])
+        if rendered == chunk["frames"]:
+            break  # Only looked ahead for the last delay
+        writer.frame(rasterizer.render(timeline.state))
+        rendered += 1
+        frame_cs = cs
+    else:
+        delays.append(FINAL_FRAME_CS)
+        writer.finish_frame(FINAL_FRAME_CS)
+    writer.close()
+    return index, delays.tobytes(), time.perf_counter() - started
+
+
+def export(replay_path, output, fmt="gif", size=EXPORT_SIZE, workers=None, start=0, stop=None,
+           rate=FRAME_RATE, chunk_frames=CHUNK_FRAMES):
+    """
+    Render a replay to an animated GIF or a directory of PNG frames
+    Args:
+        replay_path (str): Replay file from `main.py --record`
+        output (str): GIF file, or directory for PNG frames
+        fmt (str): "gif" or "png"
+        size (tuple): (width, height) in pixels
+        workers (int | None): Pool size, 0 renders in this process (default: CPU count)
+        start (int): First tick to export
+        stop (int | None): Tick to stop at (default: end of match)
+        rate (int): Most frames per second
+        chunk_frames (int): Frames per pool task
+    Returns: Dictionary with frames, ticks, chunks, workers, seconds, frames_per_sec, bytes
+    """
+    started = time.perf_counter()
+    replay = Replay(replay_path)
+    codes = bytes(encode_inputs(inputs) for inputs in replay.inputs_per_tick())
+    replay.close()
+    chunks, frames = plan_chunks(codes, start, stop, rate, chunk_frames)
+
+    if fmt == "png":
+        os.makedirs(output, exist_ok=True)
+    tasks = []
+    for index, chunk in enumerate(chunks):
+        chunk["codes"] = codes[chunk.pop("codes_from"):chunk.pop("codes_to")]
+        target = output if fmt == "png" else f"{output}.part{index:04d}"
+        tasks.append((index, chunk, fmt, target, size, rate))
+
+    workers = os.cpu_count() if workers is None else workers
+    pool = multiprocessing.Pool(workers) if workers else None
+    try:
+        # imap hands back results in chunk order, so each GIF part is appended
+        # as soon as it and every part before it are done
+        results = pool.imap(render_chunk, tasks) if pool else map(render_chunk, tasks)
+        if fmt == "gif":
+            with open(output, "wb") as file:
+                file.write(gif_header(*size))
+                for index, chunk_delays, _ in results:
+                    part = tasks[index][3]
+                    with open(part, "rb") as part_file:
+                        shutil.copyfileobj(part_file, file)
+                    os.remove(part)
+                file.write(b"\x3b")
+            written = os.path.getsize(output)
+        else:
+            delays = array("H")
+            for index, chunk_delays, _ in results:
+                delays.frombytes(chunk_delays)
+            with open(os.path.join(output, CONCAT_NAME), "w") as file:
+                file.write("ffconcat version 1.0\n")
+                for number, delay in enumerate(delays):
+                    file.write(f"file {FRAME_NAME.format(number)}\nduration {delay / 100:.2f}\n")
+            written = sum(os.path.getsize(os.path.join(output, FRAME_NAME.format(number)))
+                          for number in range(frames))
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+
+    seconds = time.perf_counter() - started
+    ticks = (len(codes) if stop is None else min(stop, len(codes))) - start
+    return {"frames": frames, "ticks": ticks, "chunks": len(chunks), "workers": workers,
+            "seconds": seconds, "frames_per_sec": frames / seconds, "bytes": written}
+
+
+# =============================================================================
+# COMMAND LINE
+# =============================================================================
+
+def _parse_size(text):
+    width, _, height = text.partition("x")
+    return int(width), int(height)
+
+
+def main(argv=None):
+    """
+    Command line entry point
+    """
+    parser = argparse.ArgumentParser(description="Export a replay as an animated GIF or PNG frames")
+    parser.add_argument("replay", help="replay file from main.py --record")
+    parser.add_argument("output", help="GIF file, or directory with --png")
+    parser.add_argument("--png", action="store_true", help="write numbered PNG frames")
+    parser.add_argument("--size", type=_parse_size, default=EXPORT_SIZE, metavar="WxH")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="render processes (0 = render in this process)")
+    parser.add_argument("--start", type=int, default=0, help="first tick to export")
+    parser.add_argument("--stop", type=int, help="tick to stop at")
+    parser.add_argument("--fps", type=int, default=FRAME_RATE, help="most frames per second")
+    parser.add_argument("--chunk-frames", type=int, default=CHUNK_FRAMES)
+    args = parser.parse_args(argv)
+
+    report = export(args.replay, args.output, "png" if args.png else "gif", args.size, args.workers,
+                    args.start, args.stop, args.fps, args.chunk_frames)
+    print(f"{args.output}: {report['frames']} frames from {report['ticks']} ticks, "
+          f"{report['bytes']:,} bytes")
+    print(f"{report['chunks']} chunks on {report['workers']} workers in {report['seconds']:.2f}s "
+          f"-> {report['frames_per_sec']:,.0f} frames/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())